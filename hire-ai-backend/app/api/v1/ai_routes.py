@@ -3,8 +3,9 @@ from fastapi import APIRouter, Depends
 
 # Also export the AI endpoint from profile router
 from app.schemas.candidate_profile import PromptRequest, PromptResponse
-from app.services.ask_ai import ask_ai
+from app.services.ask_ai import ask_ai, stream_ask_ai
 from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
 from app.api.v1.deps import require_role
 
 # Create a combined router
@@ -33,3 +34,11 @@ def ask_ai_route(prompt: PromptRequest,user = Depends(require_role("admin","recr
         )
 
 
+@router.post("/ask_ai/stream")
+async def ask_ai_stream_route(prompt: PromptRequest,user = Depends(require_role("admin","recruiter"))):
+    """Same as /ask_ai, streamed to the client as Server-Sent Events"""
+    return StreamingResponse(
+        stream_ask_ai(prompt),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
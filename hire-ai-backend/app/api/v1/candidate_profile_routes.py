@@ -1,4 +1,5 @@
 from typing import List
+import time
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
@@ -18,6 +19,8 @@ from app.schemas.candidate_profile import (
     CandidateProfileUpdate,
     CandidateProfileResponse,
     CandidateProfileDetailResponse,
+    CandidateSkillSearchResponse,
+    CandidateSearchResponse,
     SearchRequest,
     SearchResult,
     UploadRequest
@@ -27,6 +30,8 @@ from app.db.models.user_role import UserRole
 from app.db.models.candidate_status import CandidateStatus
 from app.services.ask_ai import ask_ai
 from app.services import source_candidate
+from app.services.skill_index import skill_index
+from app.services.candidate_search import candidate_search_index
 from app.core.config import AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION, S3_BUCKET_NAME
 
 
@@ -63,7 +68,7 @@ async def get_profiles(request: SearchRequest):
         )
         if not results:
             return []
-        return source_candidate.parse_people_from_search(results)
+        return await source_candidate.aparse_people_from_search(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -89,12 +94,115 @@ async def get_profiles_from_job(
         if not results:
             return []
 
-        return source_candidate.parse_people_from_search(results)
+        return await source_candidate.aparse_people_from_search(results)
 
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search/skills", response_model=CandidateSkillSearchResponse)
+def search_candidates_by_skill(
+    all_of: List[str] = Query([], description="Candidate must have every skill"),
+    any_of: List[str] = Query([], description="Candidate must have at least one skill"),
+    none_of: List[str] = Query([], description="Candidate must have none of these skills"),
+    statuses: List[CandidateStatus] = Query([]),
+    recruiter_id: str | None = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    facet_limit: int = Query(20, ge=0, le=200),
+    db: Session = Depends(get_db),
+    user = Depends(require_role("admin", "recruiter")),
+):
+    """
+    Filter candidates by normalised skill (k8s, Kubernetes and kubectl are
+    the same skill). Each parameter may repeat or hold a comma-separated
+    list. Facets count every skill across the full result set.
+    Recruiters only search their own candidates.
+    """
+    if user.role == UserRole.RECRUITER:
+        if recruiter_id is not None and recruiter_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only access your own candidates",
+            )
+        recruiter_id = user.id
+
+    found = skill_index.search(
+        db,
+        all_of=all_of,
+        any_of=any_of,
+        none_of=none_of,
+        recruiter_id=recruiter_id,
+        statuses=statuses,
+        skip=(page - 1) * page_size,
+        limit=page_size,
+        facet_limit=facet_limit,
+    )
+    return {
+        "total": found["total"],
+        "page": page,
+        "page_size": page_size,
+        "query": found["query"],
+        "facets": found["facets"],
+        "items": CandidateProfileCRUD.get_profiles_by_ids(db, found["ids"]),
+    }
+
+
+@router.get("/search/text", response_model=CandidateSearchResponse)
+def search_candidates_by_text(
+    q: str = Query(..., min_length=1, max_length=500, description='Words and "phrases"; prefix* and -exclude supported'),
+    location: str | None = Query(None),
+    statuses: List[CandidateStatus] = Query([]),
+    min_years: float | None = Query(None, ge=0),
+    max_years: float | None = Query(None, ge=0),
+    recruiter_id: str | None = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user = Depends(require_role("admin", "recruiter")),
+):
+    """
+    Keyword search over candidate title, summary, work experience and
+    certifications, ranked by BM25 with a highlighted snippet per hit.
+    Recruiters only search their own candidates.
+    """
+    if user.role == UserRole.RECRUITER:
+        if recruiter_id is not None and recruiter_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only access your own candidates",
+            )
+        recruiter_id = user.id
+
+    started = time.perf_counter()
+    found = candidate_search_index.search(
+        db,
+        q,
+        recruiter_id=recruiter_id,
+        location=location,
+        statuses=statuses,
+        min_years=min_years,
+        max_years=max_years,
+        skip=(page - 1) * page_size,
+        limit=page_size,
+    )
+    took_ms = (time.perf_counter() - started) * 1000
+
+    profiles = CandidateProfileCRUD.get_profiles_by_ids(db, [hit["candidate_id"] for hit in found["hits"]])
+    by_id = {profile.id: profile for profile in profiles}
+    return {
+        "total": found["total"],
+        "page": page,
+        "page_size": page_size,
+        "took_ms": round(took_ms, 2),
+        "items": [
+            {"profile": by_id[hit["candidate_id"]], "score": hit["score"], "snippet": hit["snippet"]}
+            for hit in found["hits"]
+            if hit["candidate_id"] in by_id
+        ],
+    }
     
 
 @router.post("", response_model=CandidateCreateResponse, status_code=status.HTTP_201_CREATED)
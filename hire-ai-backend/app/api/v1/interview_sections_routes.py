@@ -1,4 +1,5 @@
 
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 import uuid
@@ -26,11 +27,12 @@ from app.schemas.interview import (
 )
 
 from app.services.ai_interview import (
-    generate_section_questions,
-    generate_follow_up_question,
-    evaluate_section_answers,
+    agenerate_section_questions,
+    agenerate_follow_up_question,
+    aevaluate_section_answers,
     validate_interview_time,
 )
+from app.services.single_flight import SingleFlight
 
 from botocore.config import Config
 import boto3
@@ -40,6 +42,8 @@ from app.core.config import (
     AWS_SECRET_ACCESS_KEY,
     AWS_REGION,
     S3_BUCKET_NAME,
+    QUESTION_CLAIM_SECONDS,
+    QUESTION_POLL_SECONDS,
 )
 
 router = APIRouter(
@@ -56,18 +60,44 @@ s3_client = boto3.client(
     config=Config(signature_version="s3v4"),
 )
 
+question_generation = SingleFlight()
+
 
 
     
 
 @router.get("/{section_id}/questions")
-def get_section_questions(
+async def get_section_questions(
     interview_id: str,
     section_id: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     user=Depends(require_role("admin", "candidate")),
 ):
+    # Sync SQLAlchemy: every DB step runs in a worker thread, not on the event loop
+    stored, prompt = await asyncio.to_thread(
+        _prepare_section_questions, db, interview_id, section_id, current_user, user
+    )
+    if stored:
+        return stored
+
+    # Concurrent requests for the same section share one generation:
+    # in-process via single-flight, across workers via a claim on the row.
+    return await question_generation.do(
+        section_id,
+        _generate_questions,
+        db,
+        section_id,
+        prompt,
+    )
+
+
+def _prepare_section_questions(db: Session, interview_id: str, section_id: str, current_user, user) -> tuple:
+    """
+    DB part of get_section_questions: (stored questions, None), or
+    (None, prompt values) when they still have to be generated. Plain
+    values only; later commits expire ORM objects.
+    """
     interview = InterviewCRUD.get_interview_by_id(db, interview_id)
     if not interview:
         raise HTTPException(404, "Interview not found")
@@ -89,29 +119,71 @@ def get_section_questions(
         InterviewCRUD.update_status(db, interview, InterviewStatus.ONGOING)
 
     if section.questions:
-        return {"type": section.type, "questions": section.questions}
+        return {"type": section.type, "questions": section.questions}, None
 
     job = JobDescriptionCRUD.get_job_by_id(db, interview.job_id)
 
     if not job:
         raise HTTPException(404, "Job not found")
 
-    result = generate_section_questions(
-        job_title=interview.job_title,
-        job_level=job.level, 
-        skills=job.skills, 
-        section_type=section.type,
-        no_of_questions=section.no_of_questions,
-        custom_questions=section.custom_questions,
+    return None, {"job_title": interview.job_title, "job_level": job.level, "skills": job.skills}
+
+
+def _claim_section(db: Session, section_id: str) -> dict:
+    """
+    Read the section under a short row lock and, if it has no questions
+    and no live claim, claim their generation for this request. The
+    commit releases the lock; nothing stays locked during generation.
+    """
+    section = SectionCRUD.get_for_update(db, section_id)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    claimed_at = section.questions_claimed_at
+    claimed = not section.questions and (
+        claimed_at is None or now - claimed_at > timedelta(seconds=QUESTION_CLAIM_SECONDS)
     )
+    if claimed:
+        section.questions_claimed_at = now
+
+    fields = {
+        "type": section.type,
+        "questions": section.questions,
+        "no_of_questions": section.no_of_questions,
+        "custom_questions": section.custom_questions,
+        "claimed": claimed,
+    }
+    db.commit()
+    return fields
+
+
+async def _generate_questions(db: Session, section_id: str, prompt: dict) -> dict:
+    # Requests that lose the claim wait for the stored questions; a claim
+    # older than QUESTION_CLAIM_SECONDS (crashed worker) is taken over.
+    while True:
+        section = await asyncio.to_thread(_claim_section, db, section_id)
+        if section["questions"]:
+            return {"type": section["type"], "questions": section["questions"]}
+        if section["claimed"]:
+            break
+        await asyncio.sleep(QUESTION_POLL_SECONDS)
 
-    SectionCRUD.update_questions(db, section=section, questions=result["questions"])
+    try:
+        result = await agenerate_section_questions(
+            **prompt,
+            section_type=section["type"],
+            no_of_questions=section["no_of_questions"],
+            custom_questions=section["custom_questions"],
+        )
+    except BaseException:
+        # Failed or cancelled: let a waiting request take over right away
+        await asyncio.to_thread(SectionCRUD.release_question_claim, db, section_id)
+        raise
 
-    return result
+    stored = await asyncio.to_thread(SectionCRUD.save_questions_if_empty, db, section_id, result["questions"])
+    return {"type": stored.type, "questions": stored.questions}
 
 
 @router.post("/{section_id}/follow-up")
-def generate_section_follow_up(
+async def generate_section_follow_up(
     interview_id: str,
     section_id: str,
     payload: FollowUpRequest,
@@ -119,26 +191,12 @@ def generate_section_follow_up(
     current_user: User = Depends(get_current_user),
     user=Depends(require_role("admin", "candidate")),
 ):
-    interview = InterviewCRUD.get_interview_by_id(db, interview_id)
-    if not interview:
-        raise HTTPException(404, "Interview not found")
-
-    section = SectionCRUD.get(db, section_id)
-    if not section or section.interview_id != interview_id:
-        raise HTTPException(404, "Section not found")
+    context = await asyncio.to_thread(_load_section_context, db, interview_id, section_id, True)
 
-    if not section.is_follow_up:
-        raise HTTPException(400, "Follow-up disabled for this section")
-    
-    job = JobDescriptionCRUD.get_job_by_id(db, interview.job_id)
-
-    if not job:
-        raise HTTPException(404, "Job not found")
-
-    follow_up = generate_follow_up_question(
-        job_title=interview.job_title,
-        job_level=job.level,
-        skills=job.skills,
+    follow_up = await agenerate_follow_up_question(
+        job_title=context["job_title"],
+        job_level=context["job_level"],
+        skills=context["skills"],
         question=payload.question,
         answer=payload.answer,
     )
@@ -147,35 +205,58 @@ def generate_section_follow_up(
 
 
 @router.post("/{section_id}/evaluate")
-def evaluate_section(
+async def evaluate_section(
     interview_id: str,
     section_id: str,
     payload: SectionAnswerRequest,
     db: Session = Depends(get_db),
     user=Depends(require_role("admin", "candidate", "recruiter")),
 ):
+    context = await asyncio.to_thread(_load_section_context, db, interview_id, section_id, False)
+
+    qa_data = [qa.model_dump() for qa in payload.qa]
+
+    result = await aevaluate_section_answers(
+        job_title=context["job_title"],
+        job_level=context["job_level"],
+        skills=context["skills"],
+        section_type=context["section_type"],
+        qa=qa_data,
+    )
+
+    await asyncio.to_thread(_save_section_evaluation, db, section_id, qa_data, result)
+
+    return result
+
+
+def _load_section_context(db: Session, interview_id: str, section_id: str, for_follow_up: bool) -> dict:
+    """Interview, section and job lookups (404s included) as plain prompt values."""
     interview = InterviewCRUD.get_interview_by_id(db, interview_id)
     if not interview:
         raise HTTPException(404, "Interview not found")
 
     section = SectionCRUD.get(db, section_id)
-    if not section:
+    if not section or (for_follow_up and section.interview_id != interview_id):
         raise HTTPException(404, "Section not found")
-    
+
+    if for_follow_up and not section.is_follow_up:
+        raise HTTPException(400, "Follow-up disabled for this section")
+
     job = JobDescriptionCRUD.get_job_by_id(db, interview.job_id)
 
     if not job:
         raise HTTPException(404, "Job not found")
 
-    qa_data = [qa.model_dump() for qa in payload.qa]
+    return {
+        "job_title": interview.job_title,
+        "job_level": job.level,
+        "skills": job.skills,
+        "section_type": section.type,
+    }
 
-    result = evaluate_section_answers(
-        job_title=interview.job_title,
-        job_level=job.level,
-        skills=job.skills,
-        section_type=section.type,
-        qa=qa_data,
-    )
+
+def _save_section_evaluation(db: Session, section_id: str, qa_data: list, result: dict) -> None:
+    section = SectionCRUD.get(db, section_id)
 
     SectionCRUD.save_answers(db, section=section, qa=qa_data)
 
@@ -186,8 +267,6 @@ def evaluate_section(
         summary=result,
     )
 
-    return result
-
 
 # ── Recording: Get all interview recordings for a section ─────────────────────
 
@@ -1,11 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+import json
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.api.v1.deps import get_current_user, require_role
-from app.db.base import get_db
-from app.db.crud import JobDescriptionCRUD
+from app.db.base import get_db, SessionLocal
+from app.db.crud import JobDescriptionCRUD, CandidateProfileCRUD
 from app.db.models import User
+from app.db.models.candidate_status import CandidateStatus
 from app.schemas.job import JobDescriptionCreate, JobDescriptionUpdate, JobDescriptionResponse
 from app.services.job_generator import job_generator
+from app.services.match_store import MatchRecorder, rescore_stale_matches
+from app.services.candidate_ranking import rank_candidates_stream
+from app.services.llm.json_stream import TopLevelJSONStream
 
 router = APIRouter(
     prefix="/jobs",
@@ -15,16 +23,17 @@ router = APIRouter(
 
 
 @router.post("", response_model=JobDescriptionResponse, status_code=status.HTTP_201_CREATED)
-def create_job(
+async def create_job(
     job_data: JobDescriptionCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
     user = Depends(require_role("admin","recruiter")),
 ):
     """Create a new job description."""
-    content = job_generator.generate_job_description(job_data)
+    content = await job_generator.agenerate_job_description(job_data)
     try:
-        db_job = JobDescriptionCRUD.create_job(db, job_data,content,current_user.id)
+        # Sync SQLAlchemy write; keep it off the event loop
+        db_job = await asyncio.to_thread(JobDescriptionCRUD.create_job, db, job_data, content, current_user.id)
         return db_job
     except Exception as e:
         raise HTTPException(
@@ -33,6 +42,60 @@ def create_job(
         )
 
 
+@router.post("/stream")
+async def create_job_stream(
+    job_data: JobDescriptionCreate,
+    current_user: User = Depends(get_current_user),
+    user = Depends(require_role("admin","recruiter")),
+):
+    """
+    Create a job description, streaming it as Server-Sent Events.
+    Emits a `section` event per completed top-level section, then a `job`
+    event with the persisted record (or an `error` event).
+    """
+    user_id = current_user.id
+
+    def save_job(content: dict) -> dict:
+        db = SessionLocal()
+        try:
+            db_job = JobDescriptionCRUD.create_job(db, job_data, content, user_id)
+            return JobDescriptionResponse.model_validate(db_job).model_dump(mode="json")
+        finally:
+            db.close()
+
+    async def events():
+        stream = TopLevelJSONStream()
+        try:
+            async for key, value in job_generator.stream_job_description(job_data, stream):
+                yield f"event: section\ndata: {json.dumps({'key': key, 'value': value})}\n\n"
+        except HTTPException as exc:
+            yield f"event: error\ndata: {json.dumps({'status_code': exc.status_code, 'detail': exc.detail})}\n\n"
+            return
+        except Exception as exc:
+            yield f"event: error\ndata: {json.dumps({'status_code': 500, 'detail': f'Streaming failed: {exc}'})}\n\n"
+            return
+
+        content = stream.result()
+        if not content:
+            yield f"event: error\ndata: {json.dumps({'status_code': 500, 'detail': 'LLM returned invalid JSON'})}\n\n"
+            return
+
+        try:
+            # Blocking DB write; keep it off the event loop
+            job = await asyncio.to_thread(save_job, content)
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'status_code': 422, 'detail': f'Failed to create job: {str(e)}'})}\n\n"
+            return
+
+        yield f"event: job\ndata: {json.dumps(job)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # @router.post("/generate", response_model=JobDescriptionResponse)
 # def generate_job(
 #     payload: JobDescriptionCreate,
@@ -104,6 +167,7 @@ def get_job_by_user(
 def update_and_regenerate_job(
     job_id: str,
     job_data: JobDescriptionUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user = Depends(require_role("admin","recruiter")),
 ):
@@ -147,11 +211,60 @@ def update_and_regenerate_job(
         job_data=base_payload,
     )
 
+    # 5️⃣ Stored resume matches now belong to an old JD revision; re-score them
+    background_tasks.add_task(rescore_stale_matches, job_id)
+
     return updated_job
 
 
 
 
+@router.post("/{job_id}/rank-candidates")
+def rank_candidates(
+    job_id: str,
+    top_k: Optional[int] = Query(None, ge=1),
+    min_prescore: Optional[float] = Query(None, ge=0, le=100),
+    statuses: Optional[List[CandidateStatus]] = Query(None),
+    limit: int = Query(500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+    user = Depends(require_role("admin","recruiter")),
+):
+    """
+    Rank stored candidate profiles against a job without re-uploading resumes.
+    Streams NDJSON: a line per candidate as it is scored, then a `done`
+    line with the full ranking. Recruiters rank their own candidates,
+    admins the whole pool. top_k / min_prescore limit LLM scoring to the
+    local prescorer's shortlist.
+    """
+    job = JobDescriptionCRUD.get_job_by_id(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found",
+        )
+
+    profiles = CandidateProfileCRUD.get_profiles_for_ranking(
+        db,
+        recruiter_id=None if user.role == "admin" else user.id,
+        statuses=statuses,
+        limit=limit,
+    )
+    job_dict = JobDescriptionCRUD.jd_to_dict(job)
+
+    return StreamingResponse(
+        rank_candidates_stream(
+            profiles,
+            job_dict,
+            {"user_id": user.id, "job": job.job_title},
+            top_k=top_k,
+            min_prescore=min_prescore,
+            recorder=MatchRecorder(job_id, job_dict),
+        ),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_job(
     job_id: str,
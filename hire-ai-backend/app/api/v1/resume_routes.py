@@ -1,24 +1,30 @@
+import asyncio
 import os
 import tempfile
-from typing import Dict, List
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status
-from fastapi.responses import FileResponse
+from typing import Dict, List, Optional
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, status, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from app.api.v1.deps import get_current_user, require_role
 
 from sqlalchemy.orm import Session
 
-from app.services.resume_parser import parse_resume
-from app.services.resume_matcher import match_resumes
+from app.services.resume_parser import aparse_resume
+from app.services.resume_matcher import amatch_resumes, amatch_sources, jd_revision
+from app.services.resume_bulk import open_archive, zip_sources, upload_sources, ndjson_match_stream
+from app.services.match_store import MatchRecorder, match_to_dict
 
 from app.db.base import get_db
 from app.db.crud.job_description import JobDescriptionCRUD
+from app.db.crud.resume_match import ResumeMatchCRUD, SORTABLE_COLUMNS
 
 from app.schemas.resume import TextRequest, ResumeDataRequest, GenerateRequest, ExportRequest
 
 from app.services.resume_reformat.docx_generator import generate_synpulse_docx
 from app.services.resume_reformat.pdf_generator import generate_synpulse_resume
 from app.services.resume_reformat.pptx_generator import generate_synpulse_pptx
-from app.services.resume_reformat.resume_assist import process_uploaded_file
+from app.services.resume_assist import is_supported, extraction_metrics
+from app.services.extraction_cache import extraction_cache
+from app.services.extraction_pool import extraction_pool
 from app.services.resume_reformat.resume_parser import extract_resume_data
 
 router = APIRouter(
@@ -34,13 +40,13 @@ router = APIRouter(
 @router.post(
     "/parse",status_code=status.HTTP_200_OK,
 )
-def parse_resume_post(
+async def parse_resume_post(
     file: UploadFile = File(...),
     current_user=Depends(get_current_user),
     user = Depends(require_role("admin","recruiter")),
 ):
     """
-    Parse a resume file (PDF, DOCX, PPTX) and return structured data.
+    Parse a resume file (PDF, DOC, DOCX, PPTX, TXT) and return structured data.
     Requires authentication.
     """
 
@@ -53,7 +59,7 @@ def parse_resume_post(
 
     try:
         # AI parsing (this must be awaited)
-        parsed_data = parse_resume(file)
+        parsed_data = await aparse_resume(file)
 
         if not parsed_data:
             raise HTTPException(
@@ -67,8 +73,13 @@ def parse_resume_post(
             "data": parsed_data,
         }
 
-    except HTTPException:
-        # Re-raise clean HTTP errors untouched
+    except HTTPException as exc:
+        # Upload / extraction limits keep their own status and message
+        if exc.status_code in (
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ):
+            raise
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to parse resume"
@@ -94,14 +105,19 @@ def parse_resume_post(
     "/match/{job_id}",
     status_code=status.HTTP_200_OK,
 )
-def match_resumes_post(
+async def match_resumes_post(
     job_id: str,
     resumes: List[UploadFile],
+    top_k: Optional[int] = Query(None, ge=1),
+    min_prescore: Optional[float] = Query(None, ge=0, le=100),
     db=Depends(get_db),
     current_user = Depends(require_role("admin","recruiter")),
 ):
     """
     Match multiple parsed resumes against a parsed job description.
+    With top_k / min_prescore, resumes are ranked locally first and only
+    the shortlist is scored by the LLM. LLM scores are stored per job and
+    reused for the same file until the JD changes (see /match/{job_id}/results).
     Requires authentication.
     """
     # ---- Basic validation ----
@@ -111,7 +127,7 @@ def match_resumes_post(
             detail="Job ID data is missing",
         )
     
-    job = JobDescriptionCRUD.get_job_by_id(db, job_id)
+    job = await asyncio.to_thread(JobDescriptionCRUD.get_job_by_id, db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -125,8 +141,13 @@ def match_resumes_post(
         )
     try:
         job_dict = JobDescriptionCRUD.jd_to_dict(job)
-        results = match_resumes(resumes, job_dict)
-        print("\nRESULTS=============\n", results)
+        results = await amatch_resumes(
+            resumes,
+            job_dict,
+            top_k=top_k,
+            min_prescore=min_prescore,
+            recorder=MatchRecorder(job_id, job_dict),
+        )
         if not results:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -156,16 +177,116 @@ def match_resumes_post(
         )
 
 
+@router.post("/match/{job_id}/stream")
+async def match_resumes_stream(
+    job_id: str,
+    archive: Optional[UploadFile] = File(None),
+    resumes: Optional[List[UploadFile]] = File(None),
+    db=Depends(get_db),
+    current_user = Depends(require_role("admin","recruiter")),
+):
+    """
+    Bulk variant of /match/{job_id}: a ZIP of resumes and/or a list of files,
+    answered as NDJSON with one line per resume as soon as it is scored.
+    ZIP members are only decompressed when a matching slot frees up.
+    """
+    job = await asyncio.to_thread(JobDescriptionCRUD.get_job_by_id, db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Job data is missing, Invalid or not found",
+        )
+    if archive is None and not resumes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload a ZIP archive or a list of resumes",
+        )
+
+    job_dict = JobDescriptionCRUD.jd_to_dict(job)
+    zip_file = open_archive(archive.file) if archive is not None else None
+    sources = (zip_sources(zip_file) if zip_file else []) + upload_sources(resumes or [])
+
+    async def lines():
+        try:
+            results = amatch_sources(sources, job_dict, recorder=MatchRecorder(job_id, job_dict))
+            async for line in ndjson_match_stream(
+                results,
+                len(sources),
+                {"user_id": current_user.id, "job": job.job_title},
+            ):
+                yield line
+        finally:
+            if zip_file is not None:
+                zip_file.close()
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/match/{job_id}/results")
+def list_match_results(
+    job_id: str,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    sort: str = Query("overall_match"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    include_stale: bool = Query(False),
+    db: Session = Depends(get_db),
+    user = Depends(require_role("admin","recruiter")),
+):
+    """
+    Stored match results for a job, ranked. By default only results scored
+    against the current JD are listed; include_stale adds older ones
+    (flagged "stale") while they are being re-scored.
+    """
+    job = JobDescriptionCRUD.get_job_by_id(db, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with ID {job_id} not found",
+        )
+    if sort not in SORTABLE_COLUMNS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"sort must be one of: {', '.join(SORTABLE_COLUMNS)}",
+        )
+
+    revision = jd_revision(JobDescriptionCRUD.jd_to_dict(job))
+    rows, total = ResumeMatchCRUD.list_ranked(
+        db,
+        job_id,
+        jd_revision=None if include_stale else revision,
+        sort=sort,
+        descending=order == "desc",
+        min_score=min_score,
+        skip=(page - 1) * page_size,
+        limit=page_size,
+    )
+
+    return {
+        "job_id": job_id,
+        "job": job.job_title,
+        "jd_revision": revision,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "stale": ResumeMatchCRUD.count_stale(db, job_id, revision),
+        "matches": [match_to_dict(row, revision) for row in rows],
+    }
+
+
 
 
 
 # Configure upload folder
 UPLOAD_FOLDER = tempfile.gettempdir()
-ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'ppt', 'pptx'}
-MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max
 
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return is_supported(filename)
 
 
 
@@ -176,7 +297,7 @@ async def parse_resume_final(
 ):
     if not allowed_file(file.filename):
         raise HTTPException(400, "Invalid file type")
-    text = process_uploaded_file(file)
+    text = await extraction_pool.extract_upload(file)
     try:
         resume_data = extract_resume_data(text)
         return {
@@ -229,3 +350,14 @@ async def export_resume_final(
         )
 
     return FileResponse(path, media_type=media, filename=name)
+
+
+@router.get("/extraction/stats")
+async def extraction_stats(
+    user = Depends(require_role("admin")),
+):
+    """Text extraction cache and per-format counters for this worker."""
+    return {
+        "cache": extraction_cache.stats(),
+        "formats": extraction_metrics.snapshot(),
+    }
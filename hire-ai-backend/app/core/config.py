@@ -7,6 +7,50 @@ load_dotenv()
 # AI 
 GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")   
 
+# LLM response cache (set LLM_CACHE_DB_PATH to share it across workers)
+LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+LLM_CACHE_DB_PATH: str = os.getenv("LLM_CACHE_DB_PATH", "")
+
+# Groq rate-limit budgets per model (set LLM_RATE_LIMIT_STATE_PATH to share across workers)
+LLM_RATE_LIMIT_RPM: int = int(os.getenv("LLM_RATE_LIMIT_RPM", "1000"))
+LLM_RATE_LIMIT_TPM: int = int(os.getenv("LLM_RATE_LIMIT_TPM", "250000"))
+LLM_RATE_LIMIT_STATE_PATH: str = os.getenv("LLM_RATE_LIMIT_STATE_PATH", "")
+
+# Max resumes scored concurrently per match request
+RESUME_MATCH_CONCURRENCY: int = int(os.getenv("RESUME_MATCH_CONCURRENCY", "8"))
+
+# Document text extraction worker processes (0 = run in a thread instead)
+EXTRACTION_WORKERS: int = int(os.getenv("EXTRACTION_WORKERS", str(os.cpu_count() or 1)))
+EXTRACTION_TIMEOUT: float = float(os.getenv("EXTRACTION_TIMEOUT", "30"))
+EXTRACTION_MAX_TASKS_PER_CHILD: int = int(os.getenv("EXTRACTION_MAX_TASKS_PER_CHILD", "200"))
+EXTRACTION_WORKER_MEMORY_MB: int = int(os.getenv("EXTRACTION_WORKER_MEMORY_MB", "1024"))
+
+# Extracted-text cache keyed by file SHA-256 (set EXTRACTION_CACHE_DB_PATH to share across workers)
+EXTRACTION_CACHE_MAX_ENTRIES: int = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "512"))
+EXTRACTION_CACHE_DB_PATH: str = os.getenv("EXTRACTION_CACHE_DB_PATH", "")
+
+# Resume upload limits: per file, per request (several files), pages and extracted characters
+RESUME_MAX_UPLOAD_BYTES: int = int(os.getenv("RESUME_MAX_UPLOAD_BYTES", str(16 * 1024 * 1024)))
+RESUME_MAX_REQUEST_BYTES: int = int(os.getenv("RESUME_MAX_REQUEST_BYTES", str(200 * 1024 * 1024)))
+RESUME_MAX_PAGES: int = int(os.getenv("RESUME_MAX_PAGES", "30"))
+RESUME_MAX_CHARS: int = int(os.getenv("RESUME_MAX_CHARS", "100000"))
+RESUME_BULK_MAX_FILES: int = int(os.getenv("RESUME_BULK_MAX_FILES", "1000"))
+
+# Prompt token budgets for resume text (longer resumes are parsed section-wise in chunks)
+RESUME_PARSE_TOKEN_BUDGET: int = int(os.getenv("RESUME_PARSE_TOKEN_BUDGET", "3000"))
+RESUME_PARSE_CHUNK_TOKENS: int = int(os.getenv("RESUME_PARSE_CHUNK_TOKENS", "2000"))
+RESUME_MATCH_TOKEN_BUDGET: int = int(os.getenv("RESUME_MATCH_TOKEN_BUDGET", "3000"))
+
+# In-process candidate skill index: how often to check the DB for writes made by other workers
+SKILL_INDEX_REFRESH_SECONDS: float = float(os.getenv("SKILL_INDEX_REFRESH_SECONDS", "5"))
+
+# Full-text candidate search index, SQLite FTS5 (set CANDIDATE_SEARCH_DB_PATH when running several workers)
+CANDIDATE_SEARCH_DB_PATH: str = os.getenv("CANDIDATE_SEARCH_DB_PATH", "")
+
+# AI interview questions: how long one request's claim on generating a section lasts, and how often other requests poll for the result
+QUESTION_CLAIM_SECONDS: float = float(os.getenv("QUESTION_CLAIM_SECONDS", "90"))
+QUESTION_POLL_SECONDS: float = float(os.getenv("QUESTION_POLL_SECONDS", "0.5"))
+
 # Database
 DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
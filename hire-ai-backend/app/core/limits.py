@@ -0,0 +1,50 @@
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject request bodies over `max_bytes` on the given path prefixes.
+
+    A declared Content-Length over the limit gets a 413 before anything is
+    read; chunked or under-declared bodies are counted as they stream in and
+    cut off with a 413 as soon as they pass the limit.
+    """
+
+    def __init__(self, app, max_bytes: int, path_prefixes: tuple[str, ...] = ("/",)):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefixes = path_prefixes
+
+    def _detail(self) -> str:
+        return f"Request body exceeds the {self.max_bytes / (1024 * 1024):g} MB limit"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            response = JSONResponse(
+                {"detail": self._detail()},
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=self._detail(),
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,22 @@
+"""
+Rebuild the candidate_skills rows from the free-text skills of every
+candidate profile. Run once after the candidate_skills migration and again
+whenever the skill taxonomy changes; unchanged profiles are left alone.
+
+    python -m app.db.backfill_candidate_skills
+"""
+from app.db.base import SessionLocal
+from app.db.crud import CandidateSkillCRUD
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        changed = CandidateSkillCRUD.resync_all(db)
+    finally:
+        db.close()
+    print(f"Candidate skills updated for {changed} profile(s)")
+
+
+if __name__ == "__main__":
+    main()
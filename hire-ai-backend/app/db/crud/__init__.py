@@ -5,6 +5,8 @@ from app.db.crud.education import EducationCRUD
 from app.db.crud.work_experience import WorkExperienceCRUD
 from app.db.crud.certification import CertificationCRUD
 from app.db.crud.recruiter_profile import RecruiterProfileCRUD
+from app.db.crud.resume_match import ResumeMatchCRUD
+from app.db.crud.candidate_skill import CandidateSkillCRUD
 
 __all__ = [
     "UserCRUD",
@@ -14,4 +16,6 @@ __all__ = [
     "WorkExperienceCRUD",
     "CertificationCRUD",
     "RecruiterProfileCRUD",
+    "ResumeMatchCRUD",
+    "CandidateSkillCRUD",
 ]
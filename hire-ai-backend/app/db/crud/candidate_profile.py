@@ -1,7 +1,8 @@
 from typing import Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.db.models.candidate_profile import CandidateProfile
+from app.db.crud.candidate_skill import CandidateSkillCRUD
 
 from sqlalchemy import func
 from app.db.models.candidate_status import CandidateStatus
@@ -22,6 +23,7 @@ class CandidateProfileCRUD:
             recruiter_id=recruiter_id,
             **profile_data,
         )
+        CandidateSkillCRUD.sync_profile_skills(db_profile)
         db.add(db_profile)
         db.commit()
         db.refresh(db_profile)
@@ -95,6 +97,39 @@ class CandidateProfileCRUD:
         )
 
 
+    @staticmethod
+    def get_profiles_for_ranking(
+        db: Session,
+        recruiter_id: Optional[str] = None,
+        statuses: Optional[list[CandidateStatus]] = None,
+        limit: int = 500,
+    ) -> list[CandidateProfile]:
+        """
+        Candidate pool with everything needed to rebuild resume text.
+        selectinload keeps it to one query per relationship (no row
+        multiplication across the three collections).
+        """
+        query = db.query(CandidateProfile).options(
+            selectinload(CandidateProfile.user),
+            selectinload(CandidateProfile.education_records),
+            selectinload(CandidateProfile.work_experiences),
+            selectinload(CandidateProfile.certifications),
+        )
+        if recruiter_id is not None:
+            query = query.filter(CandidateProfile.recruiter_id == recruiter_id)
+        if statuses:
+            query = query.filter(CandidateProfile.status.in_(statuses))
+        return query.order_by(CandidateProfile.updated_at.desc()).limit(limit).all()
+
+    @staticmethod
+    def get_profiles_by_ids(db: Session, profile_ids: list[str]) -> list[CandidateProfile]:
+        """Profiles for a page of search hits, in the order of profile_ids."""
+        if not profile_ids:
+            return []
+        rows = db.query(CandidateProfile).filter(CandidateProfile.id.in_(profile_ids)).all()
+        by_id = {row.id: row for row in rows}
+        return [by_id[profile_id] for profile_id in profile_ids if profile_id in by_id]
+
     @staticmethod
     def get_candidate_status_counts_by_recruiter(
         db: Session,
@@ -124,6 +159,8 @@ class CandidateProfileCRUD:
         for key, value in profile_data.items():
             if value is not None:
                 setattr(db_profile, key, value)
+        if profile_data.get("skills") is not None:
+            CandidateSkillCRUD.sync_profile_skills(db_profile)
 
         db.add(db_profile)
         db.commit()
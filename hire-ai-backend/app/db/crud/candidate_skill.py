@@ -0,0 +1,72 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+
+from app.db.models.candidate_profile import CandidateProfile
+from app.db.models.candidate_skill import CandidateSkill
+from app.services.skill_taxonomy import skill_taxonomy
+
+
+class CandidateSkillCRUD:
+    """CRUD operations for CandidateSkill model."""
+
+    @staticmethod
+    def sync_profile_skills(db_profile: CandidateProfile) -> None:
+        """
+        Bring the profile's skill rows in line with its skills text.
+        Only the difference is written; the caller commits.
+        """
+        wanted = set(skill_taxonomy.extract(db_profile.skills or "", whole_list=True))
+        current = {link.skill_id: link for link in db_profile.skill_links}
+
+        for skill_id, link in current.items():
+            if skill_id not in wanted:
+                db_profile.skill_links.remove(link)
+        for skill_id in wanted - current.keys():
+            db_profile.skill_links.append(CandidateSkill(skill_id=skill_id))
+
+    @staticmethod
+    def resync_all(db: Session, batch_size: int = 500) -> int:
+        """
+        Re-extract the skill rows of every profile, committing per batch.
+        Safe to re-run (after a taxonomy change, say); returns the number
+        of profiles whose rows changed.
+        """
+        changed, last_id = 0, ""
+        while True:
+            batch = (
+                db.query(CandidateProfile)
+                .options(selectinload(CandidateProfile.skill_links))
+                .filter(CandidateProfile.id > last_id)
+                .order_by(CandidateProfile.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                return changed
+            for db_profile in batch:
+                before = {link.skill_id for link in db_profile.skill_links}
+                CandidateSkillCRUD.sync_profile_skills(db_profile)
+                changed += before != {link.skill_id for link in db_profile.skill_links}
+            last_id = batch[-1].id
+            db.commit()
+
+    @staticmethod
+    def get_index_rows(db: Session) -> tuple[list, list]:
+        """
+        (id, recruiter_id, status) of every profile, newest first, and every
+        (candidate_profile_id, skill_id) pair; all the skill index needs.
+        """
+        profiles = (
+            db.query(CandidateProfile.id, CandidateProfile.recruiter_id, CandidateProfile.status)
+            .order_by(CandidateProfile.updated_at.desc(), CandidateProfile.id)
+            .all()
+        )
+        skills = db.query(CandidateSkill.candidate_profile_id, CandidateSkill.skill_id).all()
+        return profiles, skills
+
+    @staticmethod
+    def get_index_signature(db: Session) -> tuple:
+        """Cheap fingerprint that changes whenever profiles or their skills do."""
+        count, last_update = db.query(func.count(CandidateProfile.id), func.max(CandidateProfile.updated_at)).one()
+        links = db.query(func.count()).select_from(CandidateSkill).scalar()
+        return count, str(last_update), links
@@ -50,6 +50,25 @@ class SectionCRUD:
         )
 
 
+    # ------------------------------------------------
+    # GET BY ID (ROW LOCKED)
+    # ------------------------------------------------
+    @staticmethod
+    def get_for_update(
+        db: Session,
+        section_id: str
+    ) -> Optional[InterviewSectionConfig]:
+        """Lock the section row until the caller commits or rolls back."""
+
+        return (
+            db.query(InterviewSectionConfig)
+            .filter(InterviewSectionConfig.id == section_id)
+            .populate_existing()
+            .with_for_update()
+            .first()
+        )
+
+
     # ------------------------------------------------
     # GET ALL SECTIONS FOR INTERVIEW
     # ------------------------------------------------
@@ -87,6 +106,45 @@ class SectionCRUD:
         return section
 
 
+    # ------------------------------------------------
+    # SAVE QUESTIONS (FIRST WRITER WINS)
+    # ------------------------------------------------
+    @staticmethod
+    def save_questions_if_empty(
+        db: Session,
+        section_id: str,
+        questions: list[str]
+    ) -> InterviewSectionConfig:
+        """Store questions unless another request already did; returns the stored section."""
+
+        section = SectionCRUD.get_for_update(db, section_id)
+        if not section.questions:
+            section.questions = questions
+            section.status = "Ongoing"
+        section.questions_claimed_at = None
+
+        db.commit()
+        db.refresh(section)
+
+        return section
+
+
+    # ------------------------------------------------
+    # RELEASE QUESTION CLAIM
+    # ------------------------------------------------
+    @staticmethod
+    def release_question_claim(
+        db: Session,
+        section_id: str
+    ) -> None:
+        """Drop an unfinished generation claim so a waiting request can take over."""
+
+        section = SectionCRUD.get_for_update(db, section_id)
+        if section:
+            section.questions_claimed_at = None
+        db.commit()
+
+
     # ------------------------------------------------
     # SAVE ANSWERS
     # ------------------------------------------------
@@ -0,0 +1,95 @@
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.models.resume_match import ResumeMatch
+
+# Columns the ranking endpoint may sort by
+SORTABLE_COLUMNS = {
+    "overall_match": ResumeMatch.overall_match,
+    "created_at": ResumeMatch.created_at,
+    "updated_at": ResumeMatch.updated_at,
+    "candidate_name": ResumeMatch.candidate_name,
+}
+
+
+class ResumeMatchCRUD:
+    """CRUD operations for ResumeMatch model."""
+
+    @staticmethod
+    def get_match(db: Session, job_id: str, resume_sha256: str) -> Optional[ResumeMatch]:
+        """Latest stored match of this resume for this job, at any JD revision."""
+        return (
+            db.query(ResumeMatch)
+            .filter(ResumeMatch.job_id == job_id, ResumeMatch.resume_sha256 == resume_sha256)
+            .order_by(ResumeMatch.updated_at.desc())
+            .first()
+        )
+
+    @staticmethod
+    def save_match(db: Session, job_id: str, resume_sha256: str, jd_revision: str, values: dict) -> ResumeMatch:
+        """
+        Store a score for (job, resume). The row of an older JD revision is
+        moved to the new revision rather than duplicated.
+        """
+        db_match = ResumeMatchCRUD.get_match(db, job_id, resume_sha256)
+        if db_match is None:
+            db_match = ResumeMatch(job_id=job_id, resume_sha256=resume_sha256)
+            db.add(db_match)
+
+        db_match.jd_revision = jd_revision
+        for key, value in values.items():
+            setattr(db_match, key, value)
+
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent request stored the same resume at this revision first
+            db.rollback()
+            return ResumeMatchCRUD.get_match(db, job_id, resume_sha256)
+        db.refresh(db_match)
+        return db_match
+
+    @staticmethod
+    def list_ranked(
+        db: Session,
+        job_id: str,
+        jd_revision: Optional[str] = None,
+        sort: str = "overall_match",
+        descending: bool = True,
+        min_score: Optional[float] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> tuple[list[ResumeMatch], int]:
+        """One page of matches for a job plus the total; jd_revision=None includes stale rows."""
+        query = db.query(ResumeMatch).filter(ResumeMatch.job_id == job_id)
+        if jd_revision is not None:
+            query = query.filter(ResumeMatch.jd_revision == jd_revision)
+        if min_score is not None:
+            query = query.filter(ResumeMatch.overall_match >= min_score)
+
+        total = query.with_entities(func.count(ResumeMatch.id)).scalar() or 0
+
+        column = SORTABLE_COLUMNS[sort]
+        order = column.desc() if descending else column.asc()
+        rows = query.order_by(order, ResumeMatch.id).offset(skip).limit(limit).all()
+        return rows, total
+
+    @staticmethod
+    def get_stale(db: Session, job_id: str, jd_revision: str) -> list[ResumeMatch]:
+        """Matches scored against an older revision of the job description."""
+        return (
+            db.query(ResumeMatch)
+            .filter(ResumeMatch.job_id == job_id, ResumeMatch.jd_revision != jd_revision)
+            .all()
+        )
+
+    @staticmethod
+    def count_stale(db: Session, job_id: str, jd_revision: str) -> int:
+        return (
+            db.query(func.count(ResumeMatch.id))
+            .filter(ResumeMatch.job_id == job_id, ResumeMatch.jd_revision != jd_revision)
+            .scalar()
+            or 0
+        )
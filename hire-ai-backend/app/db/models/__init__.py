@@ -15,6 +15,8 @@ from app.db.models.interview_recording import InterviewRecording
 from app.db.models.otp import OTP
 from app.db.models.interview_section_config import InterviewSectionConfig
 from app.db.models.recruiter_profile import RecruiterProfile
+from app.db.models.resume_match import ResumeMatch
+from app.db.models.candidate_skill import CandidateSkill
 
 __all__ = [
     # Enums
@@ -33,4 +35,6 @@ __all__ = [
     "OTP",
     "InterviewSectionConfig",
     "RecruiterProfile",
+    "ResumeMatch",
+    "CandidateSkill",
 ]
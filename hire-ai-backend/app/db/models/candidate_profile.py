@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from app.db.models.education import Education
     from app.db.models.work_experience import WorkExperience
     from app.db.models.certification import Certification
+    from app.db.models.candidate_skill import CandidateSkill
 
 class CandidateProfile(Base):
     __tablename__ = "candidate_profiles"
@@ -149,6 +150,9 @@ class CandidateProfile(Base):
     certifications: Mapped[list["Certification"]] = relationship(
         "Certification", back_populates="candidate_profile", cascade="all, delete-orphan",
     )
+    skill_links: Mapped[list["CandidateSkill"]] = relationship(
+        "CandidateSkill", back_populates="candidate_profile", cascade="all, delete-orphan", passive_deletes=True,
+    )
 
 
     def __repr__(self) -> str:
@@ -0,0 +1,36 @@
+from sqlalchemy import String, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from app.db.models.candidate_profile import CandidateProfile
+
+
+class CandidateSkill(Base):
+    """
+    A canonical skill (skill_taxonomy id) held by a candidate, derived from
+    the free-text CandidateProfile.skills whenever the profile is saved.
+    """
+    __tablename__ = "candidate_skills"
+
+    candidate_profile_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("candidate_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    skill_id: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        index=True,
+    )
+
+    candidate_profile: Mapped["CandidateProfile"] = relationship(
+        "CandidateProfile",
+        back_populates="skill_links",
+    )
+
+    def __repr__(self) -> str:
+        return f"<CandidateSkill(candidate_profile_id={self.candidate_profile_id}, skill_id='{self.skill_id}')>"
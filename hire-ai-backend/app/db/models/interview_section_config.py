@@ -1,5 +1,6 @@
 import uuid
-from sqlalchemy import String, Integer, Boolean, ForeignKey, JSON
+from datetime import datetime
+from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 from typing import TYPE_CHECKING
@@ -42,6 +43,9 @@ class InterviewSectionConfig(Base):
 
     questions: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
 
+    # Set (UTC) while one request generates the questions; others wait for them
+    questions_claimed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
     qa: Mapped[list[dict] | None] = mapped_column(JSON, nullable=True)
 
     ai_score: Mapped[int | None] = mapped_column(nullable=True)
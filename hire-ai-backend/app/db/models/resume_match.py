@@ -0,0 +1,68 @@
+from datetime import datetime
+import uuid
+
+from sqlalchemy import String, Float, DateTime, ForeignKey, Text, JSON, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class ResumeMatch(Base):
+    """
+    One scored resume for one job. A resume is identified by the SHA-256 of
+    its file and the JD by a hash of its scoring fields (jd_revision), so
+    re-uploading the same file against an unchanged JD never re-scores.
+    """
+    __tablename__ = "resume_matches"
+
+    id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+
+    job_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("job_descriptions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    resume_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    jd_revision: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    candidate_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    candidate_email: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    # The (budgeted) text that was scored, kept so a JD change can re-score it
+    resume_text: Mapped[str] = mapped_column(Text, nullable=False)
+
+    overall_match: Mapped[float | None] = mapped_column(Float, nullable=True, index=True)
+
+    result: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint("job_id", "resume_sha256", "jd_revision"),
+        Index("ix_resume_matches_job_revision_match", "job_id", "jd_revision", "overall_match"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ResumeMatch(job_id={self.job_id}, resume_sha256='{self.resume_sha256[:12]}', overall_match={self.overall_match})>"
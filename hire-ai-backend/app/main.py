@@ -2,8 +2,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from app.core.config import APP_NAME, APP_VERSION
+from app.core.config import APP_NAME, APP_VERSION, RESUME_MAX_REQUEST_BYTES
+from app.core.limits import RequestSizeLimitMiddleware
 from app.db.base import create_tables
+from app.services.llm import close_clients
+from app.services.extraction_pool import extraction_pool
 
 from app.api.v1 import auth_routes, user_routes, jobs_routes, recruiters_routes, ai_routes, resume_routes, mfa_routes
 from app.api.v1 import candidate_profile_routes, candidate_education_routes, candidate_work_experience_routes, candidate_certification_routes
@@ -17,9 +20,12 @@ async def lifespan(app: FastAPI):
     print("Creating database tables...")
     create_tables()
     print("Database tables created successfully!")
+    await extraction_pool.start()
     yield
     # Shutdown
     print("Application shutting down...")
+    await close_clients()
+    extraction_pool.shutdown()
 
 
 app = FastAPI(
@@ -41,6 +47,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Resume uploads are capped while they stream in, before multipart parsing
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    max_bytes=RESUME_MAX_REQUEST_BYTES,
+    path_prefixes=("/api/v1/resume",),
+)
 
 # Include routers with API v1 prefix
 app.include_router(auth_routes.router, prefix="/api/v1")
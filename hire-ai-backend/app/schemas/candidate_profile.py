@@ -103,6 +103,37 @@ class CandidateProfileDetailResponse(CandidateProfileResponse):
     certifications: list[CertificationResponse] = []
 
 
+# Skill search schemas
+class SkillFacet(BaseModel):
+    skill_id: str
+    skill: str
+    count: int
+
+
+class CandidateSkillSearchResponse(BaseModel):
+    total: int
+    page: int
+    page_size: int
+    query: dict
+    facets: list[SkillFacet] = []
+    items: list[CandidateProfileResponse] = []
+
+
+# Full-text search schemas
+class CandidateSearchHit(BaseModel):
+    profile: CandidateProfileResponse
+    score: float
+    snippet: Optional[str] = None
+
+
+class CandidateSearchResponse(BaseModel):
+    total: int
+    page: int
+    page_size: int
+    took_ms: float
+    items: list[CandidateSearchHit] = []
+
+
 # Prompt schemas
 class PromptRequest(BaseModel):
     prompt: str
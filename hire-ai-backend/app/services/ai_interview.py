@@ -1,10 +1,9 @@
-import os
 import json
-import time
-import requests
 from typing import Dict, List
 from fastapi import HTTPException
 
+from app.services.llm import chat_completion, achat_completion
+
 from datetime import datetime, timedelta, timezone
 
 
@@ -12,9 +11,6 @@ from datetime import datetime, timedelta, timezone
 # CONFIG
 # ----------------------------------------------------
 
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
-
 MODEL = "llama-3.1-8b-instant"
 
 
@@ -22,14 +18,12 @@ MODEL = "llama-3.1-8b-instant"
 # LLM CALLER
 # ----------------------------------------------------
 
-def call_llm(prompt: str) -> Dict:
+def build_messages(prompt: str) -> List[Dict]:
 
-    payload = {
-        "model": MODEL,
-        "messages": [
-            {
-                "role": "system",
-                "content": """
+    return [
+        {
+            "role": "system",
+            "content": """
 You are a STRICT JSON API.
 
 Rules:
@@ -38,70 +32,72 @@ Rules:
 - No explanation
 - Follow schema exactly
 """
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
-        "temperature": 0.2,
-        "max_tokens": 1500
-    }
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
 
-    headers = {
-        "Authorization": f"Bearer {GROQ_API_KEY}",
-        "Content-Type": "application/json",
-    }
 
-    response = None
+LLM_OPTIONS = {
+    "model": MODEL,
+    "temperature": 0.2,
+    "max_tokens": 1500,
+    "timeout": 40,
+    "retries": 2,
+}
+
 
-    for attempt in range(3):
-        response = requests.post(
-            GROQ_URL,
-            headers=headers,
-            json=payload,
-            timeout=40
+def parse_llm_json(content: str) -> Dict:
+    try:
+        return json.loads(content)
+    except Exception:
+        raise HTTPException(
+            status_code=500,
+            detail="LLM returned invalid JSON"
         )
 
-        if response.status_code != 429:
-            break
 
-        time.sleep(2 ** attempt)
+def call_llm(prompt: str) -> Dict:
 
-    if response and response.status_code != 200:
+    try:
+        content = chat_completion(build_messages(prompt), **LLM_OPTIONS)
+    except HTTPException as exc:
         raise HTTPException(
             status_code=500,
-            detail=f"LLM error: {response.text}"
+            detail=f"LLM error: {exc.detail}"
         )
 
-    if response:
-        content = response.json()["choices"][0]["message"]["content"]
+    return parse_llm_json(content)
+
+
+async def acall_llm(prompt: str) -> Dict:
 
     try:
-        return json.loads(content)
-    except Exception:
+        content = await achat_completion(build_messages(prompt), **LLM_OPTIONS)
+    except HTTPException as exc:
         raise HTTPException(
             status_code=500,
-            detail="LLM returned invalid JSON"
+            detail=f"LLM error: {exc.detail}"
         )
 
+    return parse_llm_json(content)
+
 
 # ----------------------------------------------------
 # QUESTION GENERATION
 # ----------------------------------------------------
 
-def generate_section_questions(
+def build_section_questions_prompt(
     job_title: str,
     job_level: str,
     skills: str,
     section_type: str,
     no_of_questions: int,
-    custom_questions: List[str] | None = None
-) -> Dict:
-
-    custom_questions = custom_questions or []
+) -> str:
 
-    prompt = f"""
+    return f"""
 Generate professional interview questions.
 
 Job Title:
@@ -156,7 +152,17 @@ Return JSON:
 }}
 """
 
-    result = call_llm(prompt)
+
+
+def section_questions_result(
+    result: Dict,
+    section_type: str,
+    no_of_questions: int,
+    custom_questions: List[str] | None = None
+) -> Dict:
+
+    custom_questions = custom_questions or []
+
     ai_questions = result.get("questions", [])[:no_of_questions]
 
     final_questions = ai_questions + custom_questions
@@ -167,11 +173,41 @@ Return JSON:
     }
 
 
+def generate_section_questions(
+    job_title: str,
+    job_level: str,
+    skills: str,
+    section_type: str,
+    no_of_questions: int,
+    custom_questions: List[str] | None = None
+) -> Dict:
+
+    prompt = build_section_questions_prompt(job_title, job_level, skills, section_type, no_of_questions)
+    result = call_llm(prompt)
+
+    return section_questions_result(result, section_type, no_of_questions, custom_questions)
+
+
+async def agenerate_section_questions(
+    job_title: str,
+    job_level: str,
+    skills: str,
+    section_type: str,
+    no_of_questions: int,
+    custom_questions: List[str] | None = None
+) -> Dict:
+
+    prompt = build_section_questions_prompt(job_title, job_level, skills, section_type, no_of_questions)
+    result = await acall_llm(prompt)
+
+    return section_questions_result(result, section_type, no_of_questions, custom_questions)
+
+
 # ----------------------------------------------------
 # FOLLOW UP QUESTION
 # ----------------------------------------------------
 
-def generate_follow_up_question(
+def build_follow_up_prompt(
     job_title: str,
     job_level: str,
     skills: str,
@@ -179,7 +215,7 @@ def generate_follow_up_question(
     answer: str
 ) -> str:
 
-    prompt = f"""
+    return f"""
 Generate ONE follow-up interview question.
 
 Job Title:
@@ -214,7 +250,30 @@ Return JSON:
 }}
 """
 
-    result = call_llm(prompt)
+
+
+def generate_follow_up_question(
+    job_title: str,
+    job_level: str,
+    skills: str,
+    question: str,
+    answer: str
+) -> str:
+
+    result = call_llm(build_follow_up_prompt(job_title, job_level, skills, question, answer))
+
+    return result["follow_up"]
+
+
+async def agenerate_follow_up_question(
+    job_title: str,
+    job_level: str,
+    skills: str,
+    question: str,
+    answer: str
+) -> str:
+
+    result = await acall_llm(build_follow_up_prompt(job_title, job_level, skills, question, answer))
 
     return result["follow_up"]
 
@@ -248,17 +307,17 @@ communication_clarity (0-25)
 # SECTION EVALUATION (UPDATED)
 # ----------------------------------------------------
 
-def evaluate_section_answers(
+def build_evaluation_prompt(
     job_title: str,
     job_level: str,
     skills: str,
     section_type: str,
     qa: List[Dict]
-) -> Dict:
+) -> str:
 
     rubric = TECHNICAL_RUBRIC if section_type.lower() == "technical" else BEHAVIORAL_RUBRIC
 
-    prompt = f"""
+    return f"""
 Evaluate interview answers.
 
 Job Title:
@@ -356,7 +415,9 @@ Questions and Answers:
 {json.dumps(qa, indent=2)}
 """
 
-    result = call_llm(prompt)
+
+
+def evaluation_result(result: Dict) -> Dict:
 
     question_results = result["question_results"]
 
@@ -374,6 +435,32 @@ Questions and Answers:
     }
 
 
+def evaluate_section_answers(
+    job_title: str,
+    job_level: str,
+    skills: str,
+    section_type: str,
+    qa: List[Dict]
+) -> Dict:
+
+    result = call_llm(build_evaluation_prompt(job_title, job_level, skills, section_type, qa))
+
+    return evaluation_result(result)
+
+
+async def aevaluate_section_answers(
+    job_title: str,
+    job_level: str,
+    skills: str,
+    section_type: str,
+    qa: List[Dict]
+) -> Dict:
+
+    result = await acall_llm(build_evaluation_prompt(job_title, job_level, skills, section_type, qa))
+
+    return evaluation_result(result)
+
+
 # ----------------------------------------------------
 # INTERVIEW TIME VALIDATION
 # ----------------------------------------------------
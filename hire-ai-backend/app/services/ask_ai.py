@@ -1,68 +1,60 @@
-import os
 import json
-import requests
-from fastapi import HTTPException, UploadFile
+from typing import AsyncIterator
 
-from app.schemas.candidate_profile import PromptRequest, PromptResponse
-from app.services.resume_assist import process_uploaded_file as resume_text_extract
+from fastapi import HTTPException
 
-api_key = os.getenv("GROQ_API_KEY")
-api_url = "https://api.groq.com/openai/v1/chat/completions"
+from app.schemas.candidate_profile import PromptRequest, PromptResponse
+from app.services.llm import chat_completion, astream_chat_completion
 
 
-def ask_ai(prompt: PromptRequest) -> PromptResponse:
-    if not api_key:
-        raise HTTPException(
-            status_code=500,
-            detail="Groq API key not configured",
-        )
-    
-    payload = {
-        "model": "llama-3.1-8b-instant",
-        "messages": [
-            {
-                "role": "system",
-                "content": (
-                    "You are a all-in-one AI assistant for hiring platform"
-                    "Strict rules : : : Output : No extra text, no markdown, no explanations, no symbols. Just answer the question asked by user."
-                    "Answer anything that user ask related to hiring, candidates, job descriptions, resume parsing, resume matching etc. "
-                ),
-            },
-            {"role": "user", "content": prompt.prompt},
-        ],
-        "temperature": 0.1,
-        "max_tokens": 2000,
-    }
+def build_messages(prompt: PromptRequest) -> list[dict]:
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a all-in-one AI assistant for hiring platform"
+                "Strict rules : : : Output : No extra text, no markdown, no explanations, no symbols. Just answer the question asked by user."
+                "Answer anything that user ask related to hiring, candidates, job descriptions, resume parsing, resume matching etc. "
+            ),
+        },
+        {"role": "user", "content": prompt.prompt},
+    ]
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
 
+def ask_ai(prompt: PromptRequest) -> PromptResponse:
+    content = chat_completion(
+        build_messages(prompt),
+        temperature=0.1,
+        max_tokens=2000,
+        timeout=30,
+    )
+
+    return PromptResponse(
+        prompt=prompt.prompt,
+        response=content
+    )
+
+
+async def stream_ask_ai(prompt: PromptRequest) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for the same prompt.
+    Emits `data: {"delta": ...}` per chunk, then a `done` event
+    (or an `error` event if Groq fails mid-way).
+    """
     try:
-        response = requests.post(
-            api_url,
-            headers=headers,
-            json=payload,
+        async for delta in astream_chat_completion(
+            build_messages(prompt),
+            temperature=0.1,
+            max_tokens=2000,
             timeout=30,
-        )
-
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=response.text,
-            )
-
-        content = response.json()["choices"][0]["message"]["content"]
-        return PromptResponse(
-            prompt=prompt.prompt,
-            response=content
-        )
-
+        ):
+            yield f"data: {json.dumps({'delta': delta})}\n\n"
 
-    except requests.RequestException as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Groq API request failed: {exc}",
-        )
+    except HTTPException as exc:
+        yield f"event: error\ndata: {json.dumps({'status_code': exc.status_code, 'detail': exc.detail})}\n\n"
+        return
+    except Exception as exc:
+        yield f"event: error\ndata: {json.dumps({'status_code': 500, 'detail': f'Streaming failed: {exc}'})}\n\n"
+        return
 
+    yield "event: done\ndata: {}\n\n"
@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Tuple
+
+from app.db.models import CandidateProfile
+from app.services.resume_matcher import amatch_texts
+from app.services.resume_bulk import ndjson_match_stream
+
+
+# ----------------------------------------------------
+# PROFILE -> RESUME TEXT
+# ----------------------------------------------------
+
+def _month_year(value: datetime | None) -> str:
+    return value.strftime("%b %Y") if value else ""
+
+
+def _join(*parts) -> str:
+    return " | ".join(str(p).strip() for p in parts if p and str(p).strip())
+
+
+def _full_name(profile: CandidateProfile) -> str:
+    return " ".join(p.strip() for p in (profile.first_name, profile.last_name) if p and p.strip())
+
+
+def profile_to_resume_text(profile: CandidateProfile) -> str:
+    """
+    Compact resume text rebuilt from a stored profile, with the same section
+    headings resume_preparse recognises so budgeting and prescoring treat it
+    like an uploaded resume.
+    """
+    email = profile.user.email if profile.user else ""
+    lines = [_join(_full_name(profile), profile.title), _join(email, profile.phone, profile.location)]
+
+    if profile.total_years_experience:
+        lines.append(f"Total experience: {profile.total_years_experience} years")
+
+    if profile.profile_summary:
+        lines += ["", "SUMMARY", profile.profile_summary.strip()]
+
+    if profile.skills:
+        lines += ["", "SKILLS", profile.skills.strip()]
+
+    experiences = sorted(
+        profile.work_experiences,
+        key=lambda w: w.start_date or datetime.min,
+        reverse=True,
+    )
+    if experiences:
+        lines += ["", "EXPERIENCE"]
+        for work in experiences:
+            end = _month_year(work.end_date) or "Present"
+            lines.append(_join(work.job_title, work.company_name, work.location))
+            if work.start_date:
+                lines.append(f"{_month_year(work.start_date)} - {end}")
+            if work.description:
+                lines.append(work.description.strip())
+
+    if profile.education_records:
+        lines += ["", "EDUCATION"]
+        for edu in profile.education_records:
+            years = "-".join(str(y) for y in (edu.start_year, edu.end_year) if y)
+            lines.append(_join(edu.degree, edu.field_of_study, edu.institution_name, years, edu.gpa and f"GPA {edu.gpa}"))
+
+    if profile.certifications:
+        lines += ["", "CERTIFICATIONS"]
+        for cert in profile.certifications:
+            lines.append(_join(cert.certification_name, cert.issuing_body, _month_year(cert.issue_date)))
+
+    if isinstance(profile.languages, dict) and profile.languages:
+        lines += ["", "LANGUAGES", ", ".join(str(k) for k, v in profile.languages.items() if v)]
+
+    return "\n".join(line for line in lines if line is not None).strip()
+
+
+def profile_items(profiles: List[CandidateProfile]) -> List[Tuple[Dict, str]]:
+    """(meta, text) pairs for amatch_texts."""
+    return [
+        (
+            {
+                "candidate_id": profile.id,
+                "candidate_name": _full_name(profile),
+                "status": profile.status.value if profile.status else None,
+            },
+            profile_to_resume_text(profile),
+        )
+        for profile in profiles
+    ]
+
+
+# ----------------------------------------------------
+# STREAM
+# ----------------------------------------------------
+
+def rank_candidates_stream(
+    profiles: List[CandidateProfile],
+    job_description: Dict,
+    header: Dict,
+    top_k: int | None = None,
+    min_prescore: float | None = None,
+    recorder=None,
+) -> AsyncIterator[str]:
+    """
+    NDJSON ranking of stored candidates against a JD. Profile text is
+    built up front, so the stream needs no database session.
+    """
+    items = profile_items(profiles)
+    results = amatch_texts(
+        items,
+        job_description,
+        top_k=top_k,
+        min_prescore=min_prescore,
+        recorder=recorder,
+    )
+    return ndjson_match_stream(results, len(items), header, ranking_keys=("candidate_id", "candidate_name"))
@@ -0,0 +1,303 @@
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session, selectinload
+
+from app.core.config import CANDIDATE_SEARCH_DB_PATH
+from app.db.models import CandidateProfile, WorkExperience, Certification
+from app.db.models.candidate_status import CandidateStatus
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+# BM25 weight per indexed column, in table order: a title hit counts most
+COLUMN_WEIGHTS = {"title": 4.0, "summary": 2.0, "experience": 1.0, "certifications": 1.0}
+
+SNIPPET_MARKERS = ("<mark>", "</mark>")
+SNIPPET_TOKENS = 12
+REBUILD_BATCH = 500
+
+QUERY_PART_PATTERN = re.compile(r'(-?)"([^"]*)"|(\S+)')
+YEARS_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+
+SESSION_KEY = "candidate_search_dirty"
+
+
+# ----------------------------------------------------
+# DOCUMENTS
+# ----------------------------------------------------
+
+def _join(*parts) -> str:
+    return " | ".join(str(p).strip() for p in parts if p and str(p).strip())
+
+
+def parse_years(value) -> Optional[float]:
+    """CandidateProfile.total_years_experience is free text ("5+ years", "3.5")."""
+    match = YEARS_PATTERN.search(str(value or ""))
+    return float(match.group()) if match else None
+
+
+def profile_document(profile: CandidateProfile) -> Dict:
+    """Indexed text and filter fields of one profile."""
+    return {
+        "candidate_id": profile.id,
+        "recruiter_id": profile.recruiter_id,
+        "status": profile.status.value if profile.status else None,
+        "location": (profile.location or "").lower(),
+        "years": parse_years(profile.total_years_experience),
+        "title": profile.title or "",
+        "summary": profile.profile_summary or "",
+        "experience": "\n".join(
+            _join(work.job_title, work.company_name, work.description)
+            for work in profile.work_experiences
+        ),
+        "certifications": "\n".join(
+            _join(cert.certification_name, cert.issuing_body, cert.certification_description)
+            for cert in profile.certifications
+        ),
+    }
+
+
+def fts_query(text: str) -> str:
+    """
+    User query -> FTS5 MATCH expression. Words and "quoted phrases" must
+    all appear, a trailing * is a prefix match and a leading - excludes.
+    Everything is quoted, so FTS5 operators in the input are plain text.
+    """
+    include, exclude = [], []
+    for negated_phrase, phrase, word in QUERY_PART_PATTERN.findall(text or ""):
+        negated = bool(negated_phrase) or (word.startswith("-") and len(word) > 1)
+        term = phrase if phrase or negated_phrase else word.lstrip("-")
+        prefix = term.endswith("*")
+        term = term.rstrip("*").replace('"', " ").strip()
+        if not term:
+            continue
+        quoted = '"' + term + '"' + ("*" if prefix else "")
+        (exclude if negated else include).append(quoted)
+
+    if not include:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query needs at least one word or phrase to look for",
+        )
+    return " ".join(include) + "".join(f" NOT {term}" for term in exclude)
+
+
+# ----------------------------------------------------
+# INDEX
+# ----------------------------------------------------
+
+class CandidateSearchIndex:
+    """
+    SQLite FTS5 index over candidate title, summary, work experience and
+    certifications, plus a side table of filter fields. In memory by
+    default; a file path shares one index across workers. Kept current by
+    the SQLAlchemy events registered below.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path or ":memory:", check_same_thread=False)
+        if db_path:
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS candidate_meta ("
+            "rowid INTEGER PRIMARY KEY, candidate_id TEXT UNIQUE NOT NULL, recruiter_id TEXT, "
+            "status TEXT, location TEXT, years REAL);"
+            "CREATE VIRTUAL TABLE IF NOT EXISTS candidate_fts USING fts5("
+            f"{', '.join(COLUMN_WEIGHTS)}, tokenize='porter unicode61');"
+        )
+        self._db.commit()
+        self._verified = False
+        self._stale = False
+
+    # ---------------- writes ----------------
+
+    def upsert(self, documents: Iterable[Dict]) -> None:
+        with self._lock:
+            for doc in documents:
+                self._write(doc)
+            self._db.commit()
+
+    def delete(self, candidate_ids: Iterable[str]) -> None:
+        with self._lock:
+            for candidate_id in candidate_ids:
+                self._remove(candidate_id)
+            self._db.commit()
+
+    def _write(self, doc: Dict) -> None:
+        self._remove(doc["candidate_id"])
+        cursor = self._db.execute(
+            "INSERT INTO candidate_meta (candidate_id, recruiter_id, status, location, years) VALUES (?, ?, ?, ?, ?)",
+            (doc["candidate_id"], doc["recruiter_id"], doc["status"], doc["location"], doc["years"]),
+        )
+        self._db.execute(
+            f"INSERT INTO candidate_fts (rowid, {', '.join(COLUMN_WEIGHTS)}) VALUES (?, ?, ?, ?, ?)",
+            (cursor.lastrowid, *(doc[column] for column in COLUMN_WEIGHTS)),
+        )
+
+    def _remove(self, candidate_id: str) -> None:
+        row = self._db.execute("SELECT rowid FROM candidate_meta WHERE candidate_id = ?", (candidate_id,)).fetchone()
+        if row:
+            self._db.execute("DELETE FROM candidate_fts WHERE rowid = ?", row)
+            self._db.execute("DELETE FROM candidate_meta WHERE rowid = ?", row)
+
+    def reindex(self, db: Session, candidate_ids: Iterable[str]) -> None:
+        """Re-read the given profiles from the database; missing ones are dropped."""
+        candidate_ids = list(candidate_ids)
+        for start in range(0, len(candidate_ids), REBUILD_BATCH):
+            batch = candidate_ids[start:start + REBUILD_BATCH]
+            profiles = (
+                db.query(CandidateProfile)
+                .options(
+                    selectinload(CandidateProfile.work_experiences),
+                    selectinload(CandidateProfile.certifications),
+                )
+                .filter(CandidateProfile.id.in_(batch))
+                .all()
+            )
+            found = {profile.id for profile in profiles}
+            self.upsert(profile_document(profile) for profile in profiles)
+            self.delete(candidate_id for candidate_id in batch if candidate_id not in found)
+
+    def rebuild(self, db: Session) -> int:
+        """Index every profile from scratch; returns how many were indexed."""
+        with self._lock:
+            self._db.execute("DELETE FROM candidate_fts")
+            self._db.execute("DELETE FROM candidate_meta")
+            self._db.commit()
+        ids = [row[0] for row in db.query(CandidateProfile.id).all()]
+        self.reindex(db, ids)
+        return len(ids)
+
+    def mark_stale(self) -> None:
+        """Force a full rebuild on the next search (a sync was lost)."""
+        self._stale = True
+
+    def ensure_built(self, db: Session) -> None:
+        """First use in this process: rebuild unless the index covers every profile already."""
+        if self._verified and not self._stale:
+            return
+        with self._lock:
+            indexed = self._db.execute("SELECT count(*) FROM candidate_meta").fetchone()[0]
+        if self._stale or indexed != db.query(CandidateProfile.id).count():
+            self._stale = False
+            self.rebuild(db)
+        self._verified = True
+
+    # ---------------- search ----------------
+
+    def search(
+        self,
+        db: Session,
+        query: str,
+        recruiter_id: str | None = None,
+        location: str | None = None,
+        statuses: Iterable[CandidateStatus] = (),
+        min_years: float | None = None,
+        max_years: float | None = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Dict:
+        """BM25-ranked page of candidate ids with a highlighted snippet each, plus the total."""
+        self.ensure_built(db)
+
+        where, params = ["candidate_fts MATCH ?"], [fts_query(query)]
+        if recruiter_id is not None:
+            where.append("m.recruiter_id = ?")
+            params.append(recruiter_id)
+        if location:
+            escaped = location.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            where.append("m.location LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+        statuses = [s.value for s in statuses or ()]
+        if statuses:
+            where.append(f"m.status IN ({', '.join('?' * len(statuses))})")
+            params += statuses
+        if min_years is not None:
+            where.append("m.years >= ?")
+            params.append(min_years)
+        if max_years is not None:
+            where.append("m.years <= ?")
+            params.append(max_years)
+
+        source = "FROM candidate_fts JOIN candidate_meta m ON m.rowid = candidate_fts.rowid WHERE " + " AND ".join(where)
+        weights = ", ".join(str(w) for w in COLUMN_WEIGHTS.values())
+        opening, closing = SNIPPET_MARKERS
+
+        try:
+            with self._lock:
+                total = self._db.execute(f"SELECT count(*) {source}", params).fetchone()[0]
+                page = self._db.execute(
+                    f"SELECT candidate_fts.rowid, m.candidate_id, bm25(candidate_fts, {weights}) AS rank "
+                    f"{source} ORDER BY rank LIMIT ? OFFSET ?",
+                    [*params, limit, skip],
+                ).fetchall()
+                # Snippets for the page only; in the ranking query they would be built for every match
+                snippets = dict(self._db.execute(
+                    f"SELECT rowid, snippet(candidate_fts, -1, ?, ?, '…', {SNIPPET_TOKENS}) FROM candidate_fts "
+                    f"WHERE candidate_fts MATCH ? AND rowid IN ({', '.join('?' * len(page))})",
+                    [opening, closing, params[0], *(row[0] for row in page)],
+                ).fetchall()) if page else {}
+        except sqlite3.OperationalError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid search query: {exc}",
+            )
+
+        return {
+            "total": total,
+            "hits": [
+                {"candidate_id": candidate_id, "score": round(-rank, 4), "snippet": snippets.get(rowid)}
+                for rowid, candidate_id, rank in page
+            ],
+        }
+
+
+candidate_search_index = CandidateSearchIndex(CANDIDATE_SEARCH_DB_PATH or None)
+
+
+# ----------------------------------------------------
+# SYNC
+# ----------------------------------------------------
+
+def _mark_dirty(mapper, connection, target) -> None:
+    """Remember which profiles a flush touched; they are re-indexed after commit."""
+    session = object_session(target)
+    if session is None:
+        return
+    candidate_id = target.id if isinstance(target, CandidateProfile) else target.candidate_profile_id
+    if candidate_id:
+        session.info.setdefault(SESSION_KEY, set()).add(candidate_id)
+
+
+def _after_commit(session: Session) -> None:
+    dirty = session.info.pop(SESSION_KEY, None)
+    if not dirty:
+        return
+    # The committing session cannot emit SQL here; read back through a fresh one
+    try:
+        with Session(bind=session.get_bind()) as db:
+            candidate_search_index.reindex(db, dirty)
+    except Exception as exc:
+        # Never fail the request that committed; the next search rebuilds instead
+        candidate_search_index.mark_stale()
+        print(f"Candidate search re-index failed: {exc}")
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(SESSION_KEY, None)
+
+
+for model in (CandidateProfile, WorkExperience, Certification):
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, name, _mark_dirty)
+
+event.listen(Session, "after_commit", _after_commit)
+event.listen(Session, "after_rollback", _after_rollback)
@@ -0,0 +1,155 @@
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+
+from app.core.config import (
+    EXTRACTION_CACHE_MAX_ENTRIES,
+    EXTRACTION_CACHE_DB_PATH,
+    RESUME_MAX_UPLOAD_BYTES,
+)
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+# Bump when an extractor changes its output so stale entries stop matching.
+EXTRACTION_VERSION = 2
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+# ----------------------------------------------------
+# HASHING WHILE READING
+# ----------------------------------------------------
+
+def _too_large(filename: str | None, max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"{filename or 'File'} exceeds the {max_bytes / (1024 * 1024):g} MB upload limit",
+    )
+
+
+def spool_upload(fileobj: BinaryIO, filename: str | None = None, max_bytes: int = RESUME_MAX_UPLOAD_BYTES) -> Tuple[bytes, str]:
+    """
+    Read a file object in chunks, hashing as we go: (data, sha256 hex).
+    Stops with a 413 as soon as more than max_bytes have been read.
+    """
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    while chunk := fileobj.read(READ_CHUNK_SIZE):
+        if len(buffer) + len(chunk) > max_bytes:
+            raise _too_large(filename, max_bytes)
+        digest.update(chunk)
+        buffer += chunk
+    return bytes(buffer), digest.hexdigest()
+
+
+async def aspool_upload(file: UploadFile, max_bytes: int = RESUME_MAX_UPLOAD_BYTES) -> Tuple[bytes, str]:
+    """Async spool_upload for an UploadFile; a known oversize upload is rejected unread."""
+    if file.size is not None and file.size > max_bytes:
+        raise _too_large(file.filename, max_bytes)
+
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    while chunk := await file.read(READ_CHUNK_SIZE):
+        if len(buffer) + len(chunk) > max_bytes:
+            raise _too_large(file.filename, max_bytes)
+        digest.update(chunk)
+        buffer += chunk
+    return bytes(buffer), digest.hexdigest()
+
+
+def make_key(sha256: str, filename: str) -> str:
+    """Content hash plus what decides the extractor: extension and version."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    return f"v{EXTRACTION_VERSION}:{ext}:{sha256}"
+
+
+# ----------------------------------------------------
+# CACHE
+# ----------------------------------------------------
+
+class ExtractionCache:
+    """
+    Content-addressed cache of extraction records
+    ({"text", "page_count", "metadata"}).
+    In-memory LRU in front of an optional SQLite file shared by workers.
+    Entries never expire: the same bytes always extract to the same text.
+    """
+
+    def __init__(self, max_entries: int = 512, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            record = self._entries.get(key)
+            if record is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return record
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM extraction_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    record = json.loads(row[0])
+                    self._store(key, record)
+                    self.hits += 1
+                    return record
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, record: Dict) -> None:
+        with self._lock:
+            self._store(key, record)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO extraction_cache (key, value) VALUES (?, ?)",
+                    (key, json.dumps(record, ensure_ascii=False)),
+                )
+                self._db.commit()
+
+    def _store(self, key: str, record: Dict) -> None:
+        self._entries[key] = record
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM extraction_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+extraction_cache = ExtractionCache(
+    max_entries=EXTRACTION_CACHE_MAX_ENTRIES,
+    db_path=EXTRACTION_CACHE_DB_PATH or None,
+)
@@ -0,0 +1,237 @@
+import os
+import signal
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict
+
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import (
+    EXTRACTION_WORKERS,
+    EXTRACTION_TIMEOUT,
+    EXTRACTION_MAX_TASKS_PER_CHILD,
+    EXTRACTION_WORKER_MEMORY_MB,
+)
+from app.services.resume_assist import (
+    extract_text,
+    extract_record,
+    lookup_record,
+    store_record,
+    record_failure,
+    limit_error,
+    ExtractionLimitError,
+)
+from app.services.extraction_cache import aspool_upload
+
+try:
+    import resource
+except ImportError:  # Windows: no per-process memory cap
+    resource = None
+
+
+# ----------------------------------------------------
+# WORKER
+# ----------------------------------------------------
+
+def _warm_worker(memory_mb: int, pids) -> None:
+    """
+    Runs once per worker: report its PID (so a hung pool can be killed),
+    cap its address space and import the parsers.
+    """
+    pids.put(os.getpid())
+
+    if resource is not None and memory_mb > 0:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    import fitz  # noqa: F401
+    import docx  # noqa: F401
+    import pptx  # noqa: F401
+    import pypdf  # noqa: F401
+    import app.services.resume_assist  # noqa: F401
+
+
+def _noop() -> None:
+    return None
+
+
+# ----------------------------------------------------
+# POOL
+# ----------------------------------------------------
+
+class ExtractionPool:
+    """
+    Process pool for CPU-bound document parsing.
+
+    Workers are spawned with the parsing libraries pre-imported, capped at
+    `memory_mb` of address space, and replaced after `max_tasks_per_child`
+    files. A file that exceeds `timeout` gets a 504 and the pool is
+    restarted so the stuck worker does not keep a slot. With workers=0
+    extraction runs in a thread instead (useful for local development).
+    """
+
+    def __init__(
+        self,
+        workers: int = EXTRACTION_WORKERS,
+        timeout: float = EXTRACTION_TIMEOUT,
+        max_tasks_per_child: int = EXTRACTION_MAX_TASKS_PER_CHILD,
+        memory_mb: int = EXTRACTION_WORKER_MEMORY_MB,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_tasks_per_child = max_tasks_per_child or None
+        self.memory_mb = memory_mb
+        self._executor: ProcessPoolExecutor | None = None
+        # Queue each pool's workers report their PIDs on, see _warm_worker
+        self._pid_queues: Dict[ProcessPoolExecutor, Any] = {}
+        self._lock = threading.Lock()
+        # One in-flight file per worker, so the timeout measures parsing
+        # time rather than time spent queued behind other uploads.
+        self._slots = asyncio.Semaphore(max(workers, 1))
+
+    # ---------------- lifecycle ----------------
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context("spawn")
+                pids = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_warm_worker,
+                    initargs=(self.memory_mb, pids),
+                    max_tasks_per_child=self.max_tasks_per_child,
+                )
+                self._pid_queues[self._executor] = pids
+            return self._executor
+
+    def _detach(self, executor: ProcessPoolExecutor) -> set:
+        """Forget `executor`; returns the PIDs its workers reported."""
+        pids = self._pid_queues.pop(executor, None)
+        reported = set()
+        while pids is not None and not pids.empty():
+            reported.add(pids.get())
+        if pids is not None:
+            pids.close()
+        return reported
+
+    def _restart(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Drop a pool with a hung or dead worker; the next call starts a fresh
+        one. Its other in-flight files fail with BrokenProcessPool and are
+        resubmitted by extract().
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            reported = self._detach(executor)
+
+        # Only live children of ours: a reported PID may belong to a worker
+        # that was recycled (max_tasks_per_child) and reused since.
+        for process in multiprocessing.active_children():
+            if process.pid in reported:
+                try:
+                    os.kill(process.pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+        executor.shutdown(wait=False)
+
+    async def start(self) -> None:
+        """Spawn and warm every worker up front so the first uploads don't pay for it."""
+        if self.workers <= 0:
+            return
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, _noop) for _ in range(self.workers)))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            if executor is not None:
+                self._detach(executor)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # ---------------- public API ----------------
+
+    @staticmethod
+    def _timeout_error(filename: str) -> HTTPException:
+        return HTTPException(
+            status_code=504,
+            detail=f"Text extraction timed out for {filename}",
+        )
+
+    async def extract(
+        self,
+        filename: str,
+        data: bytes,
+        extractor: Callable[[str, bytes], Any] = extract_text,
+    ) -> Any:
+        """
+        Run `extractor(filename, data)` in a worker process.
+        `extractor` must be a module-level function so it can be pickled.
+        """
+        if self.workers <= 0:
+            try:
+                return await asyncio.wait_for(asyncio.to_thread(extractor, filename, data), self.timeout)
+            except asyncio.TimeoutError:
+                raise self._timeout_error(filename)
+
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(2):
+            async with self._slots:
+                executor = self._get_executor()
+                try:
+                    return await asyncio.wait_for(
+                        loop.run_in_executor(executor, extractor, filename, data),
+                        self.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    self._restart(executor)
+                    raise self._timeout_error(filename)
+                except BrokenProcessPool:
+                    # A worker died (memory cap, crash), or another file's timeout
+                    # restarted the pool under us and this file was collateral:
+                    # resubmit once to a fresh pool.
+                    self._restart(executor)
+                    if attempt:
+                        raise HTTPException(
+                            status_code=500,
+                            detail=f"Text extraction worker crashed for {filename}",
+                        )
+
+    async def extract_bytes_record(self, filename: str, data: bytes, sha256: str) -> Dict:
+        """Extraction record for bytes already read; a cache hit skips the worker entirely."""
+        record = lookup_record(filename, sha256)
+        if record is None:
+            try:
+                record = await self.extract(filename, data, extract_record)
+            except ExtractionLimitError as exc:
+                record_failure(filename)
+                raise limit_error(exc)
+            except Exception:
+                record_failure(filename)
+                raise
+            store_record(filename, sha256, record)
+        return record
+
+    async def extract_upload_record(self, file: UploadFile) -> Dict:
+        """
+        Extraction record for an upload. The SHA-256 is computed while the
+        upload is read.
+        """
+        data, sha256 = await aspool_upload(file)
+        return await self.extract_bytes_record(file.filename, data, sha256)
+
+    async def extract_upload(self, file: UploadFile) -> str:
+        record = await self.extract_upload_record(file)
+        return record["text"]
+
+
+extraction_pool = ExtractionPool()
@@ -1,16 +1,17 @@
 import os
-import requests
 import tempfile
 import uuid
 import json
 import docx
-from typing import Optional
+from typing import Any, AsyncIterator, Optional, Tuple
 
 from fastapi import HTTPException
 from docx import Document
 from fpdf import FPDF
 
 from app.schemas.job import JobDescriptionCreate
+from app.services.llm import chat_completion, achat_completion, astream_chat_completion
+from app.services.llm.json_stream import TopLevelJSONStream
 
 class JobDescriptionGenerator:
     def __init__(self):
@@ -22,72 +23,84 @@ class JobDescriptionGenerator:
                     self.api_key = f.read().strip()
             except FileNotFoundError:
                 self.api_key = None
-
-        self.api_url = "https://api.groq.com/openai/v1/chat/completions"
     
-    def generate_job_description(
-        self,
-        data: JobDescriptionCreate,
-    ) -> dict:
+    def _messages(self, data: JobDescriptionCreate) -> list[dict]:
         if not self.api_key:
             raise HTTPException(
                 status_code=500,
                 detail="Groq API key not configured",
             )
 
-        prompt = self._build_prompt(data)
-
-        payload = {
-            "model": "llama-3.1-8b-instant",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a professional HR content writer. "
-                        "Generate clear, structured, and realistic job descriptions "
-                        "with headings and bullet points."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.7,
-            "max_tokens": 1500,
-        }
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You are a professional HR content writer. "
+                    "Generate clear, structured, and realistic job descriptions "
+                    "with headings and bullet points."
+                ),
+            },
+            {"role": "user", "content": self._build_prompt(data)},
+        ]
+
+    @staticmethod
+    def _parse(content: str) -> dict:
         try:
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                json=payload,
-                timeout=30,
-            )
-
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=response.text,
-                )
-
-            content = response.json()["choices"][0]["message"]["content"]
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                raise HTTPException(
-                    status_code=500,
-                    detail="LLM returned invalid JSON",
-                )
-
-        except requests.RequestException as exc:
+            return json.loads(content)
+        except json.JSONDecodeError:
             raise HTTPException(
                 status_code=500,
-                detail=f"Groq API request failed: {exc}",
+                detail="LLM returned invalid JSON",
             )
 
+    def generate_job_description(
+        self,
+        data: JobDescriptionCreate,
+    ) -> dict:
+        content = chat_completion(
+            self._messages(data),
+            temperature=0.7,
+            max_tokens=1500,
+            timeout=30,
+            api_key=self.api_key,
+            cache_feature="job_description",
+        )
+        return self._parse(content)
+
+    async def agenerate_job_description(
+        self,
+        data: JobDescriptionCreate,
+    ) -> dict:
+        content = await achat_completion(
+            self._messages(data),
+            temperature=0.7,
+            max_tokens=1500,
+            timeout=30,
+            api_key=self.api_key,
+            cache_feature="job_description",
+        )
+        return self._parse(content)
+
+    async def stream_job_description(
+        self,
+        data: JobDescriptionCreate,
+        stream: TopLevelJSONStream,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streamed variant of generate_job_description.
+        Yields each top-level section (key, value) as soon as it closes;
+        stream.result() holds the full document afterwards.
+        """
+        async for delta in astream_chat_completion(
+            self._messages(data),
+            temperature=0.7,
+            max_tokens=1500,
+            timeout=30,
+            api_key=self.api_key,
+        ):
+            for key, value in stream.feed(delta):
+                yield key, value
+
 
     def _build_prompt(self, data: JobDescriptionCreate) -> str:
         return f"""
@@ -0,0 +1,254 @@
+import struct
+from typing import Dict, List
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+CFB_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Sector numbers above this are markers (end of chain, free, FAT) [MS-CFB 2.1]
+MAX_REGULAR_SECTOR = 0xFFFFFFFA
+SECTOR_SIZES = (512, 4096)  # version 3 / version 4 files
+
+STREAM_OBJECT = 2
+ROOT_STORAGE = 5
+
+WORD_IDENT = 0xA5EC
+FIB_FLAG_ENCRYPTED = 0x0100
+FIB_FLAG_1TABLE = 0x0200
+FIB_FCCLX_INDEX = 33  # position of fcClx/lcbClx in FibRgFcLcb97
+
+# Word control characters -> plain text
+CONTROL_CHARS = {
+    "\r": "\n",      # paragraph mark
+    "\x0b": "\n",    # line break
+    "\x0c": "\n",    # page / section break
+    "\x07": "\t",    # table cell / row mark
+    "\x1e": "-",     # non-breaking hyphen
+    "\xa0": " ",
+}
+DROPPED_CHARS = "\x00\x01\x02\x03\x04\x05\x08\x1f"
+TRANSLATION = str.maketrans({**CONTROL_CHARS, **{c: None for c in DROPPED_CHARS}})
+
+FIELD_BEGIN, FIELD_SEPARATOR, FIELD_END = "\x13", "\x14", "\x15"
+
+
+# ----------------------------------------------------
+# COMPOUND FILE (OLE2 / CFB) READER
+# ----------------------------------------------------
+
+class CompoundFile:
+    """
+    Minimal read-only compound file reader: enough of [MS-CFB] to pull
+    named streams out of a .doc without any third-party dependency.
+    """
+
+    def __init__(self, data: bytes):
+        if len(data) < 512 or data[:8] != CFB_SIGNATURE:
+            raise ValueError("Not an OLE2 compound file")
+
+        self.data = data
+        self.sector_size = 1 << self._u16(0x1E)
+        if self.sector_size not in SECTOR_SIZES:
+            raise ValueError("Unsupported sector size")
+        self.mini_sector_size = 1 << self._u16(0x20)
+        self.mini_cutoff = self._u32(0x38)
+
+        self.fat = self._read_fat()
+        self.entries = self._read_directory(self._u32(0x30))
+
+        root = self.entries[0]
+        self.mini_stream = self._read_chain(root["start"], root["size"], self.fat, self._sector)
+        minifat_raw = self._read_chain(self._u32(0x3C), None, self.fat, self._sector)
+        self.minifat = list(struct.unpack_from(f"<{len(minifat_raw) // 4}I", minifat_raw))
+
+    # ---------------- low level ----------------
+
+    def _u16(self, offset: int) -> int:
+        return struct.unpack_from("<H", self.data, offset)[0]
+
+    def _u32(self, offset: int) -> int:
+        return struct.unpack_from("<I", self.data, offset)[0]
+
+    def _sector(self, index: int) -> bytes:
+        start = (index + 1) * self.sector_size
+        if start >= len(self.data):
+            raise ValueError("Sector out of range")
+        return self.data[start:start + self.sector_size]
+
+    def _mini_sector(self, index: int) -> bytes:
+        start = index * self.mini_sector_size
+        return self.mini_stream[start:start + self.mini_sector_size]
+
+    def _read_fat(self) -> List[int]:
+        per_sector = self.sector_size // 4
+        fat_sectors = [s for s in struct.unpack_from("<109I", self.data, 0x4C) if s <= MAX_REGULAR_SECTOR]
+
+        # DIFAT chain: each sector lists FAT sectors, last entry points onward
+        # The header's count is untrusted; the chain cannot outnumber the sectors
+        sector_count = len(self.data) // self.sector_size
+        difat_sector = self._u32(0x44)
+        for _ in range(min(self._u32(0x48), sector_count)):
+            if difat_sector > MAX_REGULAR_SECTOR:
+                break
+            entries = struct.unpack_from(f"<{per_sector}I", self._sector(difat_sector))
+            fat_sectors.extend(s for s in entries[:-1] if s <= MAX_REGULAR_SECTOR)
+            difat_sector = entries[-1]
+
+        if len(fat_sectors) > sector_count:
+            raise ValueError("FAT larger than the file")
+
+        fat: List[int] = []
+        for sector in fat_sectors:
+            fat.extend(struct.unpack_from(f"<{per_sector}I", self._sector(sector)))
+        return fat
+
+    def _read_chain(self, start: int, size: int | None, table: List[int], read_sector) -> bytes:
+        parts = []
+        sector = start
+        # A chain can never be longer than the table; guards against loops
+        for _ in range(len(table) + 1):
+            if sector > MAX_REGULAR_SECTOR or sector >= len(table):
+                break
+            parts.append(read_sector(sector))
+            sector = table[sector]
+        else:
+            raise ValueError("Sector chain loops")
+
+        data = b"".join(parts)
+        return data if size is None else data[:size]
+
+    def _read_directory(self, start: int) -> List[Dict]:
+        raw = self._read_chain(start, None, self.fat, self._sector)
+        entries = []
+        for offset in range(0, len(raw) - 127, 128):
+            name_length = struct.unpack_from("<H", raw, offset + 0x40)[0]
+            name = raw[offset:offset + max(0, name_length - 2)].decode("utf-16le", errors="ignore")
+            entries.append({
+                "name": name,
+                "type": raw[offset + 0x42],
+                "start": struct.unpack_from("<I", raw, offset + 0x74)[0],
+                "size": struct.unpack_from("<I", raw, offset + 0x78)[0],
+            })
+        if not entries or entries[0]["type"] != ROOT_STORAGE:
+            raise ValueError("Missing root directory entry")
+        return entries
+
+    # ---------------- public API ----------------
+
+    def stream_names(self) -> List[str]:
+        return [e["name"] for e in self.entries if e["type"] == STREAM_OBJECT]
+
+    def read_stream(self, name: str) -> bytes:
+        for entry in self.entries:
+            if entry["type"] == STREAM_OBJECT and entry["name"] == name:
+                if entry["size"] < self.mini_cutoff:
+                    return self._read_chain(entry["start"], entry["size"], self.minifat, self._mini_sector)
+                return self._read_chain(entry["start"], entry["size"], self.fat, self._sector)
+        raise KeyError(name)
+
+
+# ----------------------------------------------------
+# WORD 97-2003 TEXT
+# ----------------------------------------------------
+
+def _piece_table(table_stream: bytes, fc_clx: int, lcb_clx: int) -> List[tuple]:
+    """(cp_start, cp_end, fc, compressed) for every piece in the Clx."""
+    clx = table_stream[fc_clx:fc_clx + lcb_clx]
+    pos = 0
+
+    # Skip Prc entries (property modifiers) that precede the Pcdt
+    while pos < len(clx) and clx[pos] == 0x01:
+        cb_grpprl = struct.unpack_from("<h", clx, pos + 1)[0]
+        # Signed on disk; a negative size would step backwards and loop forever
+        if cb_grpprl < 0:
+            raise ValueError("Corrupt property modifier in piece table")
+        pos += 3 + cb_grpprl
+
+    if pos >= len(clx) or clx[pos] != 0x02:
+        raise ValueError("Piece table not found")
+
+    lcb = struct.unpack_from("<I", clx, pos + 1)[0]
+    plc = clx[pos + 5:pos + 5 + lcb]
+    # PlcPcd is n + 1 CPs and n 8-byte PCDs
+    if len(plc) < lcb or lcb < 16 or (lcb - 4) % 12:
+        raise ValueError("Truncated piece table")
+    count = (lcb - 4) // 12
+    cps = struct.unpack_from(f"<{count + 1}I", plc, 0)
+
+    pieces = []
+    for i in range(count):
+        fc_value = struct.unpack_from("<I", plc, 4 * (count + 1) + 8 * i + 2)[0]
+        compressed = bool(fc_value & 0x40000000)
+        fc = fc_value & 0x3FFFFFFF
+        pieces.append((cps[i], cps[i + 1], fc // 2 if compressed else fc, compressed))
+    return pieces
+
+
+def _strip_fields(text: str) -> str:
+    """Keep field results, drop field codes (HYPERLINK "...", PAGE, ...)."""
+    if FIELD_BEGIN not in text:
+        return text
+
+    out = []
+    # One flag per open field: True while still inside its code part
+    stack: List[bool] = []
+    for ch in text:
+        if ch == FIELD_BEGIN:
+            stack.append(True)
+        elif ch == FIELD_SEPARATOR and stack:
+            stack[-1] = False
+        elif ch == FIELD_END and stack:
+            stack.pop()
+        elif not any(stack):
+            out.append(ch)
+    return "".join(out)
+
+
+def clean_word_text(text: str) -> str:
+    text = _strip_fields(text)
+    text = text.translate(TRANSLATION)
+    lines = [line.strip() for line in text.split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+def extract_text_from_word97(data: bytes) -> str:
+    """
+    Text of a Word 97-2003 binary document via its piece table.
+    Raises ValueError for anything that is not a readable Word 97+ file
+    (not OLE2, encrypted, Word 6/95), so callers can fall back.
+    """
+    cfb = CompoundFile(data)
+    word = cfb.read_stream("WordDocument")
+
+    if len(word) < 0x22 or struct.unpack_from("<H", word, 0)[0] != WORD_IDENT:
+        raise ValueError("Not a Word document")
+
+    flags = struct.unpack_from("<H", word, 0x0A)[0]
+    if flags & FIB_FLAG_ENCRYPTED:
+        raise ValueError("Encrypted Word document")
+
+    # FibBase, then variable-length FibRgW / FibRgLw / FibRgFcLcb blocks
+    csw = struct.unpack_from("<H", word, 0x20)[0]
+    pos = 0x22 + csw * 2
+    cslw = struct.unpack_from("<H", word, pos)[0]
+    pos += 2 + cslw * 4
+    cb_rg_fc_lcb = struct.unpack_from("<H", word, pos)[0]
+    pos += 2
+    if cb_rg_fc_lcb <= FIB_FCCLX_INDEX:
+        raise ValueError("Pre-Word 97 document")
+
+    fc_clx, lcb_clx = struct.unpack_from("<II", word, pos + FIB_FCCLX_INDEX * 8)
+    table = cfb.read_stream("1Table" if flags & FIB_FLAG_1TABLE else "0Table")
+
+    parts = []
+    for cp_start, cp_end, fc, compressed in _piece_table(table, fc_clx, lcb_clx):
+        length = cp_end - cp_start
+        if compressed:
+            parts.append(word[fc:fc + length].decode("cp1252", errors="replace"))
+        else:
+            parts.append(word[fc:fc + 2 * length].decode("utf-16le", errors="replace"))
+
+    return clean_word_text("".join(parts))
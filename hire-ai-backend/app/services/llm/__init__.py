@@ -0,0 +1,43 @@
+from app.services.llm.client import (
+    GROQ_URL,
+    DEFAULT_MODEL,
+    get_async_client,
+    get_sync_client,
+    close_clients,
+    chat_completion,
+    achat_completion,
+    astream_chat_completion,
+)
+from app.services.llm.cache import llm_cache, FEATURE_TTLS
+from app.services.llm.rate_limit import rate_limiter, MODEL_BUDGETS
+from app.services.llm.prompt_budget import (
+    count_tokens,
+    compact_whitespace,
+    compact_json,
+    truncate_to_tokens,
+    fit_sections,
+    chunk_sections,
+    sections_in_order,
+)
+
+__all__ = [
+    "GROQ_URL",
+    "DEFAULT_MODEL",
+    "get_async_client",
+    "get_sync_client",
+    "close_clients",
+    "chat_completion",
+    "achat_completion",
+    "astream_chat_completion",
+    "llm_cache",
+    "FEATURE_TTLS",
+    "rate_limiter",
+    "MODEL_BUDGETS",
+    "count_tokens",
+    "compact_whitespace",
+    "compact_json",
+    "truncate_to_tokens",
+    "fit_sections",
+    "chunk_sections",
+    "sections_in_order",
+]
@@ -0,0 +1,156 @@
+import json
+import time
+import logging
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from app.core.config import LLM_CACHE_MAX_ENTRIES, LLM_CACHE_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+# Seconds a cached completion stays valid, per calling feature.
+FEATURE_TTLS: Dict[str, int] = {
+    "resume_parse": 7 * 24 * 3600,
+    "resume_reformat": 7 * 24 * 3600,
+    "resume_match": 24 * 3600,
+    "candidate_sourcing": 6 * 3600,
+    "job_description": 3600,
+}
+
+DEFAULT_TTL = 3600
+
+# How long to wait for another worker's write lock on the shared file
+# before giving up; the cache is then skipped, never the LLM call
+DB_TIMEOUT_SECONDS = 1.0
+
+
+def make_key(payload: Dict) -> str:
+    """SHA-256 over the fields that determine a completion."""
+    material = {
+        "model": payload.get("model"),
+        "messages": payload.get("messages"),
+        "temperature": payload.get("temperature"),
+        "max_tokens": payload.get("max_tokens"),
+        "response_format": payload.get("response_format"),
+    }
+    raw = json.dumps(material, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ----------------------------------------------------
+# CACHE
+# ----------------------------------------------------
+
+class LLMResponseCache:
+    """
+    Two-tier completion cache.
+    In-memory LRU in front of an optional SQLite file shared by workers.
+    """
+
+    def __init__(self, max_entries: int = 1024, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.stats_by_feature: Dict[str, Dict[str, int]] = {}
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, timeout=DB_TIMEOUT_SECONDS, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    def _count(self, feature: str, field: str) -> None:
+        counters = self.stats_by_feature.setdefault(feature, {"hits": 0, "misses": 0})
+        counters[field] += 1
+
+    def get(self, key: str, feature: str = "default") -> Optional[str]:
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._count(feature, "hits")
+                    return value
+                del self._entries[key]
+
+            if self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    logger.warning("LLM cache read failed, treating as a miss", exc_info=True)
+                    row = None
+                if row and row[1] > now:
+                    self._store(key, row[0], row[1])
+                    self._count(feature, "hits")
+                    return row[0]
+
+            self._count(feature, "misses")
+            return None
+
+    def set(self, key: str, value: str, feature: str = "default") -> None:
+        expires_at = time.time() + FEATURE_TTLS.get(feature, DEFAULT_TTL)
+
+        with self._lock:
+            self._store(key, value, expires_at)
+            if self._db is not None:
+                # The completion already succeeded (and was billed); a busy
+                # or broken cache file must not fail it
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, value, expires_at),
+                    )
+                    self._db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+                    self._db.commit()
+                except sqlite3.Error:
+                    logger.warning("LLM cache write failed, entry kept in memory only", exc_info=True)
+                    self._rollback()
+
+    def _rollback(self) -> None:
+        try:
+            self._db.rollback()
+        except sqlite3.Error:
+            pass
+
+    def _store(self, key: str, value: str, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "features": {k: dict(v) for k, v in self.stats_by_feature.items()},
+            }
+
+
+llm_cache = LLMResponseCache(
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+    db_path=LLM_CACHE_DB_PATH or None,
+)
@@ -0,0 +1,284 @@
+import json
+import time
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+from fastapi import HTTPException
+
+from app.core.config import GROQ_API_KEY
+from app.services.llm.cache import llm_cache, make_key
+from app.services.llm.rate_limit import rate_limiter, estimate_tokens
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+DEFAULT_MODEL = "llama-3.1-8b-instant"
+
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60,
+)
+
+DEFAULT_TIMEOUT = 30
+
+
+# ----------------------------------------------------
+# SHARED CLIENTS
+# ----------------------------------------------------
+
+_async_client: Optional[httpx.AsyncClient] = None
+_sync_client: Optional[httpx.Client] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Process-wide keep-alive client for async callers."""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            limits=POOL_LIMITS,
+            timeout=DEFAULT_TIMEOUT,
+        )
+    return _async_client
+
+
+def get_sync_client() -> httpx.Client:
+    """Process-wide keep-alive client for sync (threadpool) callers."""
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(
+            http2=True,
+            limits=POOL_LIMITS,
+            timeout=DEFAULT_TIMEOUT,
+        )
+    return _sync_client
+
+
+async def close_clients() -> None:
+    """Close the shared clients (called on application shutdown)."""
+    global _async_client, _sync_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+
+
+# ----------------------------------------------------
+# HELPERS
+# ----------------------------------------------------
+
+def build_payload(
+    messages: List[Dict],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.2,
+    max_tokens: int = 1500,
+    response_format: Optional[Dict] = None,
+) -> Dict:
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if response_format:
+        payload["response_format"] = response_format
+    return payload
+
+
+def _headers(api_key: Optional[str]) -> Dict:
+    key = api_key or GROQ_API_KEY
+    if not key:
+        raise HTTPException(
+            status_code=500,
+            detail="Groq API key not configured",
+        )
+    return {
+        "Authorization": f"Bearer {key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _content(response: httpx.Response) -> str:
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=response.text,
+        )
+    return response.json()["choices"][0]["message"]["content"]
+
+
+def _is_json(content: str) -> bool:
+    # Cached features all expect JSON; never pin a malformed completion.
+    try:
+        json.loads(content)
+        return True
+    except ValueError:
+        return False
+
+
+# ----------------------------------------------------
+# CHAT COMPLETION
+# ----------------------------------------------------
+
+def chat_completion(
+    messages: List[Dict],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.2,
+    max_tokens: int = 1500,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = 0,
+    response_format: Optional[Dict] = None,
+    api_key: Optional[str] = None,
+    cache_feature: Optional[str] = None,
+) -> str:
+    """
+    Sync facade over the pooled client, for sync routes and worker threads
+    only; it sleeps and flocks in the calling thread. Coroutines use
+    achat_completion. Returns the assistant message content, raises
+    HTTPException on failure.
+    Sends are paced by the shared rate limiter; 429s are retried up to
+    `retries` times once the limiter's retry-after window has passed.
+    Pass cache_feature to serve identical requests from the response cache.
+    """
+    headers = _headers(api_key)
+    payload = build_payload(messages, model, temperature, max_tokens, response_format)
+
+    key = make_key(payload) if cache_feature else None
+    if key:
+        cached = llm_cache.get(key, cache_feature)
+        if cached is not None:
+            return cached
+
+    client = get_sync_client()
+    tokens = estimate_tokens(payload)
+
+    try:
+        for attempt in range(retries + 1):
+            delay = rate_limiter.reserve(model, tokens)
+            if delay:
+                time.sleep(delay)
+            response = client.post(GROQ_URL, headers=headers, json=payload, timeout=timeout)
+            rate_limiter.observe(model, response, tokens, attempt)
+            if response.status_code != 429 or attempt == retries:
+                break
+    except httpx.HTTPError as exc:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Groq API request failed: {exc}",
+        )
+
+    content = _content(response)
+    if key and _is_json(content):
+        llm_cache.set(key, content, cache_feature)
+    return content
+
+
+async def achat_completion(
+    messages: List[Dict],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.2,
+    max_tokens: int = 1500,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = 0,
+    response_format: Optional[Dict] = None,
+    api_key: Optional[str] = None,
+    cache_feature: Optional[str] = None,
+) -> str:
+    """Async variant of chat_completion, for use from the event loop."""
+    headers = _headers(api_key)
+    payload = build_payload(messages, model, temperature, max_tokens, response_format)
+
+    key = make_key(payload) if cache_feature else None
+    if key:
+        cached = llm_cache.get(key, cache_feature)
+        if cached is not None:
+            return cached
+
+    client = get_async_client()
+    tokens = estimate_tokens(payload)
+
+    try:
+        for attempt in range(retries + 1):
+            delay = await rate_limiter.areserve(model, tokens)
+            if delay:
+                await asyncio.sleep(delay)
+            response = await client.post(GROQ_URL, headers=headers, json=payload, timeout=timeout)
+            await rate_limiter.aobserve(model, response, tokens, attempt)
+            if response.status_code != 429 or attempt == retries:
+                break
+    except httpx.HTTPError as exc:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Groq API request failed: {exc}",
+        )
+
+    content = _content(response)
+    if key and _is_json(content):
+        llm_cache.set(key, content, cache_feature)
+    return content
+
+
+async def astream_chat_completion(
+    messages: List[Dict],
+    model: str = DEFAULT_MODEL,
+    temperature: float = 0.2,
+    max_tokens: int = 1500,
+    timeout: float = DEFAULT_TIMEOUT,
+    api_key: Optional[str] = None,
+) -> AsyncIterator[str]:
+    """
+    Stream the completion with `stream: true`.
+    Yields content deltas as Groq emits them.
+    """
+    headers = _headers(api_key)
+    payload = build_payload(messages, model, temperature, max_tokens)
+    payload["stream"] = True
+
+    client = get_async_client()
+    tokens = estimate_tokens(payload)
+
+    delay = await rate_limiter.areserve(model, tokens)
+    if delay:
+        await asyncio.sleep(delay)
+
+    try:
+        async with client.stream("POST", GROQ_URL, headers=headers, json=payload, timeout=timeout) as response:
+            await rate_limiter.aobserve(model, response, tokens, stream=True)
+
+            if response.status_code != 200:
+                body = await response.aread()
+                raise HTTPException(
+                    status_code=response.status_code,
+                    detail=body.decode("utf-8", errors="replace"),
+                )
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+
+                chunk = json.loads(data)
+                usage = chunk.get("usage") or (chunk.get("x_groq") or {}).get("usage")
+                if usage and usage.get("total_tokens") is not None:
+                    await rate_limiter.aobserve_usage(model, tokens, int(usage["total_tokens"]))
+
+                choices = chunk.get("choices") or []
+                delta = choices[0].get("delta", {}).get("content") if choices else None
+                if delta:
+                    yield delta
+
+    except httpx.HTTPError as exc:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Groq API request failed: {exc}",
+        )
@@ -0,0 +1,79 @@
+import json
+from typing import Any, List, Tuple
+
+import json_repair
+
+
+class TopLevelJSONStream:
+    """
+    Incremental parser for a streamed JSON object.
+
+    feed() takes raw completion deltas and returns the top-level
+    (key, value) members that closed in that chunk. Text before the
+    opening brace (e.g. a code fence) is ignored.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start: int | None = None
+        self._done = False
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        self.buffer += text
+        completed = []
+
+        while self._pos < len(self.buffer) and not self._done:
+            ch = self.buffer[self._pos]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+
+            elif ch == '"':
+                self._in_string = True
+
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = self._pos + 1
+
+            elif ch in "}]":
+                if self._depth == 1:
+                    completed.extend(self._close_member())
+                    self._done = True
+                self._depth -= 1
+
+            elif ch == "," and self._depth == 1:
+                completed.extend(self._close_member())
+                self._member_start = self._pos + 1
+
+            self._pos += 1
+
+        return completed
+
+    def _close_member(self) -> List[Tuple[str, Any]]:
+        member = self.buffer[self._member_start:self._pos].strip()
+        if not member:
+            return []
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            parsed = json_repair.loads("{" + member + "}")
+        return list(parsed.items()) if isinstance(parsed, dict) else []
+
+    def result(self) -> dict:
+        """Whole document; repairs a truncated or slightly malformed stream."""
+        text = self.buffer[self.buffer.find("{"):] if "{" in self.buffer else self.buffer
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            repaired = json_repair.loads(text)
+            return repaired if isinstance(repaired, dict) else {}
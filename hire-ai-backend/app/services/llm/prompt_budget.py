@@ -0,0 +1,142 @@
+import re
+import json
+from typing import Dict, Iterable, List, Tuple
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+# Same ratio the rate limiter books tokens with
+CHARS_PER_TOKEN = 4
+
+INLINE_SPACE = re.compile(r"[ \t\f\v\u00a0]+")
+BLANK_LINES = re.compile(r"\n{3,}")
+
+
+# ----------------------------------------------------
+# ESTIMATION / COMPACTION
+# ----------------------------------------------------
+
+def count_tokens(text: str) -> int:
+    return (len(text or "") + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def compact_whitespace(text: str) -> str:
+    """Collapse runs of spaces, trim every line and keep at most one blank line."""
+    lines = (INLINE_SPACE.sub(" ", line).strip() for line in (text or "").splitlines())
+    return BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def compact_json(value) -> str:
+    """JSON without indentation or padding; empty values dropped from dicts."""
+    if isinstance(value, dict):
+        value = {k: v for k, v in value.items() if v not in (None, "", [], {})}
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to the budget, on a line boundary where one is close enough."""
+    limit = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    return text[:cut if cut > limit // 2 else limit].rstrip()
+
+
+# ----------------------------------------------------
+# BUDGETING
+# ----------------------------------------------------
+
+def fit_sections(sections: Iterable[Tuple[str, str]], max_tokens: int) -> str:
+    """
+    Join (heading, body) pairs in the given priority order until the
+    budget runs out; the section that crosses it is truncated, later ones dropped.
+    """
+    parts: List[str] = []
+    remaining = max_tokens
+    for heading, body in sections:
+        block = f"{heading}\n{body}" if heading else body
+        if not block.strip():
+            continue
+        cost = count_tokens(block) + 1
+        if cost > remaining:
+            if remaining > 50:
+                parts.append(truncate_to_tokens(block, remaining))
+            break
+        parts.append(block)
+        remaining -= cost
+    return "\n\n".join(parts)
+
+
+def chunk_sections(sections: Iterable[Tuple[str, str]], max_tokens: int) -> List[str]:
+    """
+    Pack (heading, body) pairs into chunks of at most max_tokens, keeping
+    section order. A section larger than one chunk is split on line
+    boundaries, each piece repeating its heading.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    used = 0
+
+    def flush():
+        nonlocal current, used
+        if current:
+            chunks.append("\n\n".join(current))
+        current, used = [], 0
+
+    for heading, body in sections:
+        for piece in _split_body(heading, body, max_tokens):
+            cost = count_tokens(piece) + 1
+            if used + cost > max_tokens:
+                flush()
+            current.append(piece)
+            used += cost
+    flush()
+    return chunks
+
+
+def _split_body(heading: str, body: str, max_tokens: int) -> List[str]:
+    prefix = f"{heading}\n" if heading else ""
+    block = prefix + body
+    if not body.strip():
+        return []
+    if count_tokens(block) <= max_tokens:
+        return [block]
+
+    pieces: List[str] = []
+    lines: List[str] = []
+    size = len(prefix)
+    limit = max_tokens * CHARS_PER_TOKEN
+    for line in body.split("\n"):
+        # A single overlong line is hard-wrapped
+        while len(prefix) + len(line) > limit:
+            head = limit - len(prefix)
+            if lines:
+                pieces.append(prefix + "\n".join(lines))
+                lines, size = [], len(prefix)
+            pieces.append(prefix + line[:head])
+            line = line[head:]
+        if size + len(line) + 1 > limit and lines:
+            pieces.append(prefix + "\n".join(lines))
+            lines, size = [], len(prefix)
+        lines.append(line)
+        size += len(line) + 1
+    if lines:
+        pieces.append(prefix + "\n".join(lines))
+    return pieces
+
+
+def sections_in_order(sections: Dict[str, str], order: Iterable[str] = (), skip: Iterable[str] = ()) -> List[Tuple[str, str]]:
+    """
+    split_sections() output as (HEADING, body) pairs: the listed sections
+    first, the rest in document order, "header" without a heading.
+    """
+    skip = set(skip)
+    names = [n for n in order if n in sections]
+    names += [n for n in sections if n not in names]
+    return [
+        ("" if name == "header" else name.upper(), sections[name])
+        for name in names
+        if name not in skip and sections.get(name)
+    ]
@@ -0,0 +1,218 @@
+import os
+import re
+import json
+import time
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from app.core.config import (
+    LLM_RATE_LIMIT_RPM,
+    LLM_RATE_LIMIT_TPM,
+    LLM_RATE_LIMIT_STATE_PATH,
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to per-process limiting
+    fcntl = None
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+# (requests per minute, tokens per minute) per model
+MODEL_BUDGETS: Dict[str, Tuple[int, int]] = {
+    "llama-3.1-8b-instant": (LLM_RATE_LIMIT_RPM, LLM_RATE_LIMIT_TPM),
+    "openai/gpt-oss-20b": (LLM_RATE_LIMIT_RPM, LLM_RATE_LIMIT_TPM),
+}
+
+DURATION_PART = re.compile(r"([\d.]+)(ms|h|m|s)")
+
+
+# ----------------------------------------------------
+# HELPERS
+# ----------------------------------------------------
+
+def estimate_tokens(payload: Dict) -> int:
+    """Rough prompt size (~4 chars per token) plus the completion budget."""
+    chars = sum(len(str(m.get("content", ""))) for m in payload.get("messages", []))
+    return chars // 4 + int(payload.get("max_tokens") or 0)
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse Groq reset values such as '7.66s', '2m59.56s' or '120ms'."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    units = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+    parts = DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * units[unit] for amount, unit in parts)
+
+
+# ----------------------------------------------------
+# RATE LIMITER
+# ----------------------------------------------------
+
+class RateLimiter:
+    """
+    Request and token buckets per model.
+
+    reserve() books capacity in arrival order and returns how long the
+    caller must wait, so callers queue FIFO instead of retrying blindly.
+    Buckets may go negative: that debt is the queue. With a state path
+    configured, the buckets live in a file guarded by flock and are shared
+    by every worker process on the host. Coroutines use the a* variants,
+    which keep that flock and file I/O off the event loop.
+    """
+
+    def __init__(self, state_path: Optional[str] = None):
+        self.state_path = state_path if fcntl is not None else None
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict] = {}
+
+    # ---------------- state storage ----------------
+
+    @contextmanager
+    def _locked_state(self):
+        with self._lock:
+            if not self.state_path:
+                yield self._state
+                return
+
+            fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    raw = handle.read()
+                    state = json.loads(raw) if raw else {}
+                    yield state
+                    handle.seek(0)
+                    handle.truncate()
+                    handle.write(json.dumps(state))
+                    handle.flush()
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _bucket(self, state: Dict, model: str, now: float) -> Dict:
+        rpm, tpm = MODEL_BUDGETS.get(model, (LLM_RATE_LIMIT_RPM, LLM_RATE_LIMIT_TPM))
+        bucket = state.setdefault(model, {
+            "requests": float(rpm),
+            "tokens": float(tpm),
+            "updated": now,
+            "blocked_until": 0.0,
+        })
+
+        elapsed = max(0.0, now - bucket["updated"])
+        bucket["requests"] = min(float(rpm), bucket["requests"] + elapsed * rpm / 60)
+        bucket["tokens"] = min(float(tpm), bucket["tokens"] + elapsed * tpm / 60)
+        bucket["updated"] = now
+        bucket["rpm"], bucket["tpm"] = rpm, tpm
+        return bucket
+
+    # ---------------- public API ----------------
+
+    def reserve(self, model: str, tokens: int) -> float:
+        """Book one request of `tokens`; returns seconds to wait before sending."""
+        now = time.time()
+        with self._locked_state() as state:
+            bucket = self._bucket(state, model, now)
+            bucket["requests"] -= 1
+            bucket["tokens"] -= tokens
+
+            wait_requests = max(0.0, -bucket["requests"]) * 60 / bucket["rpm"]
+            wait_tokens = max(0.0, -bucket["tokens"]) * 60 / bucket["tpm"]
+            wait_blocked = max(0.0, bucket["blocked_until"] - now)
+
+        return max(wait_requests, wait_tokens, wait_blocked)
+
+    def observe(
+        self,
+        model: str,
+        response: httpx.Response,
+        estimated_tokens: int,
+        attempt: int = 0,
+        stream: bool = False,
+    ) -> None:
+        """
+        Fold Groq's rate-limit headers (and actual usage) back into the buckets.
+        A streamed body has not been read yet, so only its headers are used;
+        the caller reports usage from the final chunk via observe_usage().
+        """
+        now = time.time()
+        headers = response.headers
+
+        with self._locked_state() as state:
+            bucket = self._bucket(state, model, now)
+
+            if response.status_code == 429:
+                retry_after = parse_duration(headers.get("retry-after"))
+                delay = retry_after if retry_after is not None else 2 ** attempt
+                bucket["blocked_until"] = max(bucket["blocked_until"], now + delay)
+
+            remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+            if remaining_tokens is not None and remaining_tokens.isdigit():
+                bucket["tokens"] = min(bucket["tokens"], float(remaining_tokens))
+                if int(remaining_tokens) == 0:
+                    reset = parse_duration(headers.get("x-ratelimit-reset-tokens"))
+                    if reset:
+                        bucket["blocked_until"] = max(bucket["blocked_until"], now + reset)
+
+            remaining_requests = headers.get("x-ratelimit-remaining-requests")
+            if remaining_requests is not None and remaining_requests.isdigit():
+                bucket["requests"] = min(bucket["requests"], float(remaining_requests))
+                if int(remaining_requests) == 0:
+                    reset = parse_duration(headers.get("x-ratelimit-reset-requests"))
+                    if reset:
+                        bucket["blocked_until"] = max(bucket["blocked_until"], now + reset)
+
+            if response.status_code == 200 and not stream:
+                try:
+                    used = int(response.json()["usage"]["total_tokens"])
+                    bucket["tokens"] = min(float(bucket["tpm"]), bucket["tokens"] + estimated_tokens - used)
+                except (ValueError, KeyError, TypeError):
+                    pass
+
+    def observe_usage(self, model: str, estimated_tokens: int, used: int) -> None:
+        """Give back (or charge) the difference between the estimate and real usage."""
+        with self._locked_state() as state:
+            bucket = self._bucket(state, model, time.time())
+            bucket["tokens"] = min(float(bucket["tpm"]), bucket["tokens"] + estimated_tokens - used)
+
+    # ---------------- async API ----------------
+
+    async def _run(self, method, *args, **kwargs):
+        # The file-backed state blocks on flock while another worker holds it;
+        # in-process state is a dict update and stays on the loop.
+        if self.state_path:
+            return await asyncio.to_thread(method, *args, **kwargs)
+        return method(*args, **kwargs)
+
+    async def areserve(self, model: str, tokens: int) -> float:
+        return await self._run(self.reserve, model, tokens)
+
+    async def aobserve(
+        self,
+        model: str,
+        response: httpx.Response,
+        estimated_tokens: int,
+        attempt: int = 0,
+        stream: bool = False,
+    ) -> None:
+        await self._run(self.observe, model, response, estimated_tokens, attempt, stream)
+
+    async def aobserve_usage(self, model: str, estimated_tokens: int, used: int) -> None:
+        await self._run(self.observe_usage, model, estimated_tokens, used)
+
+
+rate_limiter = RateLimiter(state_path=LLM_RATE_LIMIT_STATE_PATH or None)
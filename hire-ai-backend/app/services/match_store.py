@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from typing import Dict
+
+from app.core.config import RESUME_MATCH_CONCURRENCY
+from app.db.base import SessionLocal
+from app.db.crud import JobDescriptionCRUD, ResumeMatchCRUD
+from app.db.models import ResumeMatch
+from app.services.resume_matcher import ascore_resume_text, budget_resume_text, jd_revision
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------
+# RECORDER
+# ----------------------------------------------------
+
+class MatchRecorder:
+    """
+    Persists LLM match results for one job at its current JD revision.
+    Passed to amatch_resumes / amatch_sources; every call uses its own
+    short session so it is safe from worker threads and background tasks.
+    """
+
+    def __init__(self, job_id: str, job_description: Dict):
+        self.job_id = job_id
+        self.revision = jd_revision(job_description)
+
+    def lookup(self, resume_sha256: str) -> Dict | None:
+        with SessionLocal() as db:
+            db_match = ResumeMatchCRUD.get_match(db, self.job_id, resume_sha256)
+            if db_match is None or db_match.jd_revision != self.revision:
+                return None
+            return dict(db_match.result)
+
+    def save(self, resume_sha256: str, filename: str | None, text: str, result: Dict) -> None:
+        if not isinstance(result, dict) or "error" in result:
+            return
+
+        with SessionLocal() as db:
+            ResumeMatchCRUD.save_match(
+                db,
+                self.job_id,
+                resume_sha256,
+                self.revision,
+                {
+                    "filename": filename,
+                    "candidate_name": _text_or_none(result.get("name")),
+                    "candidate_email": _text_or_none(result.get("email")),
+                    "resume_text": budget_resume_text(text),
+                    "overall_match": _score_or_none(result.get("overall_match")),
+                    "result": result,
+                },
+            )
+
+
+def _text_or_none(value) -> str | None:
+    value = str(value or "").strip()
+    return value[:255] or None
+
+
+def _score_or_none(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ----------------------------------------------------
+# RANKING
+# ----------------------------------------------------
+
+def match_to_dict(db_match: ResumeMatch, revision: str) -> Dict:
+    return {
+        **(db_match.result or {}),
+        "match_id": db_match.id,
+        "filename": db_match.filename,
+        "resume_sha256": db_match.resume_sha256,
+        "overall_match": db_match.overall_match,
+        "stale": db_match.jd_revision != revision,
+        "scored_at": db_match.updated_at.isoformat() if db_match.updated_at else None,
+    }
+
+
+# ----------------------------------------------------
+# RE-SCORING
+# ----------------------------------------------------
+
+async def rescore_stale_matches(job_id: str, concurrency: int = RESUME_MATCH_CONCURRENCY) -> int:
+    """
+    Re-score the stored matches of a job whose JD changed since they were
+    scored; rows already at the current revision are left alone.
+    Meant to run as a background task. Returns how many rows were updated.
+    """
+    with SessionLocal() as db:
+        job = JobDescriptionCRUD.get_job_by_id(db, job_id)
+        if not job:
+            return 0
+        job_dict = JobDescriptionCRUD.jd_to_dict(job)
+        recorder = MatchRecorder(job_id, job_dict)
+        stale = [
+            (m.resume_sha256, m.filename, m.resume_text)
+            for m in ResumeMatchCRUD.get_stale(db, job_id, recorder.revision)
+        ]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def rescore_one(resume_sha256: str, filename: str | None, text: str) -> bool:
+        async with semaphore:
+            try:
+                result = await ascore_resume_text(text, job_dict)
+            except Exception:
+                logger.warning("Re-scoring %s for job %s failed", filename, job_id, exc_info=True)
+                return False
+        await asyncio.to_thread(recorder.save, resume_sha256, filename, text, result)
+        return True
+
+    done = await asyncio.gather(*(rescore_one(*row) for row in stale))
+    return sum(done)
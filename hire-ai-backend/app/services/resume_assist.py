@@ -1,95 +1,127 @@
 import os
-import uuid
-import tempfile
 import re
+import time
+import codecs
+import struct
 import zipfile
+import threading
+from io import BytesIO
+from typing import Callable, Dict
 
 import fitz  # PyMuPDF
+from fastapi import HTTPException, status
 from pypdf import PdfReader
 from docx import Document
+from docx.text.paragraph import Paragraph
 from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
+from app.core.config import RESUME_MAX_PAGES, RESUME_MAX_CHARS
+from app.services.legacy_doc import extract_text_from_word97
+from app.services.extraction_cache import extraction_cache, make_key, spool_upload
 
 
-UPLOAD_FOLDER = tempfile.gettempdir()
+def _docx_block_text(block, parts: list[str]) -> None:
+    """Append text of a paragraph or (possibly nested) table, in document order."""
+    if isinstance(block, Paragraph):
+        if block.text.strip():
+            parts.append(block.text.strip())
+        return
 
-def convert_docx_to_pdf(docx_path: str, pdf_path: str) -> bool:
-    try:
-        doc = Document(docx_path)
-        styles = getSampleStyleSheet()
-        story = []
+    for row in block.rows:
+        seen = set()
+        for cell in row.cells:
+            # Merged cells repeat the same element across the row
+            if id(cell._tc) in seen:
+                continue
+            seen.add(id(cell._tc))
+            for inner in cell.iter_inner_content():
+                _docx_block_text(inner, parts)
 
-        for p in doc.paragraphs:
-            if p.text.strip():
-                story.append(Paragraph(p.text, styles["Normal"]))
-                story.append(Spacer(1, 12))
 
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        story.append(Paragraph(cell.text, styles["Normal"]))
-                        story.append(Spacer(1, 12))
+def extract_text_from_docx(docx_bytes: bytes) -> str:
+    doc = Document(BytesIO(docx_bytes))
+    parts: list[str] = []
 
-        pdf = SimpleDocTemplate(pdf_path, pagesize=letter)
-        pdf.build(story)
-        return True
+    for section in doc.sections:
+        for header in (section.header, section.first_page_header):
+            if not header.is_linked_to_previous:
+                for block in header.iter_inner_content():
+                    _docx_block_text(block, parts)
 
-    except Exception as e:
-        print(f"DOCX → PDF failed: {e}")
-        return False
+    for block in doc.iter_inner_content():
+        _docx_block_text(block, parts)
 
+    for section in doc.sections:
+        if not section.footer.is_linked_to_previous:
+            for block in section.footer.iter_inner_content():
+                _docx_block_text(block, parts)
 
-def convert_pptx_to_pdf(pptx_path: str, pdf_path: str) -> bool:
-    try:
-        prs = Presentation(pptx_path)
-        pdf = fitz.open()
+    return "\n".join(parts)
+
+
+def _pptx_shape_text(shape, parts: list[str]) -> None:
+    if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+        for child in shape.shapes:
+            _pptx_shape_text(child, parts)
+        return
 
-        for slide in prs.slides:
-            page = pdf.new_page()
-            rect = fitz.Rect(50, 50, 550, 750)
+    if shape.has_text_frame and shape.text_frame.text.strip():
+        parts.append(shape.text_frame.text.strip())
 
-            slide_text = ""
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    slide_text += shape.text + "\n"
+    if getattr(shape, "has_table", False) and shape.has_table:
+        for row in shape.table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    parts.append(cell.text.strip())
 
-            page.insert_textbox(rect, slide_text, fontsize=11)
 
-        pdf.save(pdf_path)
-        pdf.close()
-        return True
+def extract_text_from_pptx(pptx_bytes: bytes) -> str:
+    prs = Presentation(BytesIO(pptx_bytes))
+    parts: list[str] = []
 
-    except Exception as e:
-        print(f"PPTX → PDF failed: {e}")
-        return False
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            _pptx_shape_text(shape, parts)
 
+    return "\n".join(parts)
 
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    doc = fitz.open(pdf_path)
+def extract_text_from_pdf(pdf_bytes: bytes) -> str:
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
     text_parts: list[str] = []
+    length = 0
 
     for page in doc:
         page_text = page.get_text()
         if isinstance(page_text, str):
             text_parts.append(page_text)
+            length += len(page_text)
+        # Later pages would be cut off anyway; don't spend time rendering them
+        if length >= RESUME_MAX_CHARS:
+            break
 
     doc.close()
     return "".join(text_parts)
 
 
-def extract_text_from_legacy_doc(doc_path: str) -> str:
+def extract_text_from_legacy_doc(raw: bytes) -> str:
+    """
+    Legacy binary .doc: read the piece table from the OLE2 container,
+    falling back to the byte-scanning heuristic for files it can't read
+    (Word 6/95, encrypted, corrupt).
+    """
+    try:
+        return extract_text_from_word97(raw)
+    except (ValueError, KeyError, struct.error):
+        return extract_text_from_doc_heuristic(raw)
+
+
+def extract_text_from_doc_heuristic(raw: bytes) -> str:
     """
     Best-effort extractor for legacy binary .doc files.
     It pulls readable text runs and filters noisy binary fragments.
     """
-    with open(doc_path, "rb") as file_pointer:
-        raw = file_pointer.read()
-
     decoded_text_candidates = []
 
     for encoding in ("utf-16le", "utf-8", "latin-1"):
@@ -116,77 +148,209 @@ def extract_text_from_legacy_doc(doc_path: str) -> str:
     return "\n".join(unique_lines)
 
 
-def extract_text_from_doc(doc_path: str) -> str:
+def extract_text_from_doc(doc_bytes: bytes) -> str:
     """
     Supports both:
     - .docx content uploaded with .doc extension
     - legacy binary .doc files (best-effort text extraction)
     """
-    if zipfile.is_zipfile(doc_path):
+    if zipfile.is_zipfile(BytesIO(doc_bytes)):
         try:
-            doc = Document(doc_path)
-            parts = [paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()]
-
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            parts.append(cell.text.strip())
-
-            text = "\n".join(parts).strip()
+            text = extract_text_from_docx(doc_bytes).strip()
             if text:
                 return text
         except Exception:
             pass
 
-    return extract_text_from_legacy_doc(doc_path)
+    return extract_text_from_legacy_doc(doc_bytes)
 
 
+def extract_text_from_txt(data: bytes) -> str:
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return data.decode("utf-16", errors="replace")
+    try:
+        return data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data.decode("latin-1")
 
-def process_uploaded_file(file) -> str:
+
+def _extract_text_from_doc_strict(doc_bytes: bytes) -> str:
+    extracted = extract_text_from_doc(doc_bytes).strip()
+    if not extracted:
+        raise RuntimeError("Could not extract text from DOC file")
+    return extracted
+
+
+# ----------------------------------------------------
+# FORMAT REGISTRY
+# ----------------------------------------------------
+
+# extension -> handler(bytes) -> text
+FORMAT_HANDLERS: Dict[str, Callable[[bytes], str]] = {}
+
+
+def register_format(*extensions: str):
+    """Register a text handler for one or more extensions, e.g. @register_format(".rtf")."""
+    def decorator(handler: Callable[[bytes], str]) -> Callable[[bytes], str]:
+        for ext in extensions:
+            FORMAT_HANDLERS[ext.lower()] = handler
+        return handler
+    return decorator
+
+
+register_format(".pdf")(extract_text_from_pdf)
+register_format(".doc")(_extract_text_from_doc_strict)
+register_format(".docx")(extract_text_from_docx)
+register_format(".pptx")(extract_text_from_pptx)
+register_format(".txt")(extract_text_from_txt)
+
+
+def file_extension(filename: str | None) -> str:
+    return os.path.splitext(filename or "")[1].lower()
+
+
+def is_supported(filename: str | None) -> bool:
+    return file_extension(filename) in FORMAT_HANDLERS
+
+
+def extract_text(filename: str, data: bytes) -> str:
     """
-    Accepts uploaded file (PDF / DOC / DOCX / PPTX)
-    Returns extracted text only
+    Extract text from raw file bytes with the handler registered for its extension.
+    Pure function of its arguments so it can run in a worker process.
     """
+    handler = FORMAT_HANDLERS.get(file_extension(filename))
+    if handler is None:
+        raise ValueError("Unsupported file type")
+    return handler(data)
 
-    original_ext = os.path.splitext(file.filename)[1].lower()
-    temp_id = str(uuid.uuid4())
 
-    original_path = os.path.join(
-        UPLOAD_FOLDER, f"input_{temp_id}{original_ext}"
-    )
+def count_pages(filename: str, data: bytes) -> int | None:
+    """Page / slide count without a full parse; None when the format has none."""
+    ext = file_extension(filename)
 
-    with open(original_path, "wb") as f:
-        f.write(file.file.read())
+    if ext == ".pdf":
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return doc.page_count
 
-    # PDF → extract directly
-    if original_ext == ".pdf":
-        return extract_text_from_pdf(original_path)
+    if ext in (".docx", ".pptx", ".doc") and zipfile.is_zipfile(BytesIO(data)):
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            names = archive.namelist()
+            if ext == ".pptx":
+                return sum(1 for name in names if re.fullmatch(r"ppt/slides/slide\d+\.xml", name))
+            if "docProps/app.xml" in names:
+                match = re.search(rb"<Pages>(\d+)</Pages>", archive.read("docProps/app.xml"))
+                return int(match.group(1)) if match else None
 
-    if original_ext == ".doc":
-        extracted = extract_text_from_doc(original_path).strip()
-        if not extracted:
-            raise RuntimeError("Could not extract text from DOC file")
-        return extracted
+    return None
 
-    # DOCX / PPTX → convert → extract
-    pdf_path = os.path.join(
-        UPLOAD_FOLDER, f"converted_{temp_id}.pdf"
-    )
 
-    if original_ext == ".docx":
-        success = convert_docx_to_pdf(original_path, pdf_path)
+class ExtractionLimitError(ValueError):
+    """The document is over RESUME_MAX_PAGES; raised before any text is extracted."""
 
-    elif original_ext == ".pptx":
-        success = convert_pptx_to_pdf(original_path, pdf_path)
 
-    else:
-        raise ValueError("Unsupported file type")
+def extract_record(filename: str, data: bytes) -> dict:
+    """
+    Extracted text plus page count and metadata, as stored in the extraction cache.
+    Text beyond RESUME_MAX_CHARS is cut off (metadata["truncated"]).
+    """
+    started = time.perf_counter()
+
+    page_count = count_pages(filename, data)
+    if page_count is not None and page_count > RESUME_MAX_PAGES:
+        raise ExtractionLimitError(
+            f"{filename} has {page_count} pages; resumes are limited to {RESUME_MAX_PAGES}"
+        )
+
+    text = extract_text(filename, data)
+    truncated = len(text) > RESUME_MAX_CHARS
+    ext = file_extension(filename)
+    return {
+        "text": text[:RESUME_MAX_CHARS],
+        "page_count": page_count,
+        "metadata": {
+            "format": ext,
+            "size": len(data),
+            "extractor": FORMAT_HANDLERS[ext].__name__,
+            "truncated": truncated,
+            "extraction_ms": round((time.perf_counter() - started) * 1000, 1),
+        },
+    }
+
+
+def limit_error(exc: ExtractionLimitError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+
+# ----------------------------------------------------
+# METRICS
+# ----------------------------------------------------
+
+class ExtractionMetrics:
+    """Per-format counters: files seen, cache hits, failures and parse time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._formats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, fmt: str, cached: bool = False, failed: bool = False, elapsed_ms: float = 0.0) -> None:
+        with self._lock:
+            counters = self._formats.setdefault(fmt, {
+                "files": 0, "cache_hits": 0, "failures": 0, "extraction_ms": 0.0,
+            })
+            counters["files"] += 1
+            counters["cache_hits"] += int(cached)
+            counters["failures"] += int(failed)
+            counters["extraction_ms"] += elapsed_ms
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {fmt: dict(counters) for fmt, counters in self._formats.items()}
 
-    if not success:
-        raise RuntimeError("Conversion to PDF failed")
 
-    return extract_text_from_pdf(pdf_path)
+extraction_metrics = ExtractionMetrics()
 
 
+# ----------------------------------------------------
+# CACHED ENTRY POINTS
+# ----------------------------------------------------
 
+def lookup_record(filename: str, sha256: str) -> dict | None:
+    record = extraction_cache.get(make_key(sha256, filename))
+    if record is not None:
+        extraction_metrics.record(file_extension(filename), cached=True)
+    return record
+
+
+def store_record(filename: str, sha256: str, record: dict) -> None:
+    extraction_cache.set(make_key(sha256, filename), record)
+    extraction_metrics.record(record["metadata"]["format"], elapsed_ms=record["metadata"]["extraction_ms"])
+
+
+def record_failure(filename: str) -> None:
+    extraction_metrics.record(file_extension(filename), failed=True)
+
+
+def cached_extract(filename: str, data: bytes, sha256: str) -> dict:
+    """extract_record, skipped entirely when these bytes were seen before."""
+    record = lookup_record(filename, sha256)
+    if record is None:
+        try:
+            record = extract_record(filename, data)
+        except ExtractionLimitError as exc:
+            record_failure(filename)
+            raise limit_error(exc)
+        except Exception:
+            record_failure(filename)
+            raise
+        store_record(filename, sha256, record)
+    return record
+
+
+def process_uploaded_file(file) -> str:
+    """
+    Accepts uploaded file (PDF / DOC / DOCX / PPTX / TXT)
+    Returns extracted text only
+    Works on the upload's bytes; nothing is written to disk.
+    """
+    data, sha256 = spool_upload(file.file, file.filename)
+    return cached_extract(file.filename, data, sha256)["text"]
@@ -0,0 +1,106 @@
+import json
+import asyncio
+import hashlib
+import zipfile
+from typing import AsyncIterator, BinaryIO, Dict, List, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+
+from app.core.config import RESUME_BULK_MAX_FILES, RESUME_MAX_UPLOAD_BYTES
+from app.services.extraction_cache import aspool_upload
+from app.services.resume_matcher import MatchSource
+
+
+# ----------------------------------------------------
+# SOURCES
+# ----------------------------------------------------
+
+def _is_junk(name: str) -> bool:
+    """Directories and OS metadata that archivers add next to real files."""
+    base = name.rsplit("/", 1)[-1]
+    return name.endswith("/") or name.startswith("__MACOSX/") or base.startswith(".") or not base
+
+
+def open_archive(fileobj: BinaryIO) -> zipfile.ZipFile:
+    try:
+        return zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Archive is not a valid ZIP file",
+        )
+
+
+def _read_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> Tuple[bytes, str]:
+    # file_size comes from the archive and can lie; cap the actual read too
+    if info.file_size > RESUME_MAX_UPLOAD_BYTES:
+        raise ValueError(f"{info.filename} exceeds the upload size limit")
+    with archive.open(info) as member:
+        data = member.read(RESUME_MAX_UPLOAD_BYTES + 1)
+    if len(data) > RESUME_MAX_UPLOAD_BYTES:
+        raise ValueError(f"{info.filename} exceeds the upload size limit")
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def zip_sources(archive: zipfile.ZipFile) -> List[MatchSource]:
+    """One source per file in the archive; members are decompressed only when read."""
+    members = [info for info in archive.infolist() if not _is_junk(info.filename)]
+    if len(members) > RESUME_BULK_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Archive holds {len(members)} files; the limit is {RESUME_BULK_MAX_FILES}",
+        )
+
+    def reader(info: zipfile.ZipInfo):
+        return lambda: asyncio.to_thread(_read_member, archive, info)
+
+    return [(info.filename, reader(info)) for info in members]
+
+
+def upload_sources(files: List[UploadFile]) -> List[MatchSource]:
+    def reader(file: UploadFile):
+        return lambda: aspool_upload(file)
+
+    return [(file.filename, reader(file)) for file in files]
+
+
+# ----------------------------------------------------
+# NDJSON
+# ----------------------------------------------------
+
+async def ndjson_match_stream(
+    results: AsyncIterator[Dict],
+    total: int,
+    header: Dict,
+    ranking_keys: Tuple[str, ...] = ("index", "filename"),
+) -> AsyncIterator[str]:
+    """
+    NDJSON lines: {"event": "start", ...header}, one {"event": "match", ...}
+    per result as it completes, then {"event": "done"} with the counts and
+    the final ranking (ranking_keys + overall_match, best first).
+    """
+    yield json.dumps({"event": "start", **header, "total_resumes": total}) + "\n"
+
+    errors = 0
+    ranking = []
+    async for result in results:
+        if "error" in result:
+            errors += 1
+        else:
+            ranking.append({
+                **{k: result.get(k) for k in ranking_keys},
+                "overall_match": result.get("overall_match"),
+                "scored_by": result.get("scored_by", "llm"),
+            })
+        yield json.dumps({"event": "match", **result}, default=str) + "\n"
+
+    # LLM scores outrank local prescores: the shortlist was chosen before them
+    ranking.sort(key=lambda r: (r["scored_by"] == "llm", _as_score(r["overall_match"])), reverse=True)
+    yield json.dumps({"event": "done", "total_resumes": total, "errors": errors, "ranking": ranking}, default=str) + "\n"
+
+
+def _as_score(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return -1.0
@@ -1,17 +1,36 @@
-import os
 import json
-import time
-import re
-import requests
+import asyncio
+import hashlib
 from fastapi import HTTPException, UploadFile
-from typing import List, Dict
-
-from app.services.resume_assist import process_uploaded_file as resume_text_extract
-
-api_key = os.getenv("GROQ_API_KEY")
-api_url = "https://api.groq.com/openai/v1/chat/completions"
-
-EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Tuple
+
+from app.services.resume_assist import process_uploaded_file as resume_text_extract, is_supported
+from app.services.llm import (
+    chat_completion,
+    achat_completion,
+    count_tokens,
+    compact_whitespace,
+    compact_json,
+    fit_sections,
+    sections_in_order,
+)
+from app.services.resume_prescore import prescore_resumes, split_skills
+from app.services.skill_taxonomy import skill_taxonomy
+from app.services.extraction_pool import extraction_pool
+from app.services.extraction_cache import aspool_upload
+from app.services.resume_preparse import EMAIL_PATTERN, split_sections
+from app.core.config import RESUME_MATCH_CONCURRENCY, RESUME_MATCH_TOKEN_BUDGET
+
+# What the scorer reads first when a resume has to be cut to the budget
+MATCH_SECTION_ORDER = ("header", "skills", "experience", "summary", "education", "certifications", "projects")
+MATCH_SKIPPED_SECTIONS = {"hobbies", "references", "declaration", "personal"}
+
+# Bookkeeping fields of jd_to_dict() that do not change how a resume scores
+JD_NON_SCORING_FIELDS = ("id", "user_id", "created_at", "updated_at")
+
+# (filename, read) where read() returns (data, sha256); it is only awaited
+# once a concurrency slot is free, so queued resumes hold no memory.
+MatchSource = Tuple[str, Callable[[], Awaitable[Tuple[bytes, str]]]]
 
 
 # ----------------------------------------------------
@@ -25,12 +44,48 @@ def extract_email_from_text(text: str) -> str | None:
     return match.group(0).strip() if match else None
 
 
+def budget_resume_text(text: str, max_tokens: int = RESUME_MATCH_TOKEN_BUDGET) -> str:
+    """
+    Whitespace-compacted resume text within max_tokens. Over the budget,
+    irrelevant sections are dropped and the rest kept in MATCH_SECTION_ORDER
+    until the budget runs out.
+    """
+    compacted = compact_whitespace(text)
+    if count_tokens(compacted) <= max_tokens:
+        return compacted
+
+    sections = sections_in_order(split_sections(compacted), MATCH_SECTION_ORDER, MATCH_SKIPPED_SECTIONS)
+    return fit_sections(sections, max_tokens)
+
+
+def jd_scoring_fields(jd: Dict) -> Dict:
+    return {k: v for k, v in jd.items() if k not in JD_NON_SCORING_FIELDS}
+
+
+def jd_revision(jd: Dict) -> str:
+    """Content hash of what the scorer sees of a JD; changes whenever a score could."""
+    canonical = json.dumps(jd_scoring_fields(jd), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 # ----------------------------------------------------
 # PROMPT (STRICT + CONTROLLED)
 # ----------------------------------------------------
 
+def skill_evidence(resume: str, jd_skills) -> Dict[str, str]:
+    """Taxonomy verdict for each JD skill it knows; unknown skills are left to the LLM."""
+    verdicts = skill_taxonomy.compare(split_skills(jd_skills), resume)
+    return {skill: status for skill, status in verdicts.items() if status}
+
+
 def build_prompt(resume: str, jd: dict) -> str:
     jd_skills = jd.get("skills", [])
+    evidence = skill_evidence(resume, jd_skills)
+    evidence_block = f"""
+Skill Evidence (from a synonym dictionary over the full resume; "matched" is reliable,
+re-check "partial" / "missing" for equivalents it may not know):
+{compact_json(evidence)}
+""" if evidence else ""
 
     return f"""
 You are an ATS resume evaluation engine.
@@ -77,13 +132,13 @@ INPUT
 -----------------------------------
 
 Job Description:
-{json.dumps(jd, indent=2)}
+{compact_json(jd_scoring_fields(jd))}
 
 Job Description Skills (SOURCE OF TRUTH):
-{json.dumps(jd_skills, indent=2)}
-
+{compact_json(jd_skills)}
+{evidence_block}
 Resume:
-{resume}
+{budget_resume_text(resume)}
 
 -----------------------------------
 STRICT RULES (READ CAREFULLY)
@@ -162,6 +217,78 @@ VALIDATION
 """
 
 
+# ----------------------------------------------------
+# LLM SCORING
+# ----------------------------------------------------
+
+LLM_OPTIONS = {
+    "temperature": 0.2,
+    "max_tokens": 1400,
+    "timeout": 30,
+    "retries": 2,
+    "cache_feature": "resume_match",
+}
+
+
+def build_messages(resume_text: str, job_description: Dict) -> List[Dict]:
+    return [
+        {
+            "role": "system",
+            "content": "You are a strict ATS resume evaluator. Return only JSON."
+        },
+        {
+            "role": "user",
+            "content": build_prompt(resume_text, job_description)
+        }
+    ]
+
+
+def parse_match_result(content: str, resume_text: str) -> Dict:
+    try:
+        parsed_result = json.loads(content)
+    except json.JSONDecodeError:
+        raise HTTPException(
+            status_code=500,
+            detail="LLM returned invalid JSON",
+        )
+
+    if isinstance(parsed_result, dict):
+        llm_email = str(parsed_result.get("email") or "").strip() or None
+        parsed_result["email"] = llm_email or extract_email_from_text(resume_text)
+
+    return parsed_result
+
+
+def score_resume_text(resume_text: str, job_description: Dict) -> Dict:
+    try:
+        content = chat_completion(
+            build_messages(resume_text, job_description),
+            **LLM_OPTIONS,
+        )
+    except HTTPException as exc:
+        raise HTTPException(
+            status_code=exc.status_code,
+            detail=f"Groq API error: {exc.detail}",
+        )
+
+    return parse_match_result(content, resume_text)
+
+
+async def ascore_resume_text(resume_text: str, job_description: Dict) -> Dict:
+    try:
+        content = await achat_completion(
+            build_messages(resume_text, job_description),
+            **LLM_OPTIONS,
+        )
+    except HTTPException as exc:
+        raise HTTPException(
+            status_code=exc.status_code,
+            detail=f"Groq API error: {exc.detail}",
+        )
+
+    return parse_match_result(content, resume_text)
+
+
 # ----------------------------------------------------
 # MAIN MATCH FUNCTION
 # ----------------------------------------------------
@@ -175,70 +302,230 @@ def match_resumes(
 
     for resume in resumes:
         parsed_resume_text = resume_text_extract(resume)
-        extracted_email = extract_email_from_text(parsed_resume_text)
-
-        prompt = build_prompt(parsed_resume_text, job_description)
-
-        payload = {
-            "model": "llama-3.1-8b-instant",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a strict ATS resume evaluator. Return only JSON."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.2,
-            "max_tokens": 1400,
-        }
+        results.append(score_resume_text(parsed_resume_text, job_description))
+
+    return results
 
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
 
-        for attempt in range(3):
-            response = requests.post(
-                api_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+def _error_result(filename: str | None, exc: Exception) -> Dict:
+    detail = exc.detail if isinstance(exc, HTTPException) else exc
+    return {"filename": filename, "error": str(detail)}
 
-            if response.status_code != 429:
-                break
 
-            time.sleep(2 ** attempt)
+def _local_result(filename: str | None, resume_text: str, prescore: Dict) -> Dict:
+    return {
+        "filename": filename,
+        "email": extract_email_from_text(resume_text),
+        "overall_match": prescore["prescore"],
+        "years_of_experience": prescore["years_of_experience"],
+        "skill_breakdown": prescore["skill_breakdown"],
+        "skills": prescore["skills"],
+        "prescore": prescore["prescore"],
+        "scored_by": "local",
+    }
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Groq API error: {response.text}",
-            )
 
-        content = response.json()["choices"][0]["message"]["content"]
+async def _extract_upload(resume: UploadFile) -> Tuple[str, str]:
+    """(text, sha256) of an upload; the hash keys both caches and stored matches."""
+    data, sha256 = await aspool_upload(resume)
+    record = await extraction_pool.extract_bytes_record(resume.filename, data, sha256)
+    return record["text"], sha256
 
-        try:
-            parsed_result = json.loads(content)
 
-            if isinstance(parsed_result, dict):
-                llm_email = str(parsed_result.get("email") or "").strip() or None
-                parsed_result["email"] = llm_email or extracted_email
+async def _score(filename: str | None, text: str, sha256: str, job_description: Dict, recorder=None) -> Dict:
+    """
+    ascore_resume_text, skipped when the recorder already holds a score
+    for this resume at the current JD revision, and stored afterwards.
+    """
+    if recorder is not None:
+        stored = await asyncio.to_thread(recorder.lookup, sha256)
+        if stored is not None:
+            return stored
 
-            results.append(parsed_result)
+    result = await ascore_resume_text(text, job_description)
+    if recorder is not None:
+        await asyncio.to_thread(recorder.save, sha256, filename, text, result)
+    return result
 
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=500,
-                detail="LLM returned invalid JSON",
-            )
+
+async def amatch_resumes(
+    resumes: List[UploadFile],
+    job_description: Dict,
+    concurrency: int = RESUME_MATCH_CONCURRENCY,
+    top_k: int | None = None,
+    min_prescore: float | None = None,
+    recorder=None,
+) -> List[Dict]:
+    """
+    Concurrent variant of match_resumes.
+    Text extraction runs in worker processes, LLM calls overlap up to
+    `concurrency` at a time. Results keep input order; a resume that
+    fails comes back as {"filename", "error"} instead of failing the batch.
+
+    With top_k and/or min_prescore, every resume is first ranked by the
+    local prescorer and only the shortlist is sent to the LLM; the rest
+    return their local score (scored_by="local").
+
+    With a recorder (see match_store.MatchRecorder), LLM scores are
+    persisted and reused for resumes already scored against this JD.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    if top_k is None and min_prescore is None:
+        async def match_one(resume: UploadFile) -> Dict:
+            async with semaphore:
+                try:
+                    text, sha256 = await _extract_upload(resume)
+                    return await _score(resume.filename, text, sha256, job_description, recorder)
+                except Exception as exc:
+                    return _error_result(resume.filename, exc)
+
+        return list(await asyncio.gather(*(match_one(r) for r in resumes)))
+
+    async def extract_one(resume: UploadFile) -> Tuple[str, str] | Dict:
+        async with semaphore:
+            try:
+                return await _extract_upload(resume)
+            except Exception as exc:
+                return _error_result(resume.filename, exc)
+
+    results: List = list(await asyncio.gather(*(extract_one(r) for r in resumes)))
+    extracted = {i: item for i, item in enumerate(results) if isinstance(item, tuple)}
+    texts = {i: text for i, (text, _) in extracted.items()}
+
+    prescores = prescore_resumes(list(texts.values()), job_description)
+    ranked = sorted(zip(texts.keys(), prescores), key=lambda pair: pair[1]["prescore"], reverse=True)
+
+    shortlist = []
+    for rank, (i, prescore) in enumerate(ranked):
+        if top_k is not None and rank >= top_k:
+            break
+        if min_prescore is not None and prescore["prescore"] < min_prescore:
+            break
+        shortlist.append((i, prescore))
+
+    for i, prescore in ranked[len(shortlist):]:
+        results[i] = _local_result(resumes[i].filename, texts[i], prescore)
+
+    async def score_one(i: int, prescore: Dict) -> Dict:
+        text, sha256 = extracted[i]
+        async with semaphore:
+            try:
+                result = await _score(resumes[i].filename, text, sha256, job_description, recorder)
+            except Exception as exc:
+                return _error_result(resumes[i].filename, exc)
+        if isinstance(result, dict):
+            result["prescore"] = prescore["prescore"]
+            result["scored_by"] = "llm"
+        return result
+
+    scored = await asyncio.gather(*(score_one(i, p) for i, p in shortlist))
+    for (i, _), result in zip(shortlist, scored):
+        results[i] = result
 
     return results
 
 
+async def _as_completed(coros: List[Awaitable[Dict]]) -> AsyncIterator[Dict]:
+    """Yield results in completion order; pending work is cancelled if the consumer stops."""
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Client went away: stop the work still queued
+        for task in tasks:
+            task.cancel()
+
+
+async def amatch_sources(
+    sources: List[MatchSource],
+    job_description: Dict,
+    concurrency: int = RESUME_MATCH_CONCURRENCY,
+    recorder=None,
+) -> AsyncIterator[Dict]:
+    """
+    Score every source against the JD, yielding each result as soon as it
+    is ready (completion order, tagged with its input index). At most
+    `concurrency` resumes are read, extracted or scored at a time.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def match_one(index: int, filename: str, read) -> Dict:
+        async with semaphore:
+            try:
+                if not is_supported(filename):
+                    raise ValueError("Unsupported file type")
+                data, sha256 = await read()
+                record = await extraction_pool.extract_bytes_record(filename, data, sha256)
+                del data
+                result = await _score(filename, record["text"], sha256, job_description, recorder)
+            except Exception as exc:
+                result = _error_result(filename, exc)
+
+        if not isinstance(result, dict):
+            result = {"result": result}
+        result.setdefault("filename", filename)
+        result["index"] = index
+        return result
+
+    async for result in _as_completed([match_one(i, name, read) for i, (name, read) in enumerate(sources)]):
+        yield result
+
+
+async def amatch_texts(
+    items: List[Tuple[Dict, str]],
+    job_description: Dict,
+    concurrency: int = RESUME_MATCH_CONCURRENCY,
+    top_k: int | None = None,
+    min_prescore: float | None = None,
+    recorder=None,
+) -> AsyncIterator[Dict]:
+    """
+    amatch_sources for resume text that is already at hand, e.g. built
+    from stored profiles. Each item is (meta, text); meta is merged into
+    the item's result. top_k / min_prescore shortlist with the local
+    prescorer as in amatch_resumes; the rest are yielded first, scored_by="local".
+    """
+    texts = [text for _, text in items]
+    prescores = prescore_resumes(texts, job_description) if texts else []
+    ranked = sorted(range(len(items)), key=lambda i: prescores[i]["prescore"], reverse=True)
+
+    shortlist = []
+    for rank, i in enumerate(ranked):
+        if top_k is not None and rank >= top_k:
+            break
+        if min_prescore is not None and prescores[i]["prescore"] < min_prescore:
+            break
+        shortlist.append(i)
+
+    for i in ranked[len(shortlist):]:
+        result = _local_result(None, texts[i], prescores[i])
+        result.pop("filename")
+        yield {**result, **items[i][0]}
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def score_one(i: int) -> Dict:
+        meta, text = items[i]
+        sha256 = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        async with semaphore:
+            try:
+                result = await _score(meta.get("filename"), text, sha256, job_description, recorder)
+            except Exception as exc:
+                result = _error_result(meta.get("filename"), exc)
+                result.pop("filename")
+        if not isinstance(result, dict):
+            result = {"result": result}
+        result["prescore"] = prescores[i]["prescore"]
+        if "error" not in result:
+            result["scored_by"] = "llm"
+        return {**result, **meta}
+
+    async for result in _as_completed([score_one(i) for i in shortlist]):
+        yield result
+
+
 
 
 
@@ -1,80 +1,224 @@
-import os
 import json
-import requests
+import asyncio
 from fastapi import HTTPException, UploadFile
 
+from app.core.config import RESUME_PARSE_TOKEN_BUDGET, RESUME_PARSE_CHUNK_TOKENS
 from app.services.resume_assist import process_uploaded_file as resume_text_extract
+from app.services.llm import (
+    chat_completion,
+    achat_completion,
+    count_tokens,
+    compact_whitespace,
+    chunk_sections,
+    sections_in_order,
+)
+from app.services.extraction_pool import extraction_pool
+from app.services.resume_preparse import preparse_resume, strip_contact_fields, total_years_from_ranges
 
-api_key = os.getenv("GROQ_API_KEY")
-api_url = "https://api.groq.com/openai/v1/chat/completions"
+# Sections that never feed a field of the output schema
+SKIPPED_SECTIONS = {"hobbies", "references", "declaration"}
 
+# Fields whose values are lists of records, concatenated across chunks
+LIST_FIELDS = ("education", "work_experience", "certifications")
+
+
+def build_messages(resume_text: str, preparsed: dict | None = None, part: tuple | None = None) -> list:
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a resume parsing expert. "
+                "Extract structured information from resumes. "
+                "Return ONLY valid JSON. No markdown. No explanations."
+                "Take your time, extract thoroughly and give correct data"
+            ),
+        },
+        {"role": "user", "content": build_prompt(resume_text, preparsed, part)},
+    ]
 
-def parse_resume(file: UploadFile) -> dict:
-    resume_text: str = resume_text_extract(file)
 
-    if not api_key:
+LLM_OPTIONS = {
+    "temperature": 0.1,
+    "max_tokens": 1800,
+    "timeout": 30,
+    "cache_feature": "resume_parse",
+}
+
+
+def parse_llm_json(content: str) -> dict:
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
         raise HTTPException(
             status_code=500,
-            detail="Groq API key not configured",
+            detail="LLM returned invalid JSON",
         )
 
-    prompt = build_prompt(resume_text)
-
-    payload = {
-        "model": "llama-3.1-8b-instant",
-        "messages": [
-            {
-                "role": "system",
-                "content": (
-                    "You are a resume parsing expert. "
-                    "Extract structured information from resumes. "
-                    "Return ONLY valid JSON. No markdown. No explanations."
-                    "Take your time, extract thoroughly and give correct data"
-                ),
-            },
-            {"role": "user", "content": prompt},
-        ],
-        "temperature": 0.1,
-        "max_tokens": 2000,
-    }
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
+def llm_sections(preparsed: dict) -> list:
+    """(HEADING, body) pairs for the LLM: relevant sections, compacted, contact fields removed."""
+    return [
+        (heading, compact_whitespace(strip_contact_fields(body, preparsed)))
+        for heading, body in sections_in_order(preparsed["sections"], skip=SKIPPED_SECTIONS)
+    ]
+
+
+def build_llm_text(preparsed: dict) -> str:
+    """Resume text for the LLM as one block."""
+    return "\n\n".join(f"{h}\n{b}" if h else b for h, b in llm_sections(preparsed) if b)
+
+
+def plan_chunks(preparsed: dict) -> list:
+    """
+    One chunk when the resume fits RESUME_PARSE_TOKEN_BUDGET, otherwise
+    section-aligned chunks of RESUME_PARSE_CHUNK_TOKENS parsed separately.
+    """
+    text = build_llm_text(preparsed)
+    if count_tokens(text) <= RESUME_PARSE_TOKEN_BUDGET:
+        return [text]
+    return chunk_sections(llm_sections(preparsed), RESUME_PARSE_CHUNK_TOKENS) or [text]
+
+
+def _dedupe_key(item) -> str:
+    if isinstance(item, dict):
+        item = {k: str(v).strip().lower() for k, v in item.items()}
+    return json.dumps(item, sort_keys=True)
+
+
+def merge_chunk_results(results: list) -> dict:
+    """
+    Reduce per-chunk parses into one: first non-empty scalar wins,
+    record lists are concatenated (duplicates dropped), skills and
+    languages are unioned, experience years take the largest estimate.
+    """
+    merged: dict = {}
+    skills: dict = {}  # lowercased -> first spelling, insertion-ordered
+    years: list = []
+
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        for field, value in result.items():
+            if field in LIST_FIELDS:
+                items = value if isinstance(value, list) else []
+                seen = {_dedupe_key(i) for i in merged.get(field, [])}
+                merged.setdefault(field, [])
+                for item in items:
+                    if isinstance(item, dict) and not any(str(v).strip() for v in item.values()):
+                        continue
+                    if _dedupe_key(item) not in seen:
+                        seen.add(_dedupe_key(item))
+                        merged[field].append(item)
+            elif field == "skills":
+                values = value if isinstance(value, list) else str(value or "").split(",")
+                for skill in (str(v).strip() for v in values):
+                    if skill:
+                        skills.setdefault(skill.lower(), skill)
+            elif field == "total_years_experience":
+                try:
+                    years.append(float(str(value).split()[0]))
+                except (ValueError, IndexError):
+                    pass
+            elif isinstance(value, dict):
+                target = merged.setdefault(field, {})
+                if isinstance(target, dict):
+                    for key, inner in value.items():
+                        if str(inner or "").strip() and not str(target.get(key) or "").strip():
+                            target[key] = inner
+            elif str(value or "").strip() and not str(merged.get(field) or "").strip():
+                merged[field] = value
+
+    merged["skills"] = ", ".join(skills.values())
+    merged["total_years_experience"] = f"{max(years):g}" if years else ""
+    return merged
+
+
+def merge_preparsed(result: dict, preparsed: dict) -> dict:
+    """Fill the deterministic fields back into the LLM result."""
+    if not isinstance(result, dict):
+        return result
+
+    for field in ("email", "phone"):
+        result[field] = preparsed[field] or result.get(field, "")
+
+    profiles = result.get("profiles") if isinstance(result.get("profiles"), dict) else {}
+    result["profiles"] = {
+        "linkedin": preparsed["linkedin"] or profiles.get("linkedin", ""),
+        "github": preparsed["github"] or profiles.get("github", ""),
     }
 
-    try:
-        response = requests.post(
-            api_url,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
+    if not str(result.get("total_years_experience") or "").strip() and preparsed["date_ranges"]:
+        result["total_years_experience"] = str(total_years_from_ranges(preparsed["date_ranges"]))
+    return result
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=response.text,
-            )
 
-        content = response.json()["choices"][0]["message"]["content"]
+def _reduce(contents: list, preparsed: dict) -> dict:
+    results = [parse_llm_json(content) for content in contents]
+    if len(results) == 1:
+        return merge_preparsed(results[0], preparsed)
 
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            raise HTTPException(
-                status_code=500,
-                detail="LLM returned invalid JSON",
-            )
+    result = merge_chunk_results(results)
+    # No single chunk saw the whole history; the date ranges did
+    if preparsed["date_ranges"]:
+        result["total_years_experience"] = ""
+    return merge_preparsed(result, preparsed)
 
-    except requests.RequestException as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Groq API request failed: {exc}",
-        )
 
+def parse_resume_text(resume_text: str) -> dict:
+    preparsed = preparse_resume(resume_text)
+    chunks = plan_chunks(preparsed)
+    contents = [
+        chat_completion(build_messages(chunk, preparsed, (i, len(chunks))), **LLM_OPTIONS)
+        for i, chunk in enumerate(chunks, start=1)
+    ]
+    return _reduce(contents, preparsed)
+
+
+async def aparse_resume_text(resume_text: str) -> dict:
+    """Async parse_resume_text: the chunks of a long resume are parsed concurrently."""
+    preparsed = preparse_resume(resume_text)
+    chunks = plan_chunks(preparsed)
+    contents = await asyncio.gather(*(
+        achat_completion(build_messages(chunk, preparsed, (i, len(chunks))), **LLM_OPTIONS)
+        for i, chunk in enumerate(chunks, start=1)
+    ))
+    return _reduce(list(contents), preparsed)
+
+
+def parse_resume(file: UploadFile) -> dict:
+    return parse_resume_text(resume_text_extract(file))
+
+
+async def aparse_resume(file: UploadFile) -> dict:
+    """Async parse_resume: extraction runs in the process pool."""
+    return await aparse_resume_text(await extraction_pool.extract_upload(file))
+
+
+def contact_schema(preparsed: dict | None) -> str:
+    """Schema lines only for the contact fields regex did not find."""
+    preparsed = preparsed or {}
+    lines = [f'  "{field}": "",' for field in ("email", "phone") if not preparsed.get(field)]
+
+    profiles = [f'    "{field}": ""' for field in ("linkedin", "github") if not preparsed.get(field)]
+    if profiles:
+        lines.append('  "profiles": {    # LIST PROFILES THAT ARE MENTIONED IN RESUME TEXT')
+        lines.append(",\n".join(profiles))
+        lines.append("  },")
+    return "\n".join(lines)
 
-def build_prompt(text: str) -> str:
+
+def part_note(part: tuple | None) -> str:
+    """Instruction for one chunk of a resume parsed in several parts."""
+    if not part or part[1] <= 1:
+        return ""
+    index, total = part
+    return (
+        f"\nThe resume text below is PART {index} OF {total} of one resume.\n"
+        "Extract ONLY what appears in this part; leave every other field empty.\n"
+    )
+
+
+def build_prompt(text: str, preparsed: dict | None = None, part: tuple | None = None) -> str:
     return f"""
 MUST respond with ONLY valid JSON.
 NO markdown.
@@ -86,9 +230,8 @@ Return JSON in EXACTLY this format:
 {{
   "first_name": "",
   "last_name": "",
-  "email": "",
+{contact_schema(preparsed)}
   "title": "",
-  "phone": "",
   "location": "",
   "skills": "",
   "profile_summary": "",  # MUST TAKE WHOLE SUMMARY FROM RESUME TEXT
@@ -96,10 +239,6 @@ Return JSON in EXACTLY this format:
   "notice_period": "",
   "expected_salary": "",
   "preferred_mode": "",
-  "profiles": {{
-    "linkedin": "",    # LIST PROFILES THAT ARE MENTIONED IN RESUME TEXT
-    "github": ""
-  }},
   "languages": {{
     "english": "",    # LIST LANGUAGES THAT ARE MENTIONED IN RESUME TEXT
     "hindi": ""
@@ -148,7 +287,7 @@ WORK EXPERIENCE DATE RULES:
 - If a year is present but the month is NOT mentioned, set the month to "January".
 - If the role is current, set end_month and end_year as empty strings.
 - Do not infer dates that do not exist.
-
+{part_note(part)}
 Resume Text:
 {text}
 """.strip()
\ No newline at end of file
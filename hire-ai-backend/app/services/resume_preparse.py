@@ -0,0 +1,207 @@
+import re
+from datetime import datetime
+from typing import Dict, List
+
+
+# ----------------------------------------------------
+# PATTERNS
+# ----------------------------------------------------
+
+EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE_PATTERN = re.compile(r"(?<![\w/])\+?\(?\d[\d\s().-]{7,18}\d(?![\w/])")
+LINKEDIN_PATTERN = re.compile(
+    r"(?:https?://)?(?:[a-z]{2,3}\.)?linkedin\.com/(?:in|pub)/[A-Za-z0-9_%-]+/?",
+    re.IGNORECASE,
+)
+GITHUB_PATTERN = re.compile(r"(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9-]+/?", re.IGNORECASE)
+
+MONTHS = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+]
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+
+
+def _date(prefix: str) -> str:
+    """"Mar 2019", "March, 2019", "03/2019" or "2019", as named groups."""
+    return (
+        rf"(?:(?P<{prefix}_month>{_MONTH})\s*[,'’]?\s*|(?P<{prefix}_num>\d{{1,2}})\s*/\s*)?"
+        rf"(?P<{prefix}_year>(?:19|20)\d{{2}})"
+    )
+
+
+DATE_RANGE_PATTERN = re.compile(
+    _date("start")
+    + r"\s*(?:-|–|—|to|till|until)\s*"
+    + rf"(?:(?P<current>present|current|now|till date|date|ongoing)|{_date('end')})",
+    re.IGNORECASE,
+)
+
+# Canonical section -> headings seen in resumes
+SECTION_HEADINGS = {
+    "summary": [
+        "summary", "profile", "professional summary", "profile summary", "career summary",
+        "objective", "career objective", "about me",
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "employment",
+        "employment history", "work history", "career history", "professional background",
+    ],
+    "education": [
+        "education", "academic background", "academic qualifications", "qualifications",
+        "educational qualifications", "education and training",
+    ],
+    "certifications": [
+        "certifications", "certification", "certificates", "licenses and certifications",
+        "licenses & certifications", "courses", "trainings and certifications",
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core competencies", "technologies",
+        "skills and tools", "tools and technologies",
+    ],
+    "projects": ["projects", "key projects", "academic projects", "personal projects"],
+    "languages": ["languages", "languages known"],
+    "personal": ["personal details", "personal information", "personal profile"],
+    "achievements": ["achievements", "awards", "honors", "honours", "accomplishments"],
+    "hobbies": ["hobbies", "interests", "hobbies and interests", "hobbies & interests", "extracurricular activities"],
+    "references": ["references", "referees"],
+    "declaration": ["declaration"],
+}
+
+HEADING_LOOKUP = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+HEADING_STRIP = " \t:-–—•*#|_"
+
+
+# ----------------------------------------------------
+# SECTIONS
+# ----------------------------------------------------
+
+def _heading_section(line: str) -> str | None:
+    candidate = re.sub(r"\s+", " ", line.strip(HEADING_STRIP)).lower()
+    if not candidate or len(candidate) > 40:
+        return None
+    return HEADING_LOOKUP.get(candidate)
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """
+    Split resume text on recognised headings.
+    Text before the first heading is returned as "header"; a repeated
+    heading appends to its section.
+    """
+    sections: Dict[str, List[str]] = {"header": []}
+    current = "header"
+
+    for line in (text or "").splitlines():
+        section = _heading_section(line)
+        if section:
+            current = section
+            sections.setdefault(current, [])
+            continue
+        sections[current].append(line)
+
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
+
+
+# ----------------------------------------------------
+# FIELDS
+# ----------------------------------------------------
+
+def extract_phone(text: str) -> str:
+    for match in PHONE_PATTERN.finditer(text or ""):
+        candidate = match.group(0).strip()
+        digits = re.sub(r"\D", "", candidate)
+        # Rejects year ranges like 2015-2020 and short numbers
+        if 10 <= len(digits) <= 15 and not DATE_RANGE_PATTERN.fullmatch(candidate):
+            return candidate
+    return ""
+
+
+def _first(pattern: re.Pattern, text: str) -> str:
+    match = pattern.search(text or "")
+    return match.group(0).rstrip("/") if match else ""
+
+
+def _month_name(token: str | None, number: str | None) -> str:
+    if token:
+        prefix = token.lower()[:3]
+        return next((m.capitalize() for m in MONTHS if m.startswith(prefix)), "")
+    if number and 1 <= int(number) <= 12:
+        return MONTHS[int(number) - 1].capitalize()
+    return ""
+
+
+def extract_date_ranges(text: str) -> List[Dict]:
+    ranges = []
+    for match in DATE_RANGE_PATTERN.finditer(text or ""):
+        current = bool(match.group("current"))
+        ranges.append({
+            "start_month": _month_name(match.group("start_month"), match.group("start_num")),
+            "start_year": match.group("start_year"),
+            "end_month": "" if current else _month_name(match.group("end_month"), match.group("end_num")),
+            "end_year": "" if current else (match.group("end_year") or ""),
+            "current": current,
+        })
+    return ranges
+
+
+def total_years_from_ranges(ranges: List[Dict]) -> float:
+    """Years covered by the union of the ranges (overlapping roles count once)."""
+    now = datetime.now()
+    spans = []
+    for r in ranges:
+        start = int(r["start_year"]) * 12 + (MONTHS.index(r["start_month"].lower()) if r["start_month"] else 0)
+        if r["current"]:
+            end = now.year * 12 + now.month - 1
+        elif r["end_year"]:
+            end = int(r["end_year"]) * 12 + (MONTHS.index(r["end_month"].lower()) if r["end_month"] else 11)
+        else:
+            continue
+        if end >= start:
+            spans.append((start, end))
+
+    months = 0
+    last_end = None
+    for start, end in sorted(spans):
+        if last_end is not None and start <= last_end:
+            if end > last_end:
+                months += end - last_end
+                last_end = end
+            continue
+        months += end - start + 1
+        last_end = end
+    return round(months / 12, 1)
+
+
+# ----------------------------------------------------
+# PRE-PARSE
+# ----------------------------------------------------
+
+def preparse_resume(text: str) -> Dict:
+    """
+    Everything about a resume that does not need the LLM:
+    contact fields, work date ranges and the section split.
+    Date ranges come from the Experience section only; without one
+    there is no telling roles from degrees ("2015 – 2019 B.Sc."), so
+    none are returned and the LLM's estimate of the years stands.
+    """
+    sections = split_sections(text)
+    experience = sections.get("experience", "")
+
+    return {
+        "email": _first(EMAIL_PATTERN, text),
+        "phone": extract_phone(sections.get("header") or text) or extract_phone(text),
+        "linkedin": _first(LINKEDIN_PATTERN, text),
+        "github": _first(GITHUB_PATTERN, text),
+        "date_ranges": extract_date_ranges(experience),
+        "sections": sections,
+    }
+
+
+def strip_contact_fields(text: str, preparsed: Dict) -> str:
+    """Remove the values already extracted so the LLM does not re-read them."""
+    for field in ("email", "phone", "linkedin", "github"):
+        value = preparsed.get(field)
+        if value:
+            text = text.replace(value, "")
+    return text
@@ -0,0 +1,187 @@
+import re
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.skill_taxonomy import skill_taxonomy
+
+
+# ----------------------------------------------------
+# CONFIG
+# ----------------------------------------------------
+
+# Years expected for a JobDescription.level
+LEVEL_YEARS = {
+    "entry": 0,
+    "junior": 1,
+    "mid": 3,
+    "senior": 6,
+    "lead": 10,
+    "principal": 10,
+}
+
+# Prescore weights, mirroring the matcher prompt (skills dominate)
+WEIGHTS = {"skills": 0.7, "experience": 0.2, "relevance": 0.1}
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+SKILL_SPLIT_PATTERN = re.compile(r"[,;\n|•]+")
+YEARS_PATTERN = re.compile(r"(\d{1,2}(?:\.\d)?)\s*\+?\s*(?:years?|yrs?)", re.IGNORECASE)
+DATE_RANGE_PATTERN = re.compile(
+    r"((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|till date)",
+    re.IGNORECASE,
+)
+
+
+# ----------------------------------------------------
+# TEXT NORMALISATION
+# ----------------------------------------------------
+
+SKILL_TOKEN_PREFIX = "skill:"
+
+
+def _words(text: str) -> List[str]:
+    return [token.rstrip(".-/") for token in TOKEN_PATTERN.findall((text or "").lower())]
+
+
+def tokenize(text: str) -> List[str]:
+    """Plain word tokens plus one "skill:<id>" token per taxonomy mention, so aliases share a term."""
+    skills = [SKILL_TOKEN_PREFIX + skill_id for skill_id, _, _ in skill_taxonomy.find(text or "")]
+    return _words(text) + skills
+
+
+def skill_terms(skill: str) -> List[str]:
+    """BM25 query terms for one JD skill: its canonical id, else its words."""
+    skill_id = skill_taxonomy.canonical(skill)
+    return [SKILL_TOKEN_PREFIX + skill_id] if skill_id else _words(skill)
+
+
+def split_skills(skills) -> List[str]:
+    """JobDescription.skills is free text; accept a string or a list."""
+    if not skills:
+        return []
+    if isinstance(skills, str):
+        skills = SKILL_SPLIT_PATTERN.split(skills)
+    return [s.strip() for s in skills if s and s.strip()]
+
+
+# ----------------------------------------------------
+# EXPERIENCE
+# ----------------------------------------------------
+
+def estimate_years_of_experience(text: str) -> float:
+    """Largest explicit "N years", else the span covered by date ranges."""
+    explicit = [float(m) for m in YEARS_PATTERN.findall(text or "")]
+    explicit = [y for y in explicit if y <= 50]
+    if explicit:
+        return max(explicit)
+
+    current_year = datetime.now().year
+    starts, ends = [], []
+    for start, end in DATE_RANGE_PATTERN.findall(text or ""):
+        starts.append(int(start))
+        ends.append(current_year if not end[:1].isdigit() else int(end))
+    if not starts:
+        return 0.0
+    return float(max(0, max(ends) - min(starts)))
+
+
+def required_years(job_description: Dict) -> float:
+    level = str(job_description.get("level") or "").lower()
+    for name, years in LEVEL_YEARS.items():
+        if name in level:
+            return float(years)
+    return 0.0
+
+
+# ----------------------------------------------------
+# BM25
+# ----------------------------------------------------
+
+def bm25_scores(documents: List[List[str]], query: List[str]) -> np.ndarray:
+    """BM25 of each tokenised document against the query terms."""
+    terms = sorted(set(query))
+    if not documents or not terms:
+        return np.zeros(len(documents))
+
+    index = {term: i for i, term in enumerate(terms)}
+    tf = np.zeros((len(documents), len(terms)), dtype=np.float64)
+    for row, tokens in enumerate(documents):
+        for token in tokens:
+            col = index.get(token)
+            if col is not None:
+                tf[row, col] += 1
+
+    lengths = np.array([len(tokens) for tokens in documents], dtype=np.float64)
+    avg_length = lengths.mean() or 1.0
+    df = (tf > 0).sum(axis=0)
+    n = len(documents)
+    idf = np.log((n - df + 0.5) / (df + 0.5) + 1.0)
+
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg_length)
+    weighted = tf * (BM25_K1 + 1) / (tf + norm[:, None])
+    return weighted @ idf
+
+
+# ----------------------------------------------------
+# PRESCORE
+# ----------------------------------------------------
+
+def prescore_resumes(texts: List[str], job_description: Dict) -> List[Dict]:
+    """
+    Deterministic 0-100 ranking of resume texts against a JD.
+    Same weighting as the LLM prompt: skills 70%, experience 20%,
+    keyword relevance (BM25 over skills + title) 10%. Skills known to the
+    taxonomy match through their aliases, and a skill of the same family
+    counts as partial (half credit); unknown skills need all their words.
+    """
+    documents = [tokenize(text) for text in texts]
+    skills = split_skills(job_description.get("skills"))
+    skill_ids = [skill_taxonomy.canonical(skill) for skill in skills]
+    skill_tokens = [skill_terms(skill) for skill in skills]
+
+    query = [t for tokens in skill_tokens for t in tokens] + tokenize(job_description.get("job_title") or "")
+    relevance = bm25_scores(documents, query)
+    top = relevance.max() if len(relevance) else 0.0
+    relevance = relevance / top if top > 0 else relevance
+
+    needed = required_years(job_description)
+    results = []
+
+    for i, (text, tokens) in enumerate(zip(texts, documents)):
+        vocabulary = set(tokens)
+        found = {t[len(SKILL_TOKEN_PREFIX):] for t in vocabulary if t.startswith(SKILL_TOKEN_PREFIX)}
+        breakdown = {}
+        for skill, skill_id, parts in zip(skills, skill_ids, skill_tokens):
+            if skill_id:
+                breakdown[skill] = skill_taxonomy.status(skill_id, found)
+            else:
+                breakdown[skill] = "matched" if parts and all(p in vocabulary for p in parts) else "missing"
+        matched = sum(1 for v in breakdown.values() if v == "matched")
+        partial = sum(1 for v in breakdown.values() if v == "partial")
+        coverage = (matched + 0.5 * partial) / len(skills) if skills else 0.0
+
+        years = estimate_years_of_experience(text)
+        experience = min(1.0, years / needed) if needed else (1.0 if years else 0.5)
+
+        score = 100 * (
+            WEIGHTS["skills"] * coverage
+            + WEIGHTS["experience"] * experience
+            + WEIGHTS["relevance"] * float(relevance[i])
+        )
+
+        results.append({
+            "prescore": round(score, 1),
+            "years_of_experience": years,
+            "skill_breakdown": {
+                "matched": matched,
+                "partial": partial,
+                "missing": len(skills) - matched - partial,
+            },
+            "skills": breakdown,
+        })
+
+    return results
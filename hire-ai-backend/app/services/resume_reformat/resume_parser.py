@@ -9,14 +9,12 @@ import tempfile
 import json_repair
 
 
-
-import requests
-
 from dotenv import load_dotenv
 load_dotenv()
 
+from app.services.llm import chat_completion
+
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
 
 EXTRACTION_PROMPT = """
@@ -212,40 +210,29 @@ def extract_resume_data(text: str) -> dict:
     if not GROQ_API_KEY:
         raise RuntimeError("GROQ_API_KEY not configured")
 
-    payload = {
-        "model": "openai/gpt-oss-20b",
-        "messages": [
-            {
-                "role": "system",
-                "content": "You are a resume parsing expert. Return ONLY valid JSON."
-            },
-            {
-                "role": "user",
-                "content": EXTRACTION_PROMPT.format(text=text)
-            }
-        ],
-        "temperature": 0.1,
-        "max_tokens": 4000,
-        "response_format": {"type": "json_object"},
-    }
-
-    headers = {
-        "Authorization": f"Bearer {GROQ_API_KEY}",
-        "Content-Type": "application/json",
-    }
+    messages = [
+        {
+            "role": "system",
+            "content": "You are a resume parsing expert. Return ONLY valid JSON."
+        },
+        {
+            "role": "user",
+            "content": EXTRACTION_PROMPT.format(text=text)
+        }
+    ]
 
     try:
-        response = requests.post(
-            GROQ_API_URL,
-            headers=headers,
-            json=payload,
+        raw = chat_completion(
+            messages,
+            model="openai/gpt-oss-20b",
+            temperature=0.1,
+            max_tokens=4000,
             timeout=30,
+            response_format={"type": "json_object"},
+            api_key=GROQ_API_KEY,
+            cache_feature="resume_reformat",
         )
 
-        if response.status_code != 200:
-            raise RuntimeError(response.text)
-
-        raw = response.json()["choices"][0]["message"]["content"]
         if not raw.strip().endswith("}"):
             raise ValueError("Model output appears truncated.")
         # data = safe_json_extract(raw)
@@ -254,4 +241,4 @@ def extract_resume_data(text: str) -> dict:
 
     except Exception as exc:
         print("❌ GROQ EXTRACTION ERROR:", exc)
-        return get_default_resume_data()
\ No newline at end of file
+        return get_default_resume_data()
@@ -0,0 +1,39 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key.
+    The first caller runs the coroutine; callers arriving while it is in
+    flight wait and receive the same result (or exception). If the first
+    caller is cancelled, one waiting caller takes over the call.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        while (future := self._calls.get(key)) is not None:
+            # wait() leaves the shared future alone if this caller is cancelled
+            await asyncio.wait([future])
+            if not future.cancelled():
+                return future.result()
+            # The leader was cancelled: retry, as the new leader or behind it
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieve it so an unobserved failure does not log a warning.
+            future.exception()
+            raise
+        finally:
+            self._calls.pop(key, None)
@@ -0,0 +1,224 @@
+import threading
+import time
+from typing import Dict, Iterable, List
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import SKILL_INDEX_REFRESH_SECONDS
+from app.db.crud import CandidateSkillCRUD
+from app.db.models import CandidateProfile, CandidateSkill
+from app.db.models.candidate_status import CandidateStatus
+from app.services.resume_prescore import split_skills
+from app.services.skill_taxonomy import skill_taxonomy
+
+EMPTY = np.zeros(0, dtype=np.int32)
+
+
+# ----------------------------------------------------
+# SNAPSHOT
+# ----------------------------------------------------
+
+class _Snapshot:
+    """
+    Immutable view of the candidate pool. Candidates are numbered by
+    position (newest profile first); each skill maps to a sorted int32
+    array of positions. Searches read one snapshot without locking.
+    """
+
+    def __init__(self, profiles: List, skills: List):
+        self.ids = [row[0] for row in profiles]
+        positions = {profile_id: i for i, profile_id in enumerate(self.ids)}
+
+        self.recruiters: Dict[str, int] = {}
+        self.recruiter_codes = np.array(
+            [self.recruiters.setdefault(row[1], len(self.recruiters)) for row in profiles],
+            dtype=np.int32,
+        )
+        status_codes = {s: i for i, s in enumerate(CandidateStatus)}
+        self.statuses = status_codes
+        self.status_codes = np.array([status_codes.get(row[2], -1) for row in profiles], dtype=np.int32)
+
+        grouped: Dict[str, List[int]] = {}
+        for profile_id, skill_id in skills:
+            position = positions.get(profile_id)
+            if position is not None:
+                grouped.setdefault(skill_id, []).append(position)
+        self.postings = {
+            skill_id: np.unique(np.array(found, dtype=np.int32))
+            for skill_id, found in grouped.items()
+        }
+
+        # Forward index (candidate -> skill codes, CSR layout) for facet counts
+        self.skill_ids = list(self.postings)
+        positions_flat = np.concatenate(list(self.postings.values())) if self.postings else EMPTY
+        skills_flat = np.repeat(
+            np.arange(len(self.skill_ids), dtype=np.int32),
+            [len(p) for p in self.postings.values()],
+        )
+        self.candidate_skills = skills_flat[np.argsort(positions_flat, kind="stable")]
+        self.offsets = np.concatenate(([0], np.cumsum(np.bincount(positions_flat, minlength=len(self.ids)))))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def posting(self, skill_id: str) -> np.ndarray:
+        return self.postings.get(skill_id, EMPTY)
+
+
+# ----------------------------------------------------
+# INDEX
+# ----------------------------------------------------
+
+def _contains(posting: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Membership of each value in a sorted posting; binary search, no sorting."""
+    if not len(posting):
+        return np.zeros(len(values), dtype=bool)
+    found = np.searchsorted(posting, values)
+    found[found == len(posting)] = 0
+    return posting[found] == values
+
+
+def resolve_skills(names: Iterable[str]) -> List[str]:
+    """Canonical ids for query skills; unknown names are a 400."""
+    ids, unknown = [], []
+    for name in split_skills(",".join(names or [])):
+        skill_id = skill_taxonomy.canonical(name)
+        if skill_id:
+            ids.append(skill_id)
+        else:
+            unknown.append(name)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown skill(s): {', '.join(unknown)}",
+        )
+    return list(dict.fromkeys(ids))
+
+
+class SkillIndex:
+    """
+    In-process inverted index: skill -> sorted candidate positions.
+    Writes in this process mark it dirty (mapper events below); writes by
+    other workers are picked up by a DB fingerprint check at most every
+    refresh_seconds. Between checks a query touches no database at all.
+    """
+
+    def __init__(self, refresh_seconds: float = SKILL_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._snapshot: _Snapshot | None = None
+        self._signature = None
+        self._checked_at = 0.0
+        self._dirty = True
+
+    def mark_dirty(self, *_) -> None:
+        self._dirty = True
+
+    def snapshot(self, db: Session) -> _Snapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and not self._dirty and time.monotonic() - self._checked_at < self.refresh_seconds:
+            return snapshot
+
+        with self._lock:
+            signature = CandidateSkillCRUD.get_index_signature(db)
+            if self._snapshot is None or self._dirty or signature != self._signature:
+                # Cleared before loading so a write racing the load marks it dirty again
+                self._dirty = False
+                profiles, skills = CandidateSkillCRUD.get_index_rows(db)
+                self._snapshot = _Snapshot(profiles, skills)
+                self._signature = signature
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def search(
+        self,
+        db: Session,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        recruiter_id: str | None = None,
+        statuses: Iterable[CandidateStatus] = (),
+        skip: int = 0,
+        limit: int = 20,
+        facet_limit: int = 20,
+    ) -> Dict:
+        """
+        Candidates holding every all_of skill, at least one any_of skill and
+        no none_of skill, newest first. Facets count each skill across the
+        whole result, not just the page.
+        """
+        required, optional, excluded = resolve_skills(all_of), resolve_skills(any_of), resolve_skills(none_of)
+        snapshot = self.snapshot(db)
+
+        # AND: start from the rarest skill so the working set only shrinks
+        if required:
+            postings = sorted((snapshot.posting(s) for s in required), key=len)
+            hits = postings[0]
+            for posting in postings[1:]:
+                hits = hits[_contains(posting, hits)]
+        else:
+            hits = None
+
+        # OR: filter the AND result, or scatter the postings into a mask
+        if optional:
+            if hits is not None:
+                keep = np.zeros(len(hits), dtype=bool)
+                for skill_id in optional:
+                    keep |= _contains(snapshot.posting(skill_id), hits)
+                hits = hits[keep]
+            else:
+                selected = np.zeros(len(snapshot), dtype=bool)
+                for skill_id in optional:
+                    selected[snapshot.posting(skill_id)] = True
+                hits = np.flatnonzero(selected).astype(np.int32)
+
+        if hits is None:
+            hits = np.arange(len(snapshot), dtype=np.int32)
+
+        # NOT
+        for skill_id in excluded:
+            hits = hits[~_contains(snapshot.posting(skill_id), hits)]
+
+        if recruiter_id is not None:
+            code = snapshot.recruiters.get(recruiter_id, -1)
+            hits = hits[snapshot.recruiter_codes[hits] == code]
+        status_codes = [snapshot.statuses[s] for s in statuses or ()]
+        if status_codes:
+            hits = hits[np.isin(snapshot.status_codes[hits], status_codes)]
+
+        return {
+            "total": int(len(hits)),
+            "ids": [snapshot.ids[i] for i in hits[skip:skip + limit]],
+            "facets": self._facets(snapshot, hits, facet_limit),
+            "query": {
+                "all_of": [skill_taxonomy.name(s) for s in required],
+                "any_of": [skill_taxonomy.name(s) for s in optional],
+                "none_of": [skill_taxonomy.name(s) for s in excluded],
+            },
+        }
+
+    @staticmethod
+    def _facets(snapshot: _Snapshot, hits: np.ndarray, limit: int) -> List[Dict]:
+        if not len(hits) or limit <= 0:
+            return []
+        # Gather the skill codes of every hit and count them in one bincount
+        starts = snapshot.offsets[hits]
+        lengths = snapshot.offsets[hits + 1] - starts
+        gather = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        per_skill = np.bincount(snapshot.candidate_skills[gather], minlength=len(snapshot.skill_ids))
+        counts = [(int(n), snapshot.skill_ids[i]) for i, n in enumerate(per_skill) if n]
+        counts = sorted(counts, key=lambda c: (-c[0], c[1]))[:limit]
+        return [
+            {"skill_id": skill_id, "skill": skill_taxonomy.name(skill_id), "count": count}
+            for count, skill_id in counts
+        ]
+
+
+skill_index = SkillIndex()
+
+for model in (CandidateProfile, CandidateSkill):
+    for name in ("after_insert", "after_update", "after_delete"):
+        event.listen(model, name, skill_index.mark_dirty)
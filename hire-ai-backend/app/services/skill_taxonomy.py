@@ -0,0 +1,427 @@
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# ----------------------------------------------------
+# DICTIONARY
+# ----------------------------------------------------
+
+# id -> (display name, aliases, families)
+# The display name and the id are aliases too. Skills sharing a family
+# count as a "partial" match for each other (MySQL for PostgreSQL, ...).
+SKILLS: Dict[str, Tuple[str, Tuple[str, ...], Tuple[str, ...]]] = {
+    # Languages
+    "python": ("Python", ("py", "python3", "python 3"), ("python",)),
+    "java": ("Java", ("core java", "java 8", "java 11", "java 17", "j2ee", "java ee"), ("jvm",)),
+    "kotlin": ("Kotlin", (), ("jvm", "mobile")),
+    "scala": ("Scala", (), ("jvm",)),
+    "javascript": ("JavaScript", ("js", "ecmascript", "es6", "vanilla js"), ("javascript",)),
+    "typescript": ("TypeScript", ("ts",), ("javascript",)),
+    "go": ("Go", ("golang",), ("systems",)),
+    "rust": ("Rust", (), ("systems",)),
+    "c": ("C", ("c language", "c programming", "embedded c", "ansi c"), ("systems",)),
+    "cpp": ("C++", ("cpp", "c plus plus", "modern c++"), ("systems",)),
+    "csharp": ("C#", ("c sharp", "csharp"), ("dotnet",)),
+    "ruby": ("Ruby", (), ("ruby",)),
+    "php": ("PHP", (), ("php",)),
+    "swift": ("Swift", ("swiftui",), ("mobile", "apple")),
+    "objective-c": ("Objective-C", ("objective c", "objc"), ("apple",)),
+    "r": ("R", ("r programming", "rstudio"), ("data-analysis",)),
+    "matlab": ("MATLAB", (), ("data-analysis",)),
+    "perl": ("Perl", (), ()),
+    "bash": ("Bash", ("shell scripting", "shell script", "unix shell", "sh scripting"), ("shell",)),
+    "powershell": ("PowerShell", (), ("shell",)),
+    "dart": ("Dart", (), ("mobile",)),
+    "sql": ("SQL", ("t-sql", "tsql", "pl/sql", "plsql", "ansi sql"), ("sql",)),
+    "html": ("HTML", ("html5",), ("web-markup",)),
+    "css": ("CSS", ("css3", "less css"), ("web-markup",)),
+    "sass": ("Sass", ("scss",), ("web-markup",)),
+
+    # Frontend
+    "react": ("React", ("reactjs", "react.js", "react js", "react hooks"), ("frontend-framework", "react")),
+    "redux": ("Redux", ("redux toolkit",), ("react",)),
+    "angular": ("Angular", ("angularjs", "angular.js", "angular js"), ("frontend-framework",)),
+    "vue": ("Vue.js", ("vue", "vuejs", "vue js", "vuex", "nuxt", "nuxt.js"), ("frontend-framework",)),
+    "svelte": ("Svelte", ("sveltekit",), ("frontend-framework",)),
+    "nextjs": ("Next.js", ("next.js", "nextjs", "next js"), ("frontend-framework",)),
+    "jquery": ("jQuery", (), ("frontend-framework",)),
+    "tailwind": ("Tailwind CSS", ("tailwind", "tailwindcss"), ("web-markup",)),
+    "bootstrap": ("Bootstrap", (), ("web-markup",)),
+
+    # Backend frameworks
+    "nodejs": ("Node.js", ("node.js", "nodejs", "node js"), ("node",)),
+    "express": ("Express.js", ("expressjs", "express.js", "express js"), ("node",)),
+    "nestjs": ("NestJS", ("nest.js", "nest js"), ("node",)),
+    "django": ("Django", ("django rest framework", "drf"), ("python-web",)),
+    "flask": ("Flask", (), ("python-web",)),
+    "fastapi": ("FastAPI", ("fast api",), ("python-web",)),
+    "spring": ("Spring", ("spring framework", "spring mvc", "spring cloud"), ("jvm-web",)),
+    "spring-boot": ("Spring Boot", ("springboot", "spring-boot"), ("jvm-web",)),
+    "hibernate": ("Hibernate", ("jpa",), ("jvm-web",)),
+    "dotnet": (".NET", (".net core", "dotnet", ".net framework", "asp.net", "asp.net core", "asp.net mvc"), ("dotnet",)),
+    "rails": ("Ruby on Rails", ("rails", "ror"), ("ruby",)),
+    "laravel": ("Laravel", (), ("php",)),
+    "graphql": ("GraphQL", (), ("api",)),
+    "rest-api": ("REST APIs", ("restful", "rest api", "restful api", "restful apis", "rest apis", "restful services"), ("api",)),
+    "grpc": ("gRPC", (), ("api",)),
+    "microservices": ("Microservices", ("microservice", "micro services", "microservice architecture"), ("architecture",)),
+
+    # Databases
+    "mysql": ("MySQL", ("my sql",), ("sql-database",)),
+    "postgresql": ("PostgreSQL", ("postgres", "psql", "postgre sql", "postgresql"), ("sql-database",)),
+    "sql-server": ("SQL Server", ("mssql", "ms sql", "microsoft sql server", "sql server"), ("sql-database",)),
+    "oracle-db": ("Oracle Database", ("oracle db", "oracle database", "oracle sql"), ("sql-database",)),
+    "sqlite": ("SQLite", (), ("sql-database",)),
+    "mariadb": ("MariaDB", (), ("sql-database",)),
+    "mongodb": ("MongoDB", ("mongo", "mongo db"), ("nosql-database",)),
+    "cassandra": ("Cassandra", ("apache cassandra",), ("nosql-database",)),
+    "dynamodb": ("DynamoDB", ("dynamo db", "amazon dynamodb"), ("nosql-database",)),
+    "couchbase": ("Couchbase", ("couchdb",), ("nosql-database",)),
+    "redis": ("Redis", (), ("cache",)),
+    "memcached": ("Memcached", (), ("cache",)),
+    "elasticsearch": ("Elasticsearch", ("elastic search", "elk", "elk stack", "opensearch"), ("search-engine",)),
+    "solr": ("Solr", ("apache solr",), ("search-engine",)),
+    "snowflake": ("Snowflake", (), ("data-warehouse",)),
+    "bigquery": ("BigQuery", ("big query", "google bigquery"), ("data-warehouse",)),
+    "redshift": ("Redshift", ("amazon redshift", "aws redshift"), ("data-warehouse",)),
+
+    # Cloud / DevOps
+    "aws": ("AWS", ("amazon web services", "aws cloud", "aws lambda", "lambda functions"), ("cloud", "aws")),
+    "ec2": ("Amazon EC2", ("amazon ec2",), ("aws",)),
+    "s3": ("Amazon S3", ("amazon s3",), ("aws",)),
+    "azure": ("Azure", ("microsoft azure", "azure cloud"), ("cloud",)),
+    "gcp": ("Google Cloud", ("gcp", "google cloud platform", "google cloud"), ("cloud",)),
+    "docker": ("Docker", ("docker compose", "docker-compose", "dockerfile"), ("containers",)),
+    "kubernetes": ("Kubernetes", ("k8s", "kubectl"), ("containers", "kubernetes")),
+    "helm": ("Helm", ("helm charts",), ("kubernetes",)),
+    "eks": ("Amazon EKS", ("amazon eks",), ("kubernetes", "aws")),
+    "aks": ("Azure AKS", ("azure aks", "azure kubernetes service"), ("kubernetes",)),
+    "gke": ("Google GKE", ("google kubernetes engine",), ("kubernetes",)),
+    "openshift": ("OpenShift", (), ("containers",)),
+    "terraform": ("Terraform", (), ("iac",)),
+    "cloudformation": ("CloudFormation", ("aws cloudformation",), ("iac",)),
+    "ansible": ("Ansible", (), ("iac", "config-management")),
+    "puppet": ("Puppet", (), ("config-management",)),
+    "chef": ("Chef", (), ("config-management",)),
+    "jenkins": ("Jenkins", (), ("ci-cd",)),
+    "github-actions": ("GitHub Actions", ("github actions", "gh actions"), ("ci-cd",)),
+    "gitlab-ci": ("GitLab CI", ("gitlab ci", "gitlab ci/cd", "gitlab pipelines"), ("ci-cd",)),
+    "circleci": ("CircleCI", ("circle ci",), ("ci-cd",)),
+    "ci-cd": ("CI/CD", ("ci/cd", "ci cd", "ci-cd", "cicd", "continuous integration", "continuous delivery", "continuous deployment"), ("ci-cd",)),
+    "linux": ("Linux", (), ("os",)),
+    "unix": ("Unix", (), ("os",)),
+    "ubuntu": ("Ubuntu", (), ("os",)),
+    "centos": ("CentOS", (), ("os",)),
+    "rhel": ("Red Hat Enterprise Linux", ("red hat", "rhel"), ("os",)),
+    "debian": ("Debian", (), ("os",)),
+    "git": ("Git", ("version control",), ("vcs",)),
+    "github": ("GitHub", (), ("vcs",)),
+    "gitlab": ("GitLab", (), ("vcs",)),
+    "bitbucket": ("Bitbucket", (), ("vcs",)),
+    "nginx": ("Nginx", (), ("web-server",)),
+    "apache-httpd": ("Apache HTTP Server", ("apache httpd", "apache web server", "httpd"), ("web-server",)),
+    "prometheus": ("Prometheus", (), ("observability",)),
+    "grafana": ("Grafana", (), ("observability",)),
+    "datadog": ("Datadog", (), ("observability",)),
+    "splunk": ("Splunk", (), ("observability",)),
+
+    # Data / ML
+    "machine-learning": ("Machine Learning", ("ml", "machine learning", "machine-learning"), ("ml",)),
+    "deep-learning": ("Deep Learning", ("deep learning", "deep-learning", "neural networks"), ("ml",)),
+    "nlp": ("NLP", ("natural language processing", "nlp"), ("ml",)),
+    "computer-vision": ("Computer Vision", ("computer vision", "cv models", "opencv"), ("ml",)),
+    "llm": ("LLMs", ("llm", "llms", "large language models", "large language model", "generative ai", "genai", "gen ai", "prompt engineering"), ("ml", "llm")),
+    "rag": ("RAG", ("retrieval augmented generation", "retrieval-augmented generation"), ("llm",)),
+    "langchain": ("LangChain", (), ("llm",)),
+    "tensorflow": ("TensorFlow", ("tensor flow", "tf2"), ("ml-framework",)),
+    "pytorch": ("PyTorch", ("torch",), ("ml-framework",)),
+    "keras": ("Keras", (), ("ml-framework",)),
+    "scikit-learn": ("scikit-learn", ("sklearn", "scikit learn", "scikit"), ("ml-framework",)),
+    "pandas": ("Pandas", (), ("python-data",)),
+    "numpy": ("NumPy", (), ("python-data",)),
+    "spark": ("Apache Spark", ("apache spark", "pyspark", "spark sql", "spark streaming"), ("big-data",)),
+    "hadoop": ("Hadoop", ("hdfs", "mapreduce", "map reduce"), ("big-data",)),
+    "hive": ("Hive", ("apache hive", "hiveql"), ("big-data",)),
+    "airflow": ("Airflow", ("apache airflow",), ("orchestration",)),
+    "kafka": ("Kafka", ("apache kafka", "kafka streams"), ("messaging",)),
+    "rabbitmq": ("RabbitMQ", ("rabbit mq",), ("messaging",)),
+    "sqs": ("Amazon SQS", ("aws sqs", "amazon sqs"), ("messaging",)),
+    "etl": ("ETL", ("etl pipelines", "data pipelines", "elt"), ("data-engineering",)),
+    "power-bi": ("Power BI", ("powerbi", "power bi"), ("bi",)),
+    "tableau": ("Tableau", (), ("bi",)),
+    "excel": ("Excel", ("ms excel", "microsoft excel", "advanced excel"), ("bi", "excel")),
+    "vba": ("VBA", ("excel vba", "visual basic for applications"), ("excel",)),
+    "statistics": ("Statistics", ("statistical analysis", "statistical modeling", "statistical modelling"), ("data-analysis",)),
+    "data-analysis": ("Data Analysis", ("data analysis", "data analytics", "data analyst"), ("data-analysis",)),
+
+    # Mobile
+    "android": ("Android", ("android sdk", "android development"), ("mobile",)),
+    "ios": ("iOS", ("ios development",), ("mobile", "apple")),
+    "flutter": ("Flutter", (), ("mobile",)),
+    "react-native": ("React Native", ("react native", "react-native"), ("mobile",)),
+
+    # Testing
+    "selenium": ("Selenium", ("selenium webdriver",), ("test-automation",)),
+    "cypress": ("Cypress", (), ("test-automation",)),
+    "playwright": ("Playwright", (), ("test-automation",)),
+    "junit": ("JUnit", (), ("unit-testing",)),
+    "pytest": ("pytest", (), ("unit-testing",)),
+    "jest": ("Jest", (), ("unit-testing",)),
+
+    # Practices / tools
+    "agile": ("Agile", ("agile methodology", "agile methodologies", "scrum", "kanban"), ("process",)),
+    "jira": ("Jira", ("atlassian jira",), ("process",)),
+    "system-design": ("System Design", ("system design", "distributed systems", "scalable systems"), ("architecture",)),
+    "oop": ("OOP", ("object oriented programming", "object-oriented programming", "oops", "object oriented design"), ("design",)),
+    "data-structures": ("Data Structures & Algorithms", ("data structures", "dsa"), ("design", "dsa")),
+    "algorithms": ("Algorithms", (), ("dsa",)),
+}
+
+# Aliases that are ordinary words in lower case; matched with this casing,
+# or in any casing as an item of a comma/semicolon separated list
+CASE_SENSITIVE_ALIASES = {
+    "Go": "go", "R": "r", "C": "c", "Swift": "swift", "Rust": "rust", "Dart": "dart",
+    "Chef": "chef", "Puppet": "puppet", "Hive": "hive", "React": "react",
+    "Spring": "spring", "Oracle": "oracle-db", "Node": "nodejs", "Jest": "jest",
+    "Express": "express", "Spark": "spark", "Excel": "excel", "RAG": "rag",
+}
+
+# Capitalised anyway at the start of a sentence ("Go to ...", "Excel at ..."),
+# so there they only count as list items
+SENTENCE_WORDS = {"Go", "Express", "Spark", "Excel"}
+
+# Phrases that contain an alias but are not the skill; matched and dropped
+STOP_PHRASES = ("go to market", "go-to-market", "go live", "go-live")
+
+WHITESPACE = re.compile(r"\s+")
+
+# Same separators as resume_prescore.SKILL_SPLIT_PATTERN
+LIST_SEPARATORS = ",;|•\n"
+# Punctuation that may open or close a list: "Skills: react, node."
+LIST_EDGES = LIST_SEPARATORS + ":."
+# Joiners that make a single letter part of a word: R&D, C-level, C's
+LETTER_JOINERS = "&-'"
+# What may precede the first word of a sentence or bullet ("" = start of text)
+SENTENCE_STARTS = {"", ".", "!", "?", "\n", "•", "*", "-"}
+
+
+# ----------------------------------------------------
+# AHO-CORASICK AUTOMATON
+# ----------------------------------------------------
+
+class _Automaton:
+    """Aho-Corasick over characters: every pattern occurrence in one pass over the text."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, object]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[List[Tuple[int, object]]] = [[]]
+
+        for pattern, value in patterns:
+            node = 0
+            for ch in pattern:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = nxt
+            self.out[node].append((len(pattern), value))
+
+        # Breadth-first failure links; outputs inherit their fallback's outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+
+    def iter(self, text: str):
+        """(start, end, value) for every occurrence, in order of end position."""
+        node = 0
+        goto, fail, out = self.goto, self.fail, self.out
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value in out[node]:
+                yield i + 1 - length, i + 1, value
+
+
+def _normalise(text: str) -> str:
+    """Collapse whitespace; lower-casing must keep offsets aligned with this string."""
+    return WHITESPACE.sub(" ", text or "")
+
+
+def _layout(text: str) -> str:
+    """Like _normalise (same length), but a whitespace run holding a line break becomes "\\n"."""
+    return WHITESPACE.sub(lambda m: "\n" if "\n" in m.group() else " ", text or "")
+
+
+def _lower(text: str) -> str:
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters lower-case to two code points; keep offsets stable
+    return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+def _is_boundary(text: str, index: int, joiners: str = "") -> bool:
+    return index < 0 or index >= len(text) or not (text[index].isalnum() or text[index] in "+#" + joiners)
+
+
+def _is_dotted(text: str, index: int, step: int) -> bool:
+    """A dot at index joins the match to a word beyond it: github.com, main.py."""
+    beyond = index + step
+    return 0 <= index < len(text) and text[index] == "." and 0 <= beyond < len(text) and text[beyond].isalpha()
+
+
+def _neighbour(text: str, index: int, step: int) -> str:
+    """First non-space character from index in direction step; "" at either end."""
+    while 0 <= index < len(text) and text[index] == " ":
+        index += step
+    return text[index] if 0 <= index < len(text) else ""
+
+
+def _is_list_item(layout: str, start: int, end: int, whole_list: bool = False) -> bool:
+    """
+    layout[start:end] stands alone between list punctuation, at least one
+    side a real separator. With whole_list the text itself is a skill
+    list, so its start and end count as separators too.
+    """
+    before, after = _neighbour(layout, start - 1, -1), _neighbour(layout, end, 1)
+    if (before and before not in LIST_EDGES) or (after and after not in LIST_EDGES):
+        return False
+    separators = {"", *LIST_SEPARATORS} if whole_list else set(LIST_SEPARATORS)
+    return before in separators or after in separators
+
+
+# ----------------------------------------------------
+# TAXONOMY
+# ----------------------------------------------------
+
+class SkillTaxonomy:
+    """
+    Canonical skills with aliases. Extracts skill ids from free text in a
+    single linear pass and classifies required skills as
+    matched / partial / missing.
+    """
+
+    def __init__(
+        self,
+        skills: Dict[str, Tuple[str, Tuple[str, ...], Tuple[str, ...]]],
+        case_sensitive: Dict[str, str],
+        sentence_words: Iterable[str] = (),
+        stop_phrases: Iterable[str] = (),
+    ):
+        self.names = {skill_id: name for skill_id, (name, _, _) in skills.items()}
+        self.families = {skill_id: set(families) for skill_id, (_, _, families) in skills.items()}
+
+        self.aliases: Dict[str, str] = {}
+        for skill_id, (name, aliases, _) in skills.items():
+            for alias in (skill_id, skill_id.replace("-", " "), name, *aliases):
+                key = _lower(_normalise(alias)).strip()
+                if key:
+                    self.aliases.setdefault(key, skill_id)
+
+        # Case-sensitive aliases shadow any lower-case entry of the same spelling
+        self.case_sensitive = dict(case_sensitive)
+        self.sentence_words = set(sentence_words)
+        insensitive = {k: v for k, v in self.aliases.items() if k not in {a.lower() for a in case_sensitive}}
+
+        patterns = [(alias, (skill_id, False)) for alias, skill_id in insensitive.items()]
+        patterns += [(alias.lower(), (skill_id, True)) for alias, skill_id in case_sensitive.items()]
+        # Stop phrases win leftmost-longest selection like any alias, then yield nothing
+        patterns += [(_lower(phrase), (None, False)) for phrase in stop_phrases]
+        self._automaton = _Automaton(patterns)
+
+    # ---------------- extraction ----------------
+
+    def find(self, text: str, whole_list: bool = False) -> List[Tuple[str, int, int]]:
+        """
+        (skill id, start, end) of every skill mention, leftmost-longest,
+        non-overlapping. Case-sensitive aliases also match in lower case as
+        list items ("skills: react, node"); whole_list treats the entire
+        text as a skill list (a profile's skills field).
+        """
+        layout = _layout(text)
+        original = layout.replace("\n", " ")
+        lowered = _lower(original)
+
+        candidates = []
+        for start, end, (skill_id, exact_case) in self._automaton.iter(lowered):
+            joiners = LETTER_JOINERS if end - start == 1 else ""
+            if not (_is_boundary(lowered, start - 1, joiners) and _is_boundary(lowered, end, joiners)):
+                continue
+            if _is_dotted(lowered, start - 1, -1) or _is_dotted(lowered, end, 1):
+                continue
+            if exact_case and not _is_list_item(layout, start, end, whole_list):
+                written = original[start:end]
+                if written not in self.case_sensitive:
+                    continue
+                if written in self.sentence_words and _neighbour(layout, start - 1, -1) in SENTENCE_STARTS:
+                    continue
+            candidates.append((start, end, skill_id))
+
+        matches = []
+        last_end = -1
+        for start, end, skill_id in sorted(candidates, key=lambda c: (c[0], c[0] - c[1])):
+            if start >= last_end:
+                matches.append((skill_id, start, end))
+                last_end = end
+        return [match for match in matches if match[0] is not None]
+
+    def extract(self, text: str, whole_list: bool = False) -> List[str]:
+        """Distinct skill ids in order of first mention."""
+        return list(dict.fromkeys(skill_id for skill_id, _, _ in self.find(text, whole_list)))
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Skill id for one skill name ("k8s" -> "kubernetes"), None if unknown."""
+        key = _lower(_normalise(skill)).strip()
+        if key in self.aliases:
+            return self.aliases[key]
+        if skill.strip() in self.case_sensitive:
+            return self.case_sensitive[skill.strip()]
+        found = self.extract(skill, whole_list=True)
+        return found[0] if len(found) == 1 else None
+
+    def name(self, skill_id: str) -> str:
+        return self.names.get(skill_id, skill_id)
+
+    def normalise(self, text: str) -> List[str]:
+        """Display names of the skills mentioned in free text."""
+        return [self.name(skill_id) for skill_id in self.extract(text)]
+
+    # ---------------- comparison ----------------
+
+    def status(self, skill_id: str, found: set) -> str:
+        if skill_id in found:
+            return "matched"
+        families = self.families.get(skill_id, set())
+        if families and any(families & self.families.get(other, set()) for other in found):
+            return "partial"
+        return "missing"
+
+    def compare(self, required: Iterable[str], text: str) -> Dict[str, Optional[str]]:
+        """
+        Status of each required skill name against a text: "matched",
+        "partial" (a skill of the same family is present), "missing",
+        or None when the skill is not in the dictionary.
+        """
+        found = set(self.extract(text))
+        result: Dict[str, Optional[str]] = {}
+        for skill in required:
+            skill_id = self.canonical(skill)
+            result[skill] = self.status(skill_id, found) if skill_id else None
+        return result
+
+
+skill_taxonomy = SkillTaxonomy(SKILLS, CASE_SENSITIVE_ALIASES, SENTENCE_WORDS, STOP_PHRASES)
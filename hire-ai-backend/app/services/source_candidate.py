@@ -1,10 +1,9 @@
 from fastapi import HTTPException
 import httpx
 from app.core.config import SERPER_API_KEY
+from app.services.llm import chat_completion, achat_completion, get_async_client
 
-import os
 import json
-import requests
 
 async def search_google_profiles(
     job_title: str,
@@ -35,20 +34,20 @@ async def search_google_profiles(
     }
     payload = {"q": query}
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-            # Serper returns results in the 'organic' key
-            results = []
-            for item in data.get("organic", []):
-                results.append({
-                    "title": item.get("title"),
-                    "link": item.get("link"),
-                    "snippet": item.get("snippet")
-                })
-            return results
+        client = get_async_client()
+        response = await client.post(url, headers=headers, json=payload)
+        response.raise_for_status()
+        data = response.json()
+
+        # Serper returns results in the 'organic' key
+        results = []
+        for item in data.get("organic", []):
+            results.append({
+                "title": item.get("title"),
+                "link": item.get("link"),
+                "snippet": item.get("snippet")
+            })
+        return results
     except httpx.HTTPStatusError as e:
         raise HTTPException(
             status_code=e.response.status_code,
@@ -58,8 +57,41 @@ async def search_google_profiles(
 
 
 
-api_key = os.getenv("GROQ_API_KEY")
-api_url = "https://api.groq.com/openai/v1/chat/completions"
+LLM_OPTIONS = {
+    "temperature": 0.0,
+    "max_tokens": 2000,
+    "timeout": 30,
+    "cache_feature": "candidate_sourcing",
+}
+
+
+def build_messages(results: list[dict]) -> list[dict]:
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are a strict information extraction engine. "
+                "You extract structured data from noisy search results. "
+                "You follow rules exactly. "
+                "You return ONLY valid JSON. "
+                "No markdown. No explanations."
+            ),
+        },
+        {"role": "user", "content": build_prompt(results)},
+    ]
+
+
+def parse_people(content: str) -> list[dict]:
+    try:
+        parsed = json.loads(content)
+        if not isinstance(parsed, list):
+            raise ValueError("Response is not a JSON array")
+        return parsed
+    except (json.JSONDecodeError, ValueError):
+        raise HTTPException(
+            status_code=500,
+            detail="LLM returned invalid JSON",
+        )
 
 
 def parse_people_from_search(results: list[dict]) -> list[dict]:
@@ -72,70 +104,15 @@ def parse_people_from_search(results: list[dict]) -> list[dict]:
     Returns ONLY people in structured JSON.
     """
 
-    if not api_key:
-        raise HTTPException(
-            status_code=500,
-            detail="Groq API key not configured",
-        )
-
-    prompt = build_prompt(results)
-
-    payload = {
-        "model": "llama-3.1-8b-instant",
-        "messages": [
-            {
-                "role": "system",
-                "content": (
-                    "You are a strict information extraction engine. "
-                    "You extract structured data from noisy search results. "
-                    "You follow rules exactly. "
-                    "You return ONLY valid JSON. "
-                    "No markdown. No explanations."
-                ),
-            },
-            {"role": "user", "content": prompt},
-        ],
-        "temperature": 0.0,
-        "max_tokens": 2000,
-    }
+    content = chat_completion(build_messages(results), **LLM_OPTIONS)
+    return parse_people(content)
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
 
-    try:
-        response = requests.post(
-            api_url,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
+async def aparse_people_from_search(results: list[dict]) -> list[dict]:
+    """Async variant of parse_people_from_search; safe to await from async routes."""
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=response.text,
-            )
-
-        content = response.json()["choices"][0]["message"]["content"]
-
-        try:
-            parsed = json.loads(content)
-            if not isinstance(parsed, list):
-                raise ValueError("Response is not a JSON array")
-            return parsed
-        except (json.JSONDecodeError, ValueError):
-            raise HTTPException(
-                status_code=500,
-                detail="LLM returned invalid JSON",
-            )
-
-    except requests.RequestException as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Groq API request failed: {exc}",
-        )
+    content = await achat_completion(build_messages(results), **LLM_OPTIONS)
+    return parse_people(content)
 
 
 def build_prompt(results: list[dict]) -> str:
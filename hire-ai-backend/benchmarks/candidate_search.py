@@ -0,0 +1,107 @@
+"""
+Full-text candidate search latency on the embedded FTS5 index.
+
+Indexes a synthetic pool whose vocabulary follows a Zipf distribution
+(a few very common words, a long tail of rare ones) and times typical
+recruiter queries, next to a Python substring scan over the same text,
+the way a client filters a full profile dump.
+Exits non-zero if any query is slower than MAX_ALLOWED_MS.
+
+    python -m benchmarks.candidate_search
+"""
+import sys
+import time
+import random
+import uuid
+
+from app.services.candidate_search import CandidateSearchIndex
+
+CANDIDATES = 20_000
+VOCABULARY = 5_000
+REPEAT = 20
+MAX_ALLOWED_MS = 50.0
+
+SKILL_WORDS = "python java kafka spark aws react kubernetes terraform airflow snowflake payments fintech".split()
+LOCATIONS = ["Bengaluru", "Chennai", "Pune", "Hyderabad", "Remote"]
+
+QUERIES = [
+    ("kafka", {}),
+    ("kafka spark", {}),
+    ('"data pipelines"', {}),
+    ("snow*", {}),
+    ("python -java", {}),
+    ("aws", {"location": "pune", "min_years": 5}),
+]
+
+
+def build_documents():
+    rng = random.Random(11)
+    vocabulary = [f"w{i}" for i in range(VOCABULARY)]
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY)]
+
+    def text(words: int) -> str:
+        body = rng.choices(vocabulary, weights=weights, k=words)
+        body += rng.sample(SKILL_WORDS, 2)
+        if rng.random() < 0.1:
+            body += ["data", "pipelines"]
+        rng.shuffle(body)
+        return " ".join(body)
+
+    return [
+        {
+            "candidate_id": str(uuid.uuid4()),
+            "recruiter_id": "recruiter",
+            "status": "sourced",
+            "location": rng.choice(LOCATIONS).lower(),
+            "years": float(rng.randint(0, 15)),
+            "title": text(4),
+            "summary": text(60),
+            "experience": text(200),
+            "certifications": text(8),
+        }
+        for _ in range(CANDIDATES)
+    ]
+
+
+def scan(documents, query, location=None, min_years=None):
+    words = [w.strip('"*').lower() for w in query.split() if not w.startswith("-")]
+    hits = []
+    for doc in documents:
+        blob = " ".join((doc["title"], doc["summary"], doc["experience"], doc["certifications"])).lower()
+        if all(w in blob for w in words) and (not location or location in doc["location"]) \
+                and (min_years is None or doc["years"] >= min_years):
+            hits.append(doc["candidate_id"])
+    return hits
+
+
+def main() -> int:
+    documents = build_documents()
+    index = CandidateSearchIndex()
+
+    started = time.perf_counter()
+    index.upsert(documents)
+    index._verified = True
+    print(f"{CANDIDATES} candidates indexed in {(time.perf_counter() - started):.1f} s")
+
+    worst = 0.0
+    for query, filters in QUERIES:
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            found = index.search(None, query, **filters)
+        search_ms = (time.perf_counter() - started) / REPEAT * 1000
+
+        started = time.perf_counter()
+        scan(documents, query, **filters)
+        scan_ms = (time.perf_counter() - started) * 1000
+
+        worst = max(worst, search_ms)
+        print(f"{query + ' ' + str(filters or ''):45} hits {found['total']:6}  fts5 {search_ms:6.1f} ms  scan {scan_ms:7.1f} ms")
+
+    if worst > MAX_ALLOWED_MS:
+        print(f"FAIL: a search took more than {MAX_ALLOWED_MS:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Per-file DOCX / PPTX text extraction: direct vs render-to-PDF.
+
+The legacy path rendered each document to a PDF (ReportLab for DOCX,
+PyMuPDF text boxes for PPTX) and then re-parsed that PDF. The direct
+extractors walk the document structure instead. Both are timed over the
+same files.
+
+    python -m benchmarks.docx_pptx_extraction [corpus_dir]
+
+Without a corpus directory a small set of resumes is synthesised.
+"""
+import os
+import sys
+import time
+import statistics
+from io import BytesIO
+
+import fitz  # PyMuPDF
+from docx import Document
+from pptx import Presentation
+from pptx.util import Inches
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet
+
+from app.services.resume_assist import (
+    extract_text_from_docx,
+    extract_text_from_pptx,
+    extract_text_from_pdf,
+)
+
+ROUNDS = 5
+SYNTHETIC_FILES = 20
+
+
+# ----------------------------------------------------
+# LEGACY PATH (render to PDF, then extract)
+# ----------------------------------------------------
+
+def legacy_docx(data: bytes) -> str:
+    doc = Document(BytesIO(data))
+    styles = getSampleStyleSheet()
+    story = []
+
+    for p in doc.paragraphs:
+        if p.text.strip():
+            story.append(Paragraph(p.text, styles["Normal"]))
+            story.append(Spacer(1, 12))
+
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    story.append(Paragraph(cell.text, styles["Normal"]))
+                    story.append(Spacer(1, 12))
+
+    buffer = BytesIO()
+    SimpleDocTemplate(buffer, pagesize=letter).build(story)
+    return extract_text_from_pdf(buffer.getvalue())
+
+
+def legacy_pptx(data: bytes) -> str:
+    prs = Presentation(BytesIO(data))
+    pdf = fitz.open()
+
+    for slide in prs.slides:
+        page = pdf.new_page()
+        slide_text = ""
+        for shape in slide.shapes:
+            if hasattr(shape, "text") and shape.text.strip():
+                slide_text += shape.text + "\n"
+        page.insert_textbox(fitz.Rect(50, 50, 550, 750), slide_text, fontsize=11)
+
+    pdf_bytes = pdf.tobytes()
+    pdf.close()
+    return extract_text_from_pdf(pdf_bytes)
+
+
+# ----------------------------------------------------
+# CORPUS
+# ----------------------------------------------------
+
+def synthetic_docx(i: int) -> bytes:
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = f"Candidate {i} | candidate{i}@example.com"
+    doc.add_heading(f"Candidate {i}", level=1)
+    doc.add_paragraph("Backend engineer with 6 years of experience in Python, FastAPI and AWS.")
+    doc.add_heading("Experience", level=2)
+    for job in range(4):
+        doc.add_paragraph(f"Company {job} - Senior Engineer (2018 - 2022)")
+        for bullet in range(5):
+            doc.add_paragraph(f"Delivered project {bullet} using Kubernetes, PostgreSQL and Redis.")
+    table = doc.add_table(rows=4, cols=2)
+    for row, (skill, level) in enumerate([("Python", "Expert"), ("AWS", "Advanced"), ("SQL", "Advanced"), ("Go", "Basic")]):
+        table.cell(row, 0).text = skill
+        table.cell(row, 1).text = level
+    buffer = BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def synthetic_pptx(i: int) -> bytes:
+    prs = Presentation()
+    for slide_no in range(3):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = f"Candidate {i} - slide {slide_no}"
+        box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(4))
+        box.text_frame.text = "Python, FastAPI, AWS, Kubernetes\n6 years of experience"
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def load_corpus(directory: str | None) -> list[tuple[str, bytes]]:
+    if not directory:
+        docs = [(f"synthetic_{i}.docx", synthetic_docx(i)) for i in range(SYNTHETIC_FILES)]
+        slides = [(f"synthetic_{i}.pptx", synthetic_pptx(i)) for i in range(SYNTHETIC_FILES)]
+        return docs + slides
+
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if os.path.splitext(name)[1].lower() in (".docx", ".pptx"):
+            with open(os.path.join(directory, name), "rb") as handle:
+                corpus.append((name, handle.read()))
+    return corpus
+
+
+# ----------------------------------------------------
+# RUN
+# ----------------------------------------------------
+
+def time_per_file(extract, files: list[bytes]) -> float:
+    """Median seconds per file over ROUNDS passes."""
+    samples = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        for data in files:
+            extract(data)
+        samples.append((time.perf_counter() - started) / len(files))
+    return statistics.median(samples)
+
+
+def main() -> int:
+    corpus = load_corpus(sys.argv[1] if len(sys.argv) > 1 else None)
+    if not corpus:
+        print("No .docx or .pptx files found")
+        return 1
+
+    extractors = {
+        ".docx": (legacy_docx, extract_text_from_docx),
+        ".pptx": (legacy_pptx, extract_text_from_pptx),
+    }
+
+    for ext, (legacy, direct) in extractors.items():
+        files = [data for name, data in corpus if name.lower().endswith(ext)]
+        if not files:
+            continue
+
+        before = time_per_file(legacy, files)
+        after = time_per_file(direct, files)
+        print(
+            f"{ext}: {len(files):3d} files | render-to-PDF {before * 1000:7.2f} ms/file"
+            f" | direct {after * 1000:7.2f} ms/file | {before / after:5.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
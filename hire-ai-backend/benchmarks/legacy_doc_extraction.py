@@ -0,0 +1,170 @@
+"""
+Legacy .doc text extraction: piece-table reader vs byte-scanning heuristic.
+
+The heuristic decodes the whole file three times and regex-filters the
+result; the OLE2 reader walks the compound file to the WordDocument
+stream and decodes only the pieces listed in its piece table. Reports
+per-file time, throughput and how much text each hands to the LLM.
+
+    python -m benchmarks.legacy_doc_extraction [corpus_dir]
+
+Without a corpus directory, Word 97 files of increasing size are
+synthesised (a minimal compound file with a single-piece table).
+"""
+import os
+import sys
+import math
+import time
+import struct
+import statistics
+
+from app.services.legacy_doc import extract_text_from_word97
+from app.services.resume_assist import extract_text_from_doc_heuristic
+
+ROUNDS = 5
+SYNTHETIC_PARAGRAPHS = (20, 200, 2000)
+
+SECTOR = 512
+FREE, END_OF_CHAIN, FAT_SECTOR = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD
+
+
+# ----------------------------------------------------
+# SYNTHETIC WORD 97 FILES
+# ----------------------------------------------------
+
+def _dir_entry(name: str, entry_type: int, start: int, size: int, child: int = FREE, right: int = FREE) -> bytes:
+    encoded = (name + "\0").encode("utf-16le")
+    return (
+        encoded.ljust(64, b"\0")
+        + struct.pack("<HBB", len(encoded), entry_type, 1)
+        + struct.pack("<III", FREE, right, child)
+        + b"\0" * 36
+        + struct.pack("<IQ", start, size)
+    )
+
+
+def build_compound_file(streams: list[tuple[str, bytes]]) -> bytes:
+    """Version 3 compound file; streams are padded past the mini-stream cutoff."""
+    streams = [(name, data.ljust(max(len(data), 4096), b"\0")) for name, data in streams]
+    data_sectors = [math.ceil(len(data) / SECTOR) for _, data in streams]
+
+    fat_count = 1
+    while fat_count * (SECTOR // 4) < fat_count + 1 + sum(data_sectors):
+        fat_count += 1
+
+    fat = [FAT_SECTOR] * fat_count + [END_OF_CHAIN]
+    starts, sector = [], fat_count + 1
+    for count in data_sectors:
+        starts.append(sector)
+        fat += list(range(sector + 1, sector + count)) + [END_OF_CHAIN]
+        sector += count
+    fat += [FREE] * (fat_count * SECTOR // 4 - len(fat))
+
+    directory = _dir_entry("Root Entry", 5, END_OF_CHAIN, 0, child=1)
+    for i, ((name, data), start) in enumerate(zip(streams, starts), start=1):
+        right = i + 1 if i < len(streams) else FREE
+        directory += _dir_entry(name, 2, start, len(data), right=right)
+    directory = directory.ljust(SECTOR, b"\0")
+
+    difat = list(range(fat_count)) + [FREE] * (109 - fat_count)
+    header = (
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 16
+        + struct.pack("<HHHHH", 0x3E, 3, 0xFFFE, 9, 6) + b"\0" * 6
+        + struct.pack("<IIIIIIIII", 0, fat_count, fat_count, 0, 4096, END_OF_CHAIN, 0, END_OF_CHAIN, 0)
+        + struct.pack("<109I", *difat)
+    )
+
+    body = struct.pack(f"<{len(fat)}I", *fat) + directory
+    body += b"".join(data.ljust(count * SECTOR, b"\0") for (_, data), count in zip(streams, data_sectors))
+    return header + body
+
+
+def synthetic_doc(paragraphs: int) -> bytes:
+    text = "".join(
+        f"Role {i}: Senior Engineer at Company {i} (2015 - 2020). Built services in Python, Go and AWS.\r"
+        for i in range(paragraphs)
+    ).encode("cp1252")
+
+    # FIB: FibBase + 14 shorts + 22 longs + 93 fc/lcb pairs, text after it
+    csw, cslw, pairs = 14, 22, 93
+    rg_lw = [0] * cslw
+    rg_lw[3] = len(text)  # ccpText
+    rg_fc_lcb = [0] * (pairs * 2)
+
+    text_offset = 1024
+    clx = (
+        b"\x02" + struct.pack("<I", 8 + 8)
+        + struct.pack("<II", 0, len(text))
+        + struct.pack("<HIH", 0, (text_offset * 2) | 0x40000000, 0)
+    )
+    rg_fc_lcb[66:68] = [0, len(clx)]  # fcClx / lcbClx: Clx at the start of 1Table
+
+    fib = (
+        struct.pack("<HHHHHH", 0xA5EC, 0xC1, 0, 0, 0, 0x0200) + b"\0" * 20
+        + struct.pack("<H", csw) + b"\0" * (csw * 2)
+        + struct.pack("<H", cslw) + struct.pack(f"<{cslw}I", *rg_lw)
+        + struct.pack("<H", pairs) + struct.pack(f"<{pairs * 2}I", *rg_fc_lcb)
+    )
+    word_document = fib.ljust(text_offset, b"\0") + text
+    return build_compound_file([("WordDocument", word_document), ("1Table", clx)])
+
+
+def load_corpus(directory: str | None) -> list[tuple[str, bytes]]:
+    if not directory:
+        return [(f"synthetic_{n}.doc", synthetic_doc(n)) for n in SYNTHETIC_PARAGRAPHS]
+
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith(".doc"):
+            with open(os.path.join(directory, name), "rb") as handle:
+                corpus.append((name, handle.read()))
+    return corpus
+
+
+# ----------------------------------------------------
+# RUN
+# ----------------------------------------------------
+
+def time_call(extract, data: bytes) -> tuple[float, str]:
+    samples, text = [], ""
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        text = extract(data)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), text
+
+
+def main() -> int:
+    corpus = load_corpus(sys.argv[1] if len(sys.argv) > 1 else None)
+    if not corpus:
+        print("No .doc files found")
+        return 1
+
+    total_bytes = 0
+    totals = {"heuristic": 0.0, "piece table": 0.0}
+
+    for name, data in corpus:
+        heuristic_time, heuristic_text = time_call(extract_text_from_doc_heuristic, data)
+        try:
+            parsed_time, parsed_text = time_call(extract_text_from_word97, data)
+        except (ValueError, KeyError, struct.error) as exc:
+            print(f"{name:40s} {len(data) / 1024:8.1f} KiB | piece table unreadable ({exc}), heuristic only")
+            continue
+
+        total_bytes += len(data)
+        totals["heuristic"] += heuristic_time
+        totals["piece table"] += parsed_time
+        print(
+            f"{name:40s} {len(data) / 1024:8.1f} KiB"
+            f" | heuristic {heuristic_time * 1000:8.2f} ms {len(heuristic_text):7d} chars"
+            f" | piece table {parsed_time * 1000:7.2f} ms {len(parsed_text):7d} chars"
+        )
+
+    for label, seconds in totals.items():
+        if seconds:
+            print(f"{label:12s}: {total_bytes / seconds / 1024 / 1024:8.1f} MiB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
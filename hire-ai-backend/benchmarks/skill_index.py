@@ -0,0 +1,93 @@
+"""
+Skill queries against the in-process candidate skill index.
+
+Builds a synthetic pool (no database) and times AND / OR / NOT queries
+with and without facet counts, next to a Python scan over per-candidate
+skill sets, the way the frontend filters today.
+Exits non-zero if a query without facets is not sub-millisecond.
+
+    python -m benchmarks.skill_index
+"""
+import sys
+import time
+import random
+import uuid
+
+from app.db.models.candidate_status import CandidateStatus
+from app.services.skill_index import SkillIndex, _Snapshot, resolve_skills
+from app.services.skill_taxonomy import SKILLS
+
+CANDIDATES = 100_000
+SKILLS_PER_CANDIDATE = 10
+RECRUITERS = 50
+REPEAT = 200
+MAX_ALLOWED_MS = 1.0
+
+QUERIES = [
+    {"all_of": ["python", "aws"]},
+    {"all_of": ["java"], "any_of": ["k8s", "docker"], "none_of": ["scala"]},
+    {"any_of": ["react", "vue", "angular"], "none_of": ["jquery"]},
+]
+
+
+def build_pool():
+    rng = random.Random(7)
+    skill_ids = list(SKILLS)
+    recruiters = [str(uuid.uuid4()) for _ in range(RECRUITERS)]
+    profiles, links, sets = [], [], []
+    for _ in range(CANDIDATES):
+        profile_id = str(uuid.uuid4())
+        profiles.append((profile_id, rng.choice(recruiters), CandidateStatus.SOURCED))
+        held = rng.sample(skill_ids, SKILLS_PER_CANDIDATE)
+        links += [(profile_id, skill_id) for skill_id in held]
+        sets.append(set(held))
+    return profiles, links, sets
+
+
+def scan(sets, all_of=(), any_of=(), none_of=()):
+    required, optional, excluded = resolve_skills(all_of), resolve_skills(any_of), resolve_skills(none_of)
+    return [
+        i for i, held in enumerate(sets)
+        if all(s in held for s in required)
+        and (not optional or any(s in held for s in optional))
+        and not any(s in held for s in excluded)
+    ]
+
+
+def timed(fn, repeat=REPEAT):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def main() -> int:
+    profiles, links, sets = build_pool()
+
+    started = time.perf_counter()
+    index = SkillIndex(refresh_seconds=float("inf"))
+    index._snapshot = _Snapshot(profiles, links)
+    index._dirty = False
+    build_ms = (time.perf_counter() - started) * 1000
+    print(f"{CANDIDATES} candidates, {len(links)} skill rows, index built in {build_ms:.0f} ms")
+
+    worst = 0.0
+    for query in QUERIES:
+        bare_ms, found = timed(lambda: index.search(None, facet_limit=0, **query))
+        facet_ms, _ = timed(lambda: index.search(None, **query))
+        scan_ms, expected = timed(lambda: scan(sets, **query), repeat=3)
+        assert found["total"] == len(expected)
+        worst = max(worst, bare_ms)
+        print(
+            f"{str(query):70} hits {found['total']:6}  "
+            f"index {bare_ms:6.3f} ms  +facets {facet_ms:6.3f} ms  scan {scan_ms:8.1f} ms"
+        )
+
+    if worst > MAX_ALLOWED_MS:
+        print(f"FAIL: a skill query took more than {MAX_ALLOWED_MS:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Event-loop responsiveness during a candidate sourcing search.
+
+Runs the LLM extraction step against a mocked Groq endpoint with a fixed
+latency, once through the old sync call and once through the async one,
+while a heartbeat coroutine measures how late the loop wakes it up.
+Exits non-zero if the async path lets the loop lag.
+
+    python -m benchmarks.sourcing_event_loop
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+import httpx
+
+from app.services import source_candidate
+from app.services.llm import client as llm_client, llm_cache
+
+LLM_LATENCY = 1.0
+HEARTBEAT = 0.01
+MAX_ALLOWED_LAG = 0.1
+
+RESULTS = [{"title": "Jane Doe - Backend Engineer", "link": "https://linkedin.com/in/jane", "snippet": "Python"}]
+BODY = {"choices": [{"message": {"content": json.dumps([{"name": "Jane Doe"}])}}]}
+
+
+def sync_handler(request: httpx.Request) -> httpx.Response:
+    time.sleep(LLM_LATENCY)
+    return httpx.Response(200, json=BODY)
+
+
+async def async_handler(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(LLM_LATENCY)
+    return httpx.Response(200, json=BODY)
+
+
+async def measure(call) -> float:
+    """Run `call` alongside a heartbeat; return the worst wake-up lag."""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal worst
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT)
+            worst = max(worst, time.perf_counter() - started - HEARTBEAT)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(HEARTBEAT)
+    try:
+        await call()
+    finally:
+        done.set()
+        await beat
+    return worst
+
+
+async def main() -> int:
+    llm_client._sync_client = httpx.Client(transport=httpx.MockTransport(sync_handler))
+    llm_client._async_client = httpx.AsyncClient(transport=httpx.MockTransport(async_handler))
+
+    async def blocking():
+        source_candidate.parse_people_from_search(RESULTS)
+
+    async def non_blocking():
+        await source_candidate.aparse_people_from_search(RESULTS)
+
+    llm_cache.clear()
+    sync_lag = await measure(blocking)
+    llm_cache.clear()
+    async_lag = await measure(non_blocking)
+
+    print(f"sync  parse_people_from_search : max loop lag {sync_lag * 1000:8.1f} ms")
+    print(f"async aparse_people_from_search: max loop lag {async_lag * 1000:8.1f} ms")
+
+    if async_lag > MAX_ALLOWED_LAG:
+        print(f"FAIL: event loop lagged more than {MAX_ALLOWED_LAG * 1000:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Settings the app reads at import time; no real services are contacted
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("AWS_REGION", "us-east-1")
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("EXTRACTION_WORKERS", "0")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
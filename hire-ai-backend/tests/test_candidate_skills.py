@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.db.crud import CandidateSkillCRUD
+from app.db.models import CandidateProfile, CandidateSkill
+from app.services.skill_index import SkillIndex
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def add_profile(db: Session, skills: str) -> CandidateProfile:
+    profile = CandidateProfile(user_id="u1", recruiter_id="r1", skills=skills)
+    db.add(profile)
+    db.flush()
+    CandidateSkillCRUD.sync_profile_skills(profile)
+    db.commit()
+    return profile
+
+
+def test_sync_reads_lower_case_skill_lists(db):
+    lower = add_profile(db, "react, node, python")
+    single = add_profile(db, "react")
+    title = add_profile(db, "React, Node.js")
+
+    assert {link.skill_id for link in lower.skill_links} == {"react", "nodejs", "python"}
+    assert {link.skill_id for link in single.skill_links} == {"react"}
+
+    result = SkillIndex(refresh_seconds=0).search(db, all_of=["react"], limit=10)
+    assert sorted(result["ids"]) == sorted([lower.id, single.id, title.id])
+
+
+def test_resync_all_repairs_missing_rows_and_is_rerunnable(db):
+    profiles = [add_profile(db, "react, node") for _ in range(3)]
+    # Rows as an older taxonomy left them
+    db.query(CandidateSkill).delete()
+    db.commit()
+    db.expire_all()
+
+    assert CandidateSkillCRUD.resync_all(db, batch_size=2) == 3
+    assert CandidateSkillCRUD.resync_all(db, batch_size=2) == 0
+    for profile in profiles:
+        assert {link.skill_id for link in db.get(CandidateProfile, profile.id).skill_links} == {"react", "nodejs"}
@@ -0,0 +1,41 @@
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.extraction_pool import ExtractionPool
+
+
+def nap(filename: str, data: bytes) -> str:
+    """Extractor stand-in: sleeps for `data` seconds."""
+    time.sleep(float(data))
+    return filename
+
+
+@pytest.fixture
+def pool():
+    pool = ExtractionPool(workers=2, timeout=4, memory_mb=0)
+    yield pool
+    pool.shutdown()
+
+
+def test_timeout_restarts_pool_and_retries_the_other_file(pool):
+    async def run():
+        await pool.start()
+        workers = {process.pid for process in multiprocessing.active_children()}
+        stuck = asyncio.create_task(pool.extract("stuck.pdf", b"60", nap))
+        await asyncio.sleep(3)
+        # Still parsing when stuck.pdf times out and its pool is restarted
+        other = asyncio.create_task(pool.extract("other.pdf", b"1.5", nap))
+        with pytest.raises(HTTPException) as exc_info:
+            await stuck
+        return workers, exc_info.value.status_code, await other
+
+    workers, status_code, other = asyncio.run(run())
+
+    assert status_code == 504
+    assert other == "other.pdf"
+    # The old workers, the hung one included, were killed
+    assert not workers & {process.pid for process in multiprocessing.active_children()}
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1 import interview_sections_routes as routes
+from app.schemas.interview import FollowUpRequest, SectionAnswerRequest
+
+
+@pytest.fixture
+def db_threads(monkeypatch):
+    """Fake CRUD layer that records which thread each DB call ran on."""
+    threads = []
+    section = SimpleNamespace(id="s1", interview_id="i1", type="technical", is_follow_up=True, questions=["q1"])
+
+    def record(value):
+        def call(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return value
+        return call
+
+    interview = SimpleNamespace(
+        id="i1", job_id="j1", job_title="Engineer", candidate_id="c1", status=routes.InterviewStatus.ONGOING
+    )
+    monkeypatch.setattr(routes.InterviewCRUD, "get_interview_by_id", record(interview))
+    monkeypatch.setattr(routes.SectionCRUD, "get", record(section))
+    monkeypatch.setattr(routes.JobDescriptionCRUD, "get_job_by_id", record(SimpleNamespace(level="Senior", skills="Python")))
+    monkeypatch.setattr(routes.SectionCRUD, "save_answers", record(section))
+    monkeypatch.setattr(routes.SectionCRUD, "save_evaluation", record(section))
+    monkeypatch.setattr(routes, "validate_interview_time", lambda interview: None)
+    return threads, section
+
+
+def run_on_loop(coro):
+    async def run():
+        return threading.current_thread(), await coro
+    return asyncio.run(run())
+
+
+def test_evaluate_section_keeps_db_calls_off_the_event_loop(db_threads, monkeypatch):
+    threads, _ = db_threads
+
+    async def fake_evaluate(**kwargs):
+        assert kwargs["job_title"] == "Engineer" and kwargs["section_type"] == "technical"
+        return {"score": 7}
+
+    monkeypatch.setattr(routes, "aevaluate_section_answers", fake_evaluate)
+    payload = SectionAnswerRequest.model_validate({"qa": [{"question": "q1", "answer": "a1"}]})
+
+    loop_thread, result = run_on_loop(routes.evaluate_section("i1", "s1", payload, db=None, user=None))
+
+    assert result == {"score": 7}
+    # interview, section and job lookups, then section, answers and evaluation writes
+    assert len(threads) == 6 and loop_thread not in threads
+
+
+def test_follow_up_keeps_db_calls_off_the_event_loop(db_threads, monkeypatch):
+    threads, _ = db_threads
+
+    async def fake_follow_up(**kwargs):
+        return "Why?"
+
+    monkeypatch.setattr(routes, "agenerate_follow_up_question", fake_follow_up)
+    payload = FollowUpRequest(question="q1", answer="a1")
+
+    loop_thread, result = run_on_loop(
+        routes.generate_section_follow_up("i1", "s1", payload, db=None, current_user=None, user=None)
+    )
+
+    assert result == {"follow_up": "Why?"}
+    assert threads and loop_thread not in threads
+
+
+def test_follow_up_disabled_is_checked_before_the_job(db_threads):
+    threads, section = db_threads
+    section.is_follow_up = False
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(routes.generate_section_follow_up(
+            "i1", "s1", FollowUpRequest(question="q1", answer="a1"), db=None, current_user=None, user=None
+        ))
+    assert exc_info.value.status_code == 400
+    assert len(threads) == 2
+
+
+def test_stored_questions_are_read_off_the_event_loop(db_threads):
+    threads, _ = db_threads
+    user = SimpleNamespace(role="admin")
+
+    loop_thread, result = run_on_loop(
+        routes.get_section_questions("i1", "s1", db=None, current_user=SimpleNamespace(id="c1"), user=user)
+    )
+
+    assert result == {"type": "technical", "questions": ["q1"]}
+    assert threads and loop_thread not in threads
@@ -0,0 +1,140 @@
+import struct
+
+import pytest
+
+from app.services.legacy_doc import CompoundFile, _piece_table, extract_text_from_word97
+
+SECTOR = 512
+FREE, END_OF_CHAIN, FAT_SECTOR = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD
+FIB_SIZE = 0x26 + 34 * 8
+TEXT_OFFSET = 512
+
+# What resume_assist treats as "not a readable .doc"
+UNREADABLE = (ValueError, KeyError, struct.error)
+
+
+def compound_file(streams: dict, difat: tuple = (END_OF_CHAIN, 0)) -> bytes:
+    """
+    Version 3 compound file: sector 0 is the FAT, sector 1 the directory,
+    then each stream in whole sectors. The mini cutoff is 0, so every
+    stream lives in the regular FAT.
+    """
+    sectors, fat = [], [FAT_SECTOR, END_OF_CHAIN]
+    entries = [("Root Entry", 5, END_OF_CHAIN, 0)]
+    next_sector = 2
+    for name, data in streams.items():
+        count = max(1, -(-len(data) // SECTOR))
+        entries.append((name, 2, next_sector, len(data)))
+        fat += list(range(next_sector + 1, next_sector + count)) + [END_OF_CHAIN]
+        sectors.append(data.ljust(count * SECTOR, b"\0"))
+        next_sector += count
+
+    directory = b""
+    for name, kind, start, size in entries:
+        encoded = (name + "\0").encode("utf-16le")
+        entry = bytearray(128)
+        entry[:len(encoded)] = encoded
+        struct.pack_into("<HB", entry, 0x40, len(encoded), kind)
+        struct.pack_into("<II", entry, 0x74, start, size)
+        directory += bytes(entry)
+
+    header = bytearray(SECTOR)
+    header[:8] = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+    struct.pack_into("<HH", header, 0x1E, 9, 6)
+    struct.pack_into("<II", header, 0x2C, 1, 1)
+    struct.pack_into("<III", header, 0x38, 0, END_OF_CHAIN, 0)
+    struct.pack_into("<II", header, 0x44, *difat)
+    struct.pack_into("<109I", header, 0x4C, 0, *[FREE] * 108)
+
+    fat_sector = struct.pack(f"<{SECTOR // 4}I", *(fat + [FREE] * (SECTOR // 4 - len(fat))))
+    return bytes(header) + fat_sector + directory.ljust(SECTOR, b"\0") + b"".join(sectors)
+
+
+def clx(pieces: list, prc: bytes = b"") -> bytes:
+    """Clx over compressed (cp1252) pieces given as (cp_start, cp_end, byte offset)."""
+    cps = [pieces[0][0]] + [end for _, end, _ in pieces]
+    pcds = b"".join(struct.pack("<HIH", 0, (offset * 2) | 0x40000000, 0) for _, _, offset in pieces)
+    plc = struct.pack(f"<{len(cps)}I", *cps) + pcds
+    return prc + b"\x02" + struct.pack("<I", len(plc)) + plc
+
+
+def word_document(text: str, prc: bytes = b"") -> bytes:
+    table = clx([(0, len(text), TEXT_OFFSET)], prc)
+    fib = bytearray(FIB_SIZE)
+    struct.pack_into("<H", fib, 0, 0xA5EC)
+    struct.pack_into("<H", fib, 0x0A, 0x0200)  # text is in 1Table
+    struct.pack_into("<HHH", fib, 0x20, 0, 0, 34)
+    struct.pack_into("<II", fib, 0x26 + 33 * 8, 0, len(table))
+    word = bytes(fib).ljust(TEXT_OFFSET, b"\0") + text.encode("cp1252")
+    return compound_file({"WordDocument": word, "1Table": table})
+
+
+# ---------------- valid ----------------
+
+def test_compound_file_reads_streams():
+    cfb = CompoundFile(compound_file({"Alpha": b"a" * 700, "Beta": b"b" * 10}))
+
+    assert cfb.stream_names() == ["Alpha", "Beta"]
+    assert cfb.read_stream("Alpha") == b"a" * 700
+    assert cfb.read_stream("Beta") == b"b" * 10
+    with pytest.raises(KeyError):
+        cfb.read_stream("Gamma")
+
+
+def test_piece_table_skips_property_modifiers():
+    prc = b"\x01" + struct.pack("<h", 4) + b"\0" * 4
+    pieces = _piece_table(clx([(0, 5, 600), (5, 9, 900)], prc), 0, 1000)
+
+    assert pieces == [(0, 5, 600, True), (5, 9, 900, True)]
+
+
+def test_word97_text_round_trip():
+    data = word_document("Jane Doe\rPython\x07Go\r")
+
+    assert extract_text_from_word97(data) == "Jane Doe\nPython\tGo"
+
+
+# ---------------- truncated ----------------
+
+@pytest.mark.parametrize("length", [100, 700, 1100, 1600])
+def test_truncated_files_are_rejected(length):
+    data = word_document("Jane Doe\r")
+
+    with pytest.raises(UNREADABLE):
+        extract_text_from_word97(data[:length])
+
+
+def test_truncated_piece_table_is_rejected():
+    table = clx([(0, 5, 600)])
+
+    with pytest.raises(UNREADABLE):
+        _piece_table(table, 0, len(table) - 6)
+
+
+# ---------------- malicious ----------------
+
+def test_negative_property_modifier_size_is_rejected():
+    # cbGrpprl = -3 used to leave pos where it was: an endless loop
+    prc = b"\x01" + struct.pack("<h", -3)
+
+    with pytest.raises(ValueError):
+        _piece_table(clx([(0, 5, 600)], prc), 0, 1000)
+    with pytest.raises(ValueError):
+        extract_text_from_word97(word_document("Jane Doe\r", prc))
+
+
+def test_difat_chain_is_capped_by_file_size():
+    # A DIFAT sector that points at itself, with a header count of 2**32 - 1
+    data = bytearray(compound_file({"Alpha": b"a" * 10}, difat=(2, FREE)))
+    struct.pack_into("<I", data, SECTOR * 3 + SECTOR - 4, 2)
+
+    with pytest.raises(ValueError):
+        CompoundFile(bytes(data))
+
+
+def test_unsupported_sector_size_is_rejected():
+    data = bytearray(compound_file({"Alpha": b"a"}))
+    struct.pack_into("<H", data, 0x1E, 0xFFFF)
+
+    with pytest.raises(ValueError):
+        CompoundFile(bytes(data))
@@ -0,0 +1,46 @@
+import sqlite3
+import time
+
+import pytest
+
+from app.services.llm import cache as cache_module
+from app.services.llm.cache import LLMResponseCache
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "DB_TIMEOUT_SECONDS", 0.05)
+    return str(tmp_path / "llm_cache.db")
+
+
+def test_entries_are_shared_through_the_file(db_path):
+    LLMResponseCache(db_path=db_path).set("k", "v", feature="resume_parse")
+
+    assert LLMResponseCache(db_path=db_path).get("k", feature="resume_parse") == "v"
+
+
+def test_locked_file_does_not_fail_set(db_path):
+    cache = LLMResponseCache(db_path=db_path)
+    other = sqlite3.connect(db_path)
+    other.execute("BEGIN IMMEDIATE")  # another worker holds the write lock
+
+    started = time.monotonic()
+    cache.set("k", "v")
+
+    assert time.monotonic() - started < 1
+    assert cache.get("k") == "v"  # still served from memory
+    other.rollback()
+    # The connection is usable again once the lock is gone
+    cache.set("k2", "v2")
+    assert LLMResponseCache(db_path=db_path).get("k2") == "v2"
+
+
+def test_broken_file_is_a_miss(db_path):
+    cache = LLMResponseCache(db_path=db_path)
+    other = sqlite3.connect(db_path)
+    other.execute("DROP TABLE llm_cache")
+    other.commit()
+
+    assert cache.get("missing") is None
+    cache.set("k", "v")
+    assert cache.stats()["features"]["default"] == {"hits": 0, "misses": 1}
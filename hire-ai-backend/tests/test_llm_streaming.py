@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.api.v1 import jobs_routes
+from app.schemas.candidate_profile import PromptRequest
+from app.schemas.job import JobDescriptionCreate
+from app.services import ask_ai
+from app.services.job_generator import job_generator
+from app.services.llm import client as llm_client
+from app.services.llm.json_stream import TopLevelJSONStream
+from app.services.llm.rate_limit import RateLimiter, fcntl
+
+
+def sse(*chunks) -> bytes:
+    lines = [f"data: {json.dumps(chunk)}\n\n" for chunk in chunks]
+    return ("".join(lines) + "data: [DONE]\n\n").encode()
+
+
+class ChunkedBody(httpx.AsyncByteStream):
+    """Body delivered like a real network stream, so the response starts unread."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    async def __aiter__(self):
+        for start in range(0, len(self.data), 16):
+            yield self.data[start:start + 16]
+
+
+def streamed(status_code: int, body: bytes, **headers) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers, stream=ChunkedBody(body))
+
+
+def delta(text: str) -> dict:
+    return {"choices": [{"delta": {"content": text}}]}
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = RateLimiter()
+    monkeypatch.setattr(llm_client, "rate_limiter", limiter)
+    return limiter
+
+
+def use_transport(monkeypatch, handler):
+    monkeypatch.setattr(llm_client, "_async_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def collect(stream) -> list:
+    async def run():
+        return [item async for item in stream]
+    return asyncio.run(run())
+
+
+def test_stream_200_yields_deltas_and_records_usage(monkeypatch, limiter):
+    body = sse(
+        delta("Hello"),
+        delta(", world"),
+        {"choices": [{"delta": {}}], "x_groq": {"usage": {"total_tokens": 42}}},
+    )
+    use_transport(monkeypatch, lambda request: streamed(
+        200, body, **{"x-ratelimit-remaining-tokens": "9000", "content-type": "text/event-stream"}
+    ))
+
+    deltas = collect(llm_client.astream_chat_completion([{"role": "user", "content": "hi"}], max_tokens=100))
+
+    assert deltas == ["Hello", ", world"]
+    bucket = limiter._state[llm_client.DEFAULT_MODEL]
+    # Header clamp to 9000, then the unused part of the estimate is handed back
+    assert bucket["tokens"] > 9000
+
+
+def test_stream_error_status_raises_http_exception(monkeypatch, limiter):
+    use_transport(monkeypatch, lambda request: streamed(503, b"unavailable"))
+
+    with pytest.raises(Exception) as exc_info:
+        collect(llm_client.astream_chat_completion([{"role": "user", "content": "hi"}]))
+    assert getattr(exc_info.value, "status_code", None) == 503
+
+
+def test_stream_ask_ai_sends_done_event(monkeypatch, limiter):
+    use_transport(monkeypatch, lambda request: streamed(200, sse(delta("ok"))))
+
+    events = collect(ask_ai.stream_ask_ai(PromptRequest(prompt="hi")))
+
+    assert events[0] == f"data: {json.dumps({'delta': 'ok'})}\n\n"
+    assert events[-1].startswith("event: done")
+
+
+def test_stream_ask_ai_sends_error_event_on_unexpected_failure(monkeypatch, limiter):
+    use_transport(monkeypatch, lambda request: streamed(200, b"data: {not json}\n\n"))
+
+    events = collect(ask_ai.stream_ask_ai(PromptRequest(prompt="hi")))
+
+    assert events[-1].startswith("event: error")
+    assert json.loads(events[-1].split("data: ", 1)[1])["status_code"] == 500
+
+
+def job_request() -> JobDescriptionCreate:
+    return JobDescriptionCreate(job_title="Backend Engineer", company_name="Acme", skills="Python")
+
+
+def test_stream_job_description_yields_sections(monkeypatch, limiter):
+    document = json.dumps({"about_the_role": "Build APIs.", "required_skills": ["Python"]})
+    use_transport(monkeypatch, lambda request: streamed(200, sse(*(delta(document[i:i + 7]) for i in range(0, len(document), 7)))))
+
+    stream = TopLevelJSONStream()
+    sections = collect(job_generator.stream_job_description(job_request(), stream))
+
+    assert sections == [("about_the_role", "Build APIs."), ("required_skills", ["Python"])]
+    assert stream.result() == json.loads(document)
+
+
+def test_create_job_stream_sends_error_event_on_unexpected_failure(monkeypatch, limiter):
+    use_transport(monkeypatch, lambda request: streamed(200, b"data: {not json}\n\n"))
+
+    async def run():
+        response = await jobs_routes.create_job_stream(job_request(), current_user=SimpleNamespace(id="u1"), user=None)
+        return [chunk async for chunk in response.body_iterator]
+    events = asyncio.run(run())
+
+    assert len(events) == 1 and events[0].startswith("event: error")
+    assert json.loads(events[0].split("data: ", 1)[1])["status_code"] == 500
+
+
+@pytest.mark.skipif(fcntl is None, reason="file-backed limiter needs flock")
+def test_shared_limiter_state_is_not_locked_on_the_event_loop(monkeypatch, tmp_path):
+    limiter = RateLimiter(state_path=str(tmp_path / "limits.json"))
+    monkeypatch.setattr(llm_client, "rate_limiter", limiter)
+    use_transport(monkeypatch, lambda request: httpx.Response(
+        200, json={"choices": [{"message": {"content": "ok"}}], "usage": {"total_tokens": 5}}
+    ))
+
+    # Another worker holds the state file; a timer frees it if the loop hangs
+    holder = open(limiter.state_path, "a")
+    fcntl.flock(holder, fcntl.LOCK_EX)
+    release = threading.Timer(1.0, fcntl.flock, (holder, fcntl.LOCK_UN))
+    release.start()
+
+    async def run():
+        task = asyncio.create_task(llm_client.achat_completion([{"role": "user", "content": "hi"}]))
+        started = time.monotonic()
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        ticks = time.monotonic() - started
+        assert not task.done()
+        fcntl.flock(holder, fcntl.LOCK_UN)
+        return ticks, await asyncio.wait_for(task, 2)
+
+    try:
+        ticks, content = asyncio.run(run())
+    finally:
+        release.cancel()
+        holder.close()
+
+    assert content == "ok"
+    assert ticks < 0.5
@@ -0,0 +1,26 @@
+import asyncio
+import logging
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from app.services import match_store
+
+
+def test_failed_rescore_is_logged_with_job_and_file(monkeypatch, caplog):
+    stale = SimpleNamespace(resume_sha256="abc", filename="jane.pdf", resume_text="Jane Doe")
+    monkeypatch.setattr(match_store, "SessionLocal", nullcontext)
+    monkeypatch.setattr(match_store.JobDescriptionCRUD, "get_job_by_id", lambda db, job_id: object())
+    monkeypatch.setattr(match_store.JobDescriptionCRUD, "jd_to_dict", lambda job: {"job_title": "Engineer"})
+    monkeypatch.setattr(match_store.ResumeMatchCRUD, "get_stale", lambda db, job_id, revision: [stale])
+
+    async def failing_score(text, job):
+        raise RuntimeError("LLM down")
+
+    monkeypatch.setattr(match_store, "ascore_resume_text", failing_score)
+
+    with caplog.at_level(logging.WARNING, logger=match_store.__name__):
+        assert asyncio.run(match_store.rescore_stale_matches("job-1")) == 0
+
+    [record] = caplog.records
+    assert "jane.pdf" in record.getMessage() and "job-1" in record.getMessage()
+    assert record.exc_info[0] is RuntimeError
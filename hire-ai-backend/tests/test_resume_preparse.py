@@ -0,0 +1,42 @@
+import json
+
+from app.services.resume_parser import _reduce
+from app.services.resume_preparse import preparse_resume
+
+WITH_EXPERIENCE = """Jane Doe
+Experience
+Backend Engineer, Acme
+Jan 2020 - Dec 2021
+Education
+B.Sc. Computer Science
+2015 – 2019
+"""
+
+WITHOUT_EXPERIENCE = """Jane Doe
+Backend Engineer, Acme, Jan 2020 - Dec 2021
+Education
+2015 – 2019 B.Sc. Computer Science
+"""
+
+
+def test_education_ranges_are_not_work_experience():
+    ranges = preparse_resume(WITH_EXPERIENCE)["date_ranges"]
+
+    assert [(r["start_year"], r["end_year"]) for r in ranges] == [("2020", "2021")]
+
+
+def test_no_experience_section_gives_no_ranges():
+    assert preparse_resume(WITHOUT_EXPERIENCE)["date_ranges"] == []
+    assert preparse_resume("2015 - 2019 B.Sc. Physics")["date_ranges"] == []
+
+
+def test_years_come_from_experience_ranges_only():
+    llm = json.dumps({"total_years_experience": ""})
+
+    assert _reduce([llm], preparse_resume(WITH_EXPERIENCE))["total_years_experience"] == "2.0"
+
+
+def test_llm_years_stand_without_an_experience_section():
+    chunks = [json.dumps({"total_years_experience": "2"}), json.dumps({"total_years_experience": "1"})]
+
+    assert _reduce(chunks, preparse_resume(WITHOUT_EXPERIENCE))["total_years_experience"] == "2"
@@ -0,0 +1,164 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.api.v1 import interview_sections_routes as routes
+from app.db.base import Base
+from app.db.crud.interview_section import SectionCRUD
+from app.services.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def run():
+        flight = SingleFlight()
+        return await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["done"] * 5
+    assert len(calls) == 1
+
+
+def test_follower_takes_over_when_leader_is_cancelled():
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def run():
+        flight = SingleFlight()
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    # One follower re-runs the call, the others wait on it
+    assert asyncio.run(run()) == [2, 2, 2]
+    assert len(calls) == 2
+
+
+def test_cancelled_follower_leaves_leader_running():
+    async def work():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        flight = SingleFlight()
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        return await leader
+
+    assert asyncio.run(run()) == "done"
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # A file, so two sessions can act as two workers
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def section(db):
+    return SectionCRUD.create(db, interview_id="i1", type="technical", no_of_questions=2)
+
+
+PROMPT = {"job_title": "Engineer", "job_level": "Senior", "skills": "Python"}
+
+
+def claimed_at(engine, section_id):
+    with Session(engine) as other:
+        return SectionCRUD.get(other, section_id).questions_claimed_at
+
+
+def test_claim_holder_generates_without_a_transaction_open(engine, db, section, monkeypatch):
+    seen = {}
+
+    async def fake_generate(**kwargs):
+        seen["in_transaction"] = db.in_transaction()
+        seen["claimed"] = claimed_at(engine, section.id) is not None
+        seen["job_title"] = kwargs["job_title"]
+        return {"type": kwargs["section_type"], "questions": ["q1", "q2"]}
+
+    monkeypatch.setattr(routes, "agenerate_section_questions", fake_generate)
+
+    result = asyncio.run(routes._generate_questions(db, section.id, PROMPT))
+
+    assert seen == {"in_transaction": False, "claimed": True, "job_title": "Engineer"}
+    assert result == {"type": "technical", "questions": ["q1", "q2"]}
+    assert claimed_at(engine, section.id) is None
+
+
+def test_request_waits_for_questions_of_a_live_claim(engine, db, section, monkeypatch):
+    async def fake_generate(**kwargs):
+        raise AssertionError("a second generation was started")
+
+    monkeypatch.setattr(routes, "agenerate_section_questions", fake_generate)
+    monkeypatch.setattr(routes, "QUESTION_POLL_SECONDS", 0.01)
+
+    with Session(engine) as other:
+        # Another worker claims the section, then stores its questions
+        other_section = SectionCRUD.get(other, section.id)
+        other_section.questions_claimed_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        other.commit()
+
+        async def run():
+            waiter = asyncio.create_task(routes._generate_questions(db, section.id, PROMPT))
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            await asyncio.to_thread(SectionCRUD.save_questions_if_empty, other, section.id, ["theirs"])
+            return await asyncio.wait_for(waiter, 1)
+
+        result = asyncio.run(run())
+
+    assert result == {"type": "technical", "questions": ["theirs"]}
+
+
+def test_stale_claim_is_taken_over(engine, db, section, monkeypatch):
+    async def fake_generate(**kwargs):
+        return {"type": kwargs["section_type"], "questions": ["ours"]}
+
+    monkeypatch.setattr(routes, "agenerate_section_questions", fake_generate)
+    section.questions_claimed_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1)
+    db.commit()
+
+    result = asyncio.run(routes._generate_questions(db, section.id, PROMPT))
+
+    assert result == {"type": "technical", "questions": ["ours"]}
+
+
+def test_failed_generation_releases_the_claim(engine, db, section, monkeypatch):
+    async def fake_generate(**kwargs):
+        raise RuntimeError("LLM down")
+
+    monkeypatch.setattr(routes, "agenerate_section_questions", fake_generate)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(routes._generate_questions(db, section.id, PROMPT))
+    assert claimed_at(engine, section.id) is None
@@ -0,0 +1,95 @@
+import pytest
+
+from app.services.resume_prescore import prescore_resumes
+from app.services.skill_taxonomy import skill_taxonomy
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("skills: react, node, python. 5 years", ["react", "nodejs", "python"]),
+    ("Go; rust; spring", ["go", "rust", "spring"]),
+    ("Skills\nreact\nnode\n", ["react", "nodejs"]),
+    ("Built with React and Node", ["react", "nodejs"]),
+])
+def test_lower_case_aliases_match_as_list_items(text, expected):
+    assert skill_taxonomy.extract(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "I will go to the spring fair",
+    "Let's go, then",
+    "Happy to react quickly",
+])
+def test_lower_case_aliases_ignored_in_prose(text):
+    assert skill_taxonomy.extract(text) == []
+
+
+@pytest.mark.parametrize("text", ["Led R&D teams", "Reported to C-level executives", "C's pointer rules"])
+def test_single_letters_need_word_boundaries(text):
+    assert skill_taxonomy.extract(text) == []
+
+
+def test_single_letters_still_match_on_their_own():
+    assert skill_taxonomy.extract("C/C++ and R.") == ["c", "cpp", "r"]
+
+
+@pytest.mark.parametrize("name", ["react", "React", "node", "go", "spring"])
+def test_canonical_agrees_with_whole_list_extract(name):
+    skill_id = skill_taxonomy.canonical(name)
+    assert skill_id is not None
+    assert skill_taxonomy.extract(name, whole_list=True) == [skill_id]
+
+
+def test_prescore_ignores_skill_casing():
+    jd = {"skills": "React, Node.js, Python"}
+    lower, title = prescore_resumes(
+        ["skills: react, node, python. 5 years", "Skills: React, Node, Python. 5 years"], jd
+    )
+    assert lower["prescore"] == title["prescore"] == 100.0
+
+
+@pytest.mark.parametrize("text", [
+    "Able to express ideas clearly and spark innovation",
+    "I excel at teamwork",
+    "Excel at teamwork",
+    "Go to market strategy",
+    "Owned the go-to-market plan",
+    "github.com/jdoe",
+    "Wrote main.py",
+    "A rag doll",
+])
+def test_ordinary_words_and_urls_are_not_skills(text):
+    assert skill_taxonomy.extract(text) == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Skills: Go, Excel, Spark", ["go", "excel", "spark"]),
+    ("Built services in Go and Express.js", ["go", "express"]),
+    ("Pipelines on Apache Spark", ["spark"]),
+    ("Deployed on AWS EC2", ["aws", "ec2"]),
+])
+def test_word_like_skills_still_match_in_context(text, expected):
+    assert skill_taxonomy.extract(text) == expected
+
+
+def test_ordinary_words_do_not_match_required_skills():
+    text = "Able to express ideas. I excel at teamwork. github.com/jdoe"
+
+    assert skill_taxonomy.compare(["Express.js", "Excel", "Git"], text) == {
+        "Express.js": "missing", "Excel": "missing", "Git": "missing",
+    }
+
+
+@pytest.mark.parametrize("required, text", [
+    ("React", "Used Redux"),
+    ("Kubernetes", "Helm charts"),
+    ("Kubernetes", "Ran services on EKS"),
+    ("Git", "Hosted on GitHub"),
+    ("AWS", "Stored files in Amazon S3"),
+    ("CSS", "Styled with SCSS"),
+    ("Linux", "Ubuntu servers"),
+    ("Data Structures & Algorithms", "Strong algorithms background"),
+    ("LLMs", "Built a RAG pipeline"),
+    ("Excel", "Automated reports in VBA"),
+])
+def test_adjacent_technologies_are_partial_not_matched(required, text):
+    assert skill_taxonomy.compare([required], text) == {required: "partial"}